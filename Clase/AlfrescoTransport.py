@@ -0,0 +1,141 @@
+"""
+Stratul de transport spre Alfresco: pool de conexiuni, keep-alive, HTTP/2 opțional și timeout-uri pe operație
+"""
+import base64
+import importlib.util
+import sys
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import httpx
+
+# Prefixul API-ului REST public Alfresco
+CORE_API = "/alfresco/api/-default-/public/alfresco/versions/1"
+# Search API (necesită Alfresco Search Services / Solr)
+SEARCH_API = "/alfresco/api/-default-/public/search/versions/1/search"
+
+# Timeout-ul total (secunde) pe tip de operație; conectarea are propriul timeout
+DEFAULT_TIMEOUTS = {
+    "read": 8.0,        # metadate și listări
+    "write": 15.0,      # creare / mutare / copiere / actualizare / ștergere
+    "content": 60.0,    # descărcare de conținut (timeout între bucăți)
+    "upload": 300.0,    # upload de fișiere mari
+}
+
+
+def nodes_path(node_id: str, suffix: str = "") -> str:
+    """Calea REST a unui nod, ex: nodes_path("-root-", "children")"""
+    path = f"{CORE_API}/nodes/{node_id}"
+    return f"{path}/{suffix}" if suffix else path
+
+
+def parse_timeouts(spec: Optional[str]) -> Dict[str, float]:
+    """Parsează 'read=8,write=15' (ex: din ALFRESCO_TIMEOUTS) peste valorile implicite"""
+    timeouts = dict(DEFAULT_TIMEOUTS)
+    for part in (spec or "").split(","):
+        if "=" not in part:
+            continue
+        op, _, value = part.partition("=")
+        timeouts[op.strip()] = float(value)
+    return timeouts
+
+
+class AlfrescoTransport:
+    """Construiește clientul httpx și ține evidența cererilor în curs față de capacitatea pool-ului"""
+
+    def __init__(self, username: str, password: str, max_connections: int = 20,
+                 max_keepalive: int = 10, keepalive_expiry: float = 30.0, http2: bool = False,
+                 connect_timeout: float = 5.0, timeouts: Optional[Dict[str, float]] = None):
+        self.username = username
+        self.password = password
+        self.max_connections = max(1, max_connections)
+        self.max_keepalive = max(0, min(max_keepalive, self.max_connections))
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and self._http2_available()
+        self.connect_timeout = connect_timeout
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        # Cereri pornite când toate conexiunile pool-ului erau ocupate (au așteptat o conexiune)
+        self.waits = 0
+        self.per_operation: Dict[str, int] = {}
+
+    def create_client(self) -> httpx.AsyncClient:
+        auth_string = base64.b64encode(f'{self.username}:{self.password}'.encode()).decode()
+        return httpx.AsyncClient(
+            timeout=self.timeout("read"),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            http2=self.http2,
+            follow_redirects=True,
+            headers={
+                "Authorization": f"Basic {auth_string}",
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+        )
+
+    def timeout(self, op: str, total: Optional[float] = None) -> httpx.Timeout:
+        """Timeout-ul operației; `total` (ex: unul adaptiv) îl înlocuiește pe cel configurat"""
+        if total is None:
+            total = self.timeouts.get(op, self.timeouts["read"])
+        return httpx.Timeout(total, connect=self.connect_timeout)
+
+    @contextmanager
+    def track(self, op: str) -> Iterator[None]:
+        """Numără o cerere în curs; dacă pool-ul era plin, cererea e considerată în așteptare"""
+        self.requests += 1
+        self.per_operation[op] = self.per_operation.get(op, 0) + 1
+        if self.in_flight >= self.max_connections:
+            self.waits += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+
+    def stats(self, client: Any = None) -> Dict[str, Any]:
+        stats = {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive": self.max_keepalive,
+            "keepalive_expiry": self.keepalive_expiry,
+            "timeouts": dict(self.timeouts),
+            "requests": self.requests,
+            "per_operation": dict(self.per_operation),
+            "in_use": self.in_flight,
+            "peak_in_use": self.peak_in_flight,
+            "waits": self.waits,
+        }
+        stats.update(self._pool_connections(client))
+        return stats
+
+    @staticmethod
+    def _pool_connections(client: Any) -> Dict[str, Any]:
+        """Conexiunile deschise / inactive din pool-ul httpcore (dacă clientul este unul real)"""
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if not isinstance(connections, list):
+            return {}
+        return {
+            "connections": len(connections),
+            "idle": sum(1 for connection in connections if connection.is_idle()),
+            "http2_connections": sum(
+                1 for connection in connections if getattr(connection, "_connection", None).__class__.__name__ == "AsyncHTTP2Connection"
+            ),
+        }
+
+    @staticmethod
+    def _http2_available() -> bool:
+        if importlib.util.find_spec("h2") is None:
+            print("⚠️ HTTP/2 cerut, dar pachetul 'h2' nu este instalat (pip install httpx[http2]); folosesc HTTP/1.1",
+                  file=sys.stderr)
+            return False
+        return True
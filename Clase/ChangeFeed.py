@@ -0,0 +1,320 @@
+"""
+Fluxul de modificări al depozitului: ce s-a schimbat în Alfresco de la ultimul checkpoint,
+aplicat ca invalidări precise ale cache-urilor și indexurilor serverului
+"""
+import asyncio
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from Clase import JsonCodec
+from Clase.AlfrescoTransport import CORE_API, SEARCH_API
+from Clase.Projection import CHANGES
+from Clase.RateLimiter import background_job
+
+AUDIT_APPLICATIONS = f"{CORE_API}/audit-applications"
+DELETED_NODES = f"{CORE_API}/deleted-nodes"
+# Cel mai mare ID de intrare de audit (capătul superior al intervalului 'where')
+MAX_AUDIT_ID = 2 ** 63 - 1
+
+_NODE_REF = re.compile(r"workspace://SpacesStore/([0-9A-Za-z-]+)")
+
+# O modificare: {"id", "deleted", opțional "parentId", "name", "isFolder", "properties", "moved"}
+Change = Dict[str, Any]
+Send = Callable[..., Awaitable[Any]]
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """Data ISO 8601 a Alfresco ('2024-05-01T10:00:00.000+0000' sau '...Z') -> timestamp"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        try:
+            return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+        except ValueError:
+            return None
+
+
+def format_time(timestamp: float) -> str:
+    """Timestamp -> data ISO în UTC, cu milisecunde, cum o acceptă AFTS"""
+    moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.") + f"{moment.microsecond // 1000:03d}Z"
+
+
+class LocalChangeFeed:
+    """Flux în memorie, în locul Alfresco: modificările se înregistrează explicit (teste, integrare locală)"""
+
+    name = "local"
+
+    def __init__(self):
+        self._changes: List[Change] = []
+
+    def record(self, node_id: str, parent_id: Optional[str] = None, name: Optional[str] = None,
+               is_folder: bool = False, deleted: bool = False, properties: Optional[Dict[str, Any]] = None):
+        change: Change = {"id": node_id, "deleted": deleted}
+        if parent_id is not None:
+            change["parentId"] = parent_id
+        if name is not None:
+            change.update(name=name, isFolder=is_folder)
+        if properties is not None:
+            change["properties"] = properties
+        self._changes.append(change)
+
+    async def changes(self, checkpoint: Optional[str]) -> Tuple[List[Change], str]:
+        # Primul apel doar fixează punctul de pornire, ca la fluxurile Alfresco
+        if checkpoint is None:
+            return [], str(len(self._changes))
+        return self._changes[int(checkpoint):], str(len(self._changes))
+
+
+class SearchChangeFeed:
+    """Modificările din folderele urmărite, prin Search API: noduri cu cm:modified după checkpoint, ordonate
+    crescător, plus ștergerile din coș (deleted-nodes) arhivate după checkpoint.
+
+    Fereastra se suprapune `overlap` secunde peste checkpoint, ca un decalaj de ceas sau un commit
+    indexat cu întârziere să nu piardă modificări (aplicarea lor de două ori este inofensivă).
+    O rundă oprită la `max_changes` lasă checkpoint-ul 'început#skipCount': runda următoare continuă
+    aceeași fereastră de unde a rămas, altfel un val de modificări cu același cm:modified (ex: un import
+    masiv) ar reciti mereu aceleași prime `max_changes` noduri.
+    Ștergerile permanente nu trec prin coș; pentru ele rămâne TTL-ul cache-ului.
+    """
+
+    name = "search"
+
+    def __init__(self, send: Send, folders: Iterable[str] = (), page_size: int = 100, max_changes: int = 1000,
+                 overlap: float = 5.0, clock: Callable[[], float] = time.time):
+        self.send = send
+        self.folders = [folder for folder in folders if folder]
+        self.page_size = page_size
+        self.max_changes = max_changes
+        self.overlap = overlap
+        self.clock = clock
+
+    def query(self, since: float) -> str:
+        query = f'TYPE:"cm:cmobject" AND cm:modified:["{format_time(since)}" TO MAX]'
+        if self.folders:
+            ancestors = " OR ".join(f'ANCESTOR:"workspace://SpacesStore/{folder}"' for folder in self.folders)
+            query += f" AND ({ancestors})"
+        return query
+
+    async def changes(self, checkpoint: Optional[str]) -> Tuple[List[Change], str]:
+        if checkpoint is None:
+            return [], format_time(self.clock())
+        start, _, skip = checkpoint.partition("#")
+        if skip:
+            # Continuarea unei runde trunchiate: aceeași fereastră, fără o nouă suprapunere
+            since = parse_time(start) or self.clock()
+            skip_count = int(skip)
+        else:
+            since = (parse_time(start) or self.clock()) - self.overlap
+            skip_count = 0
+        latest = parse_time(start) or since
+
+        changes: List[Change] = []
+        truncated = False
+        while not truncated:
+            body = {
+                "query": {"query": self.query(since), "language": "afts"},
+                "paging": {"maxItems": self.page_size, "skipCount": skip_count},
+                "sort": [{"type": "FIELD", "field": "cm:modified", "ascending": True}],
+                "fields": list(CHANGES.fields),
+                "include": list(CHANGES.include)
+            }
+            response = await self.send("POST", SEARCH_API, "read", json=body)
+            response.raise_for_status()
+            page = JsonCodec.parse_response(response).get("list", {})
+            for wrapper in page.get("entries", []):
+                entry = CHANGES.apply(wrapper.get("entry", {}))
+                changes.append(dict(entry, deleted=False))
+                latest = max(latest, parse_time(entry.get("modifiedAt")) or latest)
+            if not page.get("pagination", {}).get("hasMoreItems"):
+                break
+            skip_count += len(page.get("entries", [])) or self.page_size
+            truncated = len(changes) >= self.max_changes
+
+        deleted, latest_deleted = await self._deleted_since(since)
+        changes.extend(deleted)
+        if truncated:
+            # Restul modificărilor vine la runda următoare, din aceeași fereastră
+            return changes, f"{format_time(since)}#{skip_count}"
+        return changes, format_time(max(latest, latest_deleted or latest))
+
+    async def _deleted_since(self, since: float) -> Tuple[List[Change], Optional[float]]:
+        """Nodurile din coș arhivate după `since` (coșul se listează de la cele mai recente)"""
+        deleted: List[Change] = []
+        latest: Optional[float] = None
+        skip_count = 0
+        while len(deleted) < self.max_changes:
+            response = await self.send("GET", DELETED_NODES, "read",
+                                       params={"maxItems": self.page_size, "skipCount": skip_count})
+            response.raise_for_status()
+            page = JsonCodec.parse_response(response).get("list", {})
+            entries = page.get("entries", [])
+            for wrapper in entries:
+                entry = wrapper.get("entry", {})
+                archived_at = parse_time(entry.get("archivedAt"))
+                if archived_at is None or archived_at < since:
+                    return deleted, latest
+                latest = max(latest or archived_at, archived_at)
+                deleted.append({"id": entry.get("id"), "parentId": entry.get("parentId"), "deleted": True})
+            if not entries or not page.get("pagination", {}).get("hasMoreItems"):
+                break
+            skip_count += len(entries)
+        return deleted, latest
+
+
+class AuditChangeFeed:
+    """Modificările din aplicația de audit Alfresco (implicit 'alfresco-access', dacă e activată):
+    intrările cu ID mai mare decât checkpoint-ul, în ordinea creării.
+
+    Intrările de audit poartă doar nodeRef-ul și acțiunea; părintele și numele le află serverul la aplicare.
+    """
+
+    name = "audit"
+
+    def __init__(self, send: Send, application: str = "alfresco-access", page_size: int = 100,
+                 max_changes: int = 1000):
+        self.send = send
+        self.application = application
+        self.page_size = page_size
+        self.max_changes = max_changes
+
+    @property
+    def entries_path(self) -> str:
+        return f"{AUDIT_APPLICATIONS}/{self.application}/audit-entries"
+
+    async def changes(self, checkpoint: Optional[str]) -> Tuple[List[Change], str]:
+        if checkpoint is None:
+            # Punctul de pornire: ultima intrare existentă
+            response = await self.send("GET", self.entries_path, "read",
+                                       params={"orderBy": "createdAt DESC", "maxItems": 1})
+            response.raise_for_status()
+            entries = JsonCodec.parse_response(response).get("list", {}).get("entries", [])
+            return [], str(entries[0]["entry"]["id"]) if entries else "0"
+
+        last_id = int(checkpoint)
+        changes: List[Change] = []
+        skip_count = 0
+        while len(changes) < self.max_changes:
+            response = await self.send("GET", self.entries_path, "read", params={
+                "where": f"(id BETWEEN ('{last_id + 1}', '{MAX_AUDIT_ID}'))",
+                "orderBy": "createdAt ASC",
+                "include": "values",
+                "maxItems": self.page_size,
+                "skipCount": skip_count
+            })
+            response.raise_for_status()
+            page = JsonCodec.parse_response(response).get("list", {})
+            entries = page.get("entries", [])
+            for wrapper in entries:
+                entry = wrapper.get("entry", {})
+                checkpoint = str(max(int(checkpoint), int(entry.get("id", 0))))
+                change = self.parse_entry(entry.get("values") or {})
+                if change is not None:
+                    changes.append(change)
+            if not entries or not page.get("pagination", {}).get("hasMoreItems"):
+                break
+            skip_count += len(entries)
+        return changes, checkpoint
+
+    @staticmethod
+    def parse_entry(values: Dict[str, Any]) -> Optional[Change]:
+        """Valorile unei intrări de audit -> modificare; intrările fără nod (ex: login) se ignoră"""
+        node_id = None
+        action = ""
+        for key, value in values.items():
+            if key.endswith("/action"):
+                action = str(value).upper()
+                continue
+            match = _NODE_REF.search(value) if isinstance(value, str) else None
+            # Nodul tranzacției are prioritate față de alte referințe (ex: sursa unei copieri)
+            if match and (node_id is None or key.endswith("/transaction/node")):
+                node_id = match.group(1)
+        if node_id is None or action in ("READ", ""):
+            return None
+        return {"id": node_id, "deleted": action == "DELETE", "moved": action == "MOVE"}
+
+
+class ChangeFeedPoller:
+    """Cere periodic fluxului modificările de la ultimul checkpoint și le aplică, în ordine.
+
+    Modificările aceluiași nod dintr-o rundă se comasează (contează doar ultima). Checkpoint-ul
+    avansează doar după ce toate modificările rundei au fost aplicate, deci o rundă eșuată se reia.
+    """
+
+    def __init__(self, feed: Any, apply: Callable[[Change], Awaitable[None]], interval: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.feed = feed
+        self.apply = apply
+        self.interval = interval
+        self.clock = clock
+        self.checkpoint: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.polls = 0
+        self.applied = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.last_poll: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    async def poll(self) -> int:
+        """O rundă: aduce modificările, le aplică și avansează checkpoint-ul; întoarce câte s-au aplicat"""
+        changes, checkpoint = await self.feed.changes(self.checkpoint)
+        latest: Dict[str, Change] = {}
+        for change in changes:
+            if change.get("id"):
+                latest.pop(change["id"], None)
+                latest[change["id"]] = change
+        self.coalesced += len(changes) - len(latest)
+
+        for change in latest.values():
+            await self.apply(change)
+            self.applied += 1
+        self.checkpoint = checkpoint
+        self.polls += 1
+        self.last_poll = self.clock()
+        return len(latest)
+
+    def start(self) -> asyncio.Task:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @background_job
+    async def _run(self):
+        while True:
+            try:
+                await self.poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self.last_error = str(e) or e.__class__.__name__
+                print(f"⚠️ Fluxul de modificări ({self.feed.name}) a eșuat: {self.last_error}", file=sys.stderr)
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "feed": self.feed.name,
+            "checkpoint": self.checkpoint,
+            "interval": self.interval,
+            "polls": self.polls,
+            "applied": self.applied,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "seconds_since_poll": round(self.clock() - self.last_poll, 1) if self.last_poll is not None else None
+        }
@@ -0,0 +1,133 @@
+"""
+Limitare adaptivă a cererilor simultane spre Alfresco (AIMD după latență)
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Optional
+
+import httpx
+
+
+class AdaptiveConcurrencyLimiter:
+    """Câte cereri pot fi simultan în curs; limita se ajustează după latența măsurată (AIMD).
+
+    Latența de bază este cea mai mică latență recentă (urcă doar lent, ca să urmărească schimbări reale).
+    Cât timp răspunsurile vin sub `tolerance` × bază și limita este folosită, limita crește cu ~1 pe
+    „fereastră" (+1/limită per răspuns); când latența se umflă sau o cerere eșuează în rețea, limita scade
+    multiplicativ cu `backoff`, cel mult o dată pe durata unui round-trip.
+    """
+
+    def __init__(self, initial: int = 10, min_limit: int = 1, max_limit: int = 20, tolerance: float = 2.0,
+                 backoff: float = 0.9, baseline_drift: float = 0.01, clock: Callable[[], float] = time.monotonic):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.baseline_drift = baseline_drift
+        self.clock = clock
+
+        self.in_flight = 0
+        self.baseline: Optional[float] = None
+        self.last_rtt: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        self.increases = 0
+        self.decreases = 0
+        self.drops = 0
+        self.queued = 0
+        self.peak_queue = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Ocupă un loc pe durata cererii și raportează latența (sau eșecul de rețea) la final"""
+        await self.acquire()
+        started = self.clock()
+        utilized = self.in_flight >= self.limit / 2
+        try:
+            yield
+        except httpx.TransportError:
+            self.drop()
+            raise
+        finally:
+            self.release()
+        self.observe(self.clock() - started, utilized)
+
+    def available(self) -> bool:
+        return not self._waiters and self.in_flight < int(self.limit)
+
+    async def acquire(self):
+        if self.available():
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.queued += 1
+        self.peak_queue = max(self.peak_queue, len(self._waiters))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Locul fusese deja acordat: îl cedăm următorului
+                self.release()
+            else:
+                self._waiters.remove(future)
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def observe(self, rtt: float, utilized: bool = True):
+        """Ajustează limita după latența unei cereri reușite"""
+        self.last_rtt = rtt
+        if self.baseline is None or rtt < self.baseline:
+            self.baseline = rtt
+        else:
+            self.baseline += (rtt - self.baseline) * self.baseline_drift
+
+        if rtt > self.tolerance * self.baseline:
+            self._decrease(rtt)
+        elif utilized and self.limit < self.max_limit:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.increases += 1
+            self._wake()
+
+    def drop(self):
+        """O cerere a eșuat în rețea (timeout, conexiune refuzată): semn de suprasarcină"""
+        self.drops += 1
+        self._decrease(self.last_rtt or 0.0)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "peak_queue_depth": self.peak_queue,
+            "queued": self.queued,
+            "baseline_ms": round(self.baseline * 1000, 2) if self.baseline is not None else None,
+            "last_rtt_ms": round(self.last_rtt * 1000, 2) if self.last_rtt is not None else None,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "drops": self.drops
+        }
+
+    def _decrease(self, rtt: float):
+        now = self.clock()
+        if now - self._last_decrease < rtt:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+        self.decreases += 1
+
+    def _wake(self):
+        while self._waiters and self.in_flight < int(self.limit):
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+            self.in_flight += 1
+            future.set_result(None)
+
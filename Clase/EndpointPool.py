@@ -0,0 +1,134 @@
+"""
+Mai multe noduri Alfresco din același cluster: verificări de sănătate și alegerea nodului pentru fiecare cerere
+"""
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+from Clase.AlfrescoTransport import CORE_API
+
+# Sonda de disponibilitate a Alfresco (nu cere autentificare)
+READY_PROBE = f"{CORE_API}/probes/-ready-"
+
+
+class Endpoint:
+    """Un nod Alfresco: URL-ul de bază, cererile în curs și starea de sănătate"""
+
+    def __init__(self, url: str):
+        self.url = url.rstrip("/")
+        self.healthy = True
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_check: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "last_error": self.last_error
+        }
+
+
+class EndpointPool:
+    """Citirile merg la nodul sănătos cu cele mai puține cereri în curs; scrierile la nodul preferat.
+
+    Nodul preferat este primul sănătos în ordinea configurată (primul URL, dacă e disponibil).
+    Un nod este scos din rotație la o eroare de rețea sau la o sondă eșuată și reintră la prima sondă
+    reușită. Dacă niciun nod nu pare sănătos, se încearcă totuși toate (mai bine decât un refuz sigur).
+    """
+
+    def __init__(self, urls: List[str], check_interval: float = 10.0, clock: Callable[[], float] = time.monotonic):
+        if not urls:
+            raise ValueError("Este necesar cel puțin un URL Alfresco")
+        self.endpoints = [Endpoint(url) for url in dict.fromkeys(url.rstrip("/") for url in urls)]
+        self.check_interval = check_interval
+        self.clock = clock
+        self._task: Optional[asyncio.Task] = None
+        self._next = 0
+
+    @property
+    def preferred(self) -> Endpoint:
+        return self.endpoints[0]
+
+    def pick(self, write: bool = False) -> Endpoint:
+        candidates = [endpoint for endpoint in self.endpoints if endpoint.healthy] or self.endpoints
+        if write:
+            return candidates[0]
+        # Least-outstanding; la egalitate, prin rotație, ca nodurile inactive să primească și ele cereri
+        self._next = (self._next + 1) % len(candidates)
+        rotated = candidates[self._next:] + candidates[:self._next]
+        return min(rotated, key=lambda endpoint: endpoint.outstanding)
+
+    @contextmanager
+    def track(self, endpoint: Endpoint) -> Iterator[None]:
+        endpoint.requests += 1
+        endpoint.outstanding += 1
+        try:
+            yield
+        finally:
+            endpoint.outstanding -= 1
+
+    def mark_down(self, endpoint: Endpoint, error: str):
+        if endpoint.healthy and len(self.endpoints) > 1:
+            print(f"⚠️ Nodul Alfresco {endpoint.url} scos din rotație: {error}", file=sys.stderr)
+        endpoint.healthy = False
+        endpoint.failures += 1
+        endpoint.last_error = error
+
+    def mark_up(self, endpoint: Endpoint):
+        if not endpoint.healthy:
+            print(f"✅ Nodul Alfresco {endpoint.url} a revenit în rotație", file=sys.stderr)
+        endpoint.healthy = True
+        endpoint.last_error = None
+
+    # --- Verificări de sănătate în fundal ---
+
+    def start(self, probe: Callable[[str], Awaitable[Any]]) -> asyncio.Task:
+        """Pornește verificările periodice; `probe(url)` întoarce răspunsul sondei pentru un URL complet"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(probe))
+        return self._task
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def check(self, probe: Callable[[str], Awaitable[Any]]):
+        """Sondează toate nodurile în paralel"""
+        async def check_one(endpoint: Endpoint):
+            endpoint.last_check = self.clock()
+            try:
+                response = await probe(endpoint.url + READY_PROBE)
+            except Exception as e:
+                self.mark_down(endpoint, str(e) or e.__class__.__name__)
+                return
+            status = getattr(response, "status_code", 200)
+            if isinstance(status, int) and status >= 400:
+                self.mark_down(endpoint, f"sonda a răspuns HTTP {status}")
+            else:
+                self.mark_up(endpoint)
+
+        await asyncio.gather(*(check_one(endpoint) for endpoint in self.endpoints))
+
+    async def _run(self, probe: Callable[[str], Awaitable[Any]]):
+        while True:
+            await self.check(probe)
+            await asyncio.sleep(self.check_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "preferred": self.preferred.url,
+            "healthy": sum(1 for endpoint in self.endpoints if endpoint.healthy),
+            "endpoints": [endpoint.stats() for endpoint in self.endpoints]
+        }
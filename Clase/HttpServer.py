@@ -11,6 +11,8 @@ from datetime import datetime
 import mcp.types as types
 
 from Clase.MinimalAlfrescoServer import MinimalAlfrescoServer
+from Clase.JsonCodec import CodecJSONResponse
+from Clase.Resilience import CircuitOpenError
 
 class MCPRequest(BaseModel):
     jsonrpc: str = "2.0"
@@ -30,16 +32,19 @@ class MCPNotification(BaseModel):
     params: Optional[Dict[str, Any]] = None
 
 class HTTPAlfrescoMCPServer:
-    def __init__(self, base_url: str, username: str, password: str, port: int = 8002):
+    def __init__(self, base_url: str, username: str, password: str, port: int = 8002,
+                 alfresco_options: Optional[Dict[str, Any]] = None):
         self.base_url = base_url
         self.username = username
         self.password = password
         self.port = port
 
+        # Opțiuni de tuning pentru MinimalAlfrescoServer (paginare, cache etc.)
         self.alfresco_server = MinimalAlfrescoServer(
             base_url=base_url,
             username=username,
-            password=password
+            password=password,
+            **(alfresco_options or {})
         )
 
         self.initialized = False
@@ -55,7 +60,8 @@ class HTTPAlfrescoMCPServer:
         self.app = FastAPI(
             title="Alfresco MCP HTTP Server",
             description="Server MCP pentru Alfresco cu comunicare HTTP",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=CodecJSONResponse
         )
 
         self.app.add_middleware(
@@ -69,130 +75,8 @@ class HTTPAlfrescoMCPServer:
         self.setup_routes()
 
     def _define_tools(self) -> List[Dict[str, Any]]:
-        """Definește manual tool-urile disponibile - SOLUȚIA PRINCIPALĂ"""
-        return [
-            {
-                "name": "list_root_children",
-                "description": "Listează fișierele și folderele din root-ul Alfresco",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "maxItems": {
-                            "type": "integer",
-                            "description": "Numărul maxim de elemente de returnat (default: 20)",
-                            "default": 20
-                        }
-                    }
-                }
-            },
-            {
-                "name": "get_node_children",
-                "description": "Listează conținutul unui folder specific",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "node_id": {
-                            "type": "string",
-                            "description": "ID-ul nodului/folderului"
-                        },
-                        "maxItems": {
-                            "type": "integer",
-                            "description": "Numărul maxim de elemente",
-                            "default": 20
-                        }
-                    },
-                    "required": ["node_id"]
-                }
-            },
-            {
-                "name": "create_folder",
-                "description": "Creează un folder nou",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Numele folderului"
-                        },
-                        "parent_id": {
-                            "type": "string",
-                            "description": "ID-ul folderului părinte (default: -root-)",
-                            "default": "-root-"
-                        },
-                        "title": {
-                            "type": "string",
-                            "description": "Titlul folderului (opțional)"
-                        },
-                        "description": {
-                            "type": "string",
-                            "description": "Descrierea folderului (opțional)"
-                        }
-                    },
-                    "required": ["name"]
-                }
-            },
-            {
-                "name": "get_node_info",
-                "description": "Obține informații despre un nod/fișier/folder specific",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "node_id": {
-                            "type": "string",
-                            "description": "ID-ul nodului"
-                        }
-                    },
-                    "required": ["node_id"]
-                }
-            },
-            {
-                "name": "delete_node",
-                "description": "Șterge un nod/fișier/folder",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "node_id": {
-                            "type": "string",
-                            "description": "ID-ul nodului de șters"
-                        },
-                        "permanent": {
-                            "type": "boolean",
-                            "description": "Ștergere permanentă (default: false - merge în trash)",
-                            "default": False
-                        }
-                    },
-                    "required": ["node_id"]
-                }
-            },
-            {
-                "name": "get_node_id_by_name",
-                "description": "Returnează ID-ul unui fișier sau folder Alfresco după nume (căutare în root)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {
-                            "type": "string",
-                            "description": "Numele nodului (fișier sau folder)"
-                        }
-                    },
-                    "required": ["name"]
-                }
-            },
-            {
-                "name": "browse_by_path",
-                "description": "Navighează la un folder folosind calea (path) în loc de ID",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "path": {
-                            "type": "string",
-                            "description": "Calea folderului (ex: /Company Home/Sites/test-site)",
-                            "default": "/"
-                        }
-                    }
-                }
-            }
-        ]
+        """Tool-urile disponibile: aceeași listă ca serverul MCP (MinimalAlfrescoServer.tool_definitions)"""
+        return self.alfresco_server.tool_definitions()
 
     def setup_routes(self):
         """Configurează rutele HTTP pentru protocolul MCP"""
@@ -212,6 +96,8 @@ class HTTPAlfrescoMCPServer:
                     result = await self.handle_tools_call(request.params or {})
                 elif request.method == "resources/list":
                     result = await self.handle_resources_list()
+                elif request.method == "resources/templates/list":
+                    result = await self.handle_resource_templates_list()
                 elif request.method == "resources/read":
                     result = await self.handle_resources_read(request.params or {})
                 elif request.method == "prompts/list":
@@ -266,6 +152,11 @@ class HTTPAlfrescoMCPServer:
                 "timestamp": datetime.now().isoformat()
             }
         
+        @self.app.get("/debug/stats")
+        async def debug_stats():
+            """Statistici interne ale serverului Alfresco (cache, hit rate, evacuări)"""
+            return self.alfresco_server.get_stats()
+        
         @self.app.get("/capabilities")
         async def get_capabilities():
             """Returnează capabilitățile serverului"""
@@ -330,6 +221,8 @@ class HTTPAlfrescoMCPServer:
             if not hasattr(self.alfresco_server, '_session'):
                 await self.alfresco_server.ensure_connection()
             print("✅ Conexiune Alfresco verificată")
+            # Conexiunea a sondat și Search API: registry-ul poate include acum tool-ul `search`
+            self.tools_registry = self._define_tools()
         except Exception as e:
             print(f"⚠️ Conexiune Alfresco limitată: {e}")
         
@@ -392,12 +285,14 @@ class HTTPAlfrescoMCPServer:
                 # Dacă rezultatul are deja formatul MCP
                 return result
             elif isinstance(result, dict):
-                # Convertim dict-ul într-un format MCP
+                # Același format și același buget de output ca serverul MCP
                 return {
                     "content": [
                         {
                             "type": "text",
-                            "text": str(result)
+                            "text": self.alfresco_server.render_tool_result(
+                                result, self.alfresco_server.tool_context(tool_name, arguments)
+                            )
                         }
                     ]
                 }
@@ -427,6 +322,10 @@ class HTTPAlfrescoMCPServer:
                     ]
                 }
             
+        except CircuitOpenError as e:
+            # Alfresco e indisponibil: refuz rapid, clientul poate reîncerca mai târziu
+            print(f"⚠️ Tool {tool_name} refuzat: {e}")
+            raise HTTPException(status_code=503, detail=str(e))
         except Exception as e:
             print(f"❌ Eroare execuție tool {tool_name}: {e}")
             raise HTTPException(status_code=500, detail=f"Eroare execuție tool: {str(e)}")
@@ -439,13 +338,13 @@ class HTTPAlfrescoMCPServer:
         
         # Mapează tool-urile la metodele corespunzătoare
         if tool_name == "list_root_children":
-            max_items = arguments.get("maxItems", 20)
-            return await self.alfresco_server.list_root_children(max_items)
+            max_items = self.alfresco_server.tool_limit(arguments)
+            return await self.alfresco_server.list_root_children(max_items, arguments.get("cursor"))
             
         elif tool_name == "get_node_children":
             node_id = arguments["node_id"]
-            max_items = arguments.get("maxItems", 20)
-            return await self.alfresco_server.get_node_children(node_id, max_items)
+            max_items = self.alfresco_server.tool_limit(arguments)
+            return await self.alfresco_server.get_node_children(node_id, max_items, arguments.get("cursor"))
             
         elif tool_name == "create_folder":
             name = arguments["name"]
@@ -458,6 +357,9 @@ class HTTPAlfrescoMCPServer:
             node_id = arguments["node_id"]
             return await self.alfresco_server.get_node_info(node_id)
             
+        elif tool_name == "get_nodes_info":
+            return await self.alfresco_server.get_nodes_info(arguments["node_ids"], arguments.get("concurrency"))
+            
         elif tool_name == "delete_node":
             node_id = arguments["node_id"]
             permanent = arguments.get("permanent", False)
@@ -467,9 +369,52 @@ class HTTPAlfrescoMCPServer:
             name = arguments["name"]
             return await self.alfresco_server.get_node_id_by_name(name)
             
+        elif tool_name == "search":
+            max_items = self.alfresco_server.tool_limit(arguments)
+            return await self.alfresco_server.search(arguments["query"], arguments.get("language", "afts"), max_items,
+                                                     arguments.get("cursor"), arguments.get("facets"))
+            
+        elif tool_name == "search_nodes":
+            max_items = self.alfresco_server.tool_limit(arguments)
+            return await self.alfresco_server.search_nodes(arguments["query"], max_items, arguments.get("type"))
+            
         elif tool_name == "browse_by_path":
             path = arguments.get("path", "/")
-            return await self.alfresco_server.browse_by_path(path)
+            max_items = self.alfresco_server.tool_limit(arguments)
+            return await self.alfresco_server.browse_by_path(path, max_items, arguments.get("cursor"))
+            
+        elif tool_name == "complete_path":
+            prefix = arguments.get("prefix", "/")
+            return await self.alfresco_server.complete_path(prefix)
+            
+        elif tool_name == "create_folder_tree":
+            tree = arguments["tree"]
+            parent_id = arguments.get("parent_id", "-root-")
+            return await self.alfresco_server.create_folder_tree(tree, parent_id)
+            
+        elif tool_name == "bulk_mutate":
+            operations = arguments["operations"]
+            return await self.alfresco_server.bulk_mutate(operations, arguments.get("concurrency"))
+            
+        elif tool_name == "list_subtree":
+            node_id = arguments.get("node_id", "-root-")
+            max_depth = arguments.get("max_depth", 3)
+            max_nodes = arguments.get("max_nodes", 200)
+            return await self.alfresco_server.list_subtree(node_id, max_depth, max_nodes)
+            
+        elif tool_name == "get_content":
+            node_id = arguments["node_id"]
+            offset = arguments.get("offset", 0)
+            return await self.alfresco_server.get_content(node_id, offset, arguments.get("length"), arguments.get("max_bytes"))
+            
+        elif tool_name == "upload_content":
+            files = arguments["files"]
+            parent_id = arguments.get("parent_id", "-root-")
+            overwrite = arguments.get("overwrite", False)
+            return await self.alfresco_server.upload_content(files, parent_id, overwrite, arguments.get("concurrency"))
+            
+        elif tool_name == "continue":
+            return self.alfresco_server.continue_output(arguments["cursor"])
             
         else:
             raise ValueError(f"Tool necunoscut: {tool_name}")
@@ -485,6 +430,13 @@ class HTTPAlfrescoMCPServer:
         print(f"📁 Returnez {len(resources)} resurse")
         return {"resources": resources}
     
+    async def handle_resource_templates_list(self) -> Dict[str, Any]:
+        """Returnează șabloanele de resurse (conținutul documentelor, după ID)"""
+        if not self.initialized:
+            raise HTTPException(status_code=400, detail="Server nu este inițializat")
+        
+        return {"resourceTemplates": [self.alfresco_server.content_resource_template()]}
+    
     async def handle_resources_read(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Citește o resursă specifică"""
         if not self.initialized:
@@ -494,8 +446,14 @@ class HTTPAlfrescoMCPServer:
         if not uri:
             raise HTTPException(status_code=400, detail="Lipsește URI-ul resursei")
         
-        # Implementare placeholder pentru citirea resurselor
-        raise HTTPException(status_code=404, detail="Resursa nu a fost găsită")
+        await self.alfresco_server.ensure_connection()
+        try:
+            content = await self.alfresco_server.read_content_resource(uri)
+        except ValueError:
+            raise HTTPException(status_code=404, detail="Resursa nu a fost găsită")
+        
+        print(f"📄 Resursă citită: {uri}")
+        return {"contents": [content]}
     
     async def handle_prompts_list(self) -> Dict[str, Any]:
         """Returnează lista prompt-urilor disponibile"""
@@ -0,0 +1,61 @@
+"""
+Codec JSON comun pentru server, client și adapter: orjson când este instalat, altfel modulul json standard
+"""
+import json
+from typing import Any, Union
+
+import httpx
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # orjson este opțional
+    orjson = None
+
+# Implementarea folosită efectiv (vizibilă în /debug/stats și în benchmark)
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumpb(obj: Any, pretty: bool = False) -> bytes:
+    """Serializează în bytes UTF-8 (fără escape pentru diacritice)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Tipuri pe care orjson nu le acceptă (ex: întregi peste 64 de biți): calea standard
+            pass
+    return _stdlib_dumps(obj, pretty).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """Serializează în str"""
+    if orjson is None:
+        return _stdlib_dumps(obj, pretty)
+    return dumpb(obj, pretty).decode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_response(response: Any) -> Any:
+    """Corpul JSON al unui răspuns httpx, parsat direct din bytes; alte obiecte (ex: mock-uri) folosesc .json()"""
+    if isinstance(response, httpx.Response):
+        return loads(response.content)
+    return response.json()
+
+
+def _stdlib_dumps(obj: Any, pretty: bool) -> str:
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+class CodecJSONResponse(JSONResponse):
+    """Răspuns FastAPI serializat cu codec-ul comun"""
+
+    def render(self, content: Any) -> bytes:
+        return dumpb(content)
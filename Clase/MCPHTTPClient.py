@@ -11,6 +11,8 @@ import httpx
 import asyncio
 import logging
 
+from Clase import JsonCodec
+
 # Configurare logging
 logger = logging.getLogger("mcp_http_client")
 logger.setLevel(logging.DEBUG)
@@ -193,7 +195,7 @@ class MCPHTTPClient:
             )
             response.raise_for_status()
             
-            result = response.json()
+            result = JsonCodec.parse_response(response)
             
             if result.get('result'):
                 print("✅ Protocol MCP HTTP inițializat cu succes")
@@ -240,7 +242,7 @@ class MCPHTTPClient:
             )
             response.raise_for_status()
             
-            result = response.json()
+            result = JsonCodec.parse_response(response)
             
             if result.get('result') and 'tools' in result['result']:
                 for tool in result['result']['tools']:
@@ -282,14 +284,14 @@ class MCPHTTPClient:
                     "arguments": arguments
                 }
             }
-            logger.debug(f"➡️ REQUEST: POST {url} {json.dumps(call_request, indent=2)}")
+            logger.debug(f"➡️ REQUEST: POST {url} {JsonCodec.dumps(call_request, pretty=True)}")
 
             response = await self.http_client.post(url, json=call_request)
             logger.debug(f"⬅️ RESPONSE {response.status_code} {response.reason_phrase}")
             logger.debug(f"Body: {response.text[:1000]}")
 
             response.raise_for_status()
-            result = response.json()
+            result = JsonCodec.parse_response(response)
             
             if result.get('result'):
                 logger.info(f"✅ Tool HTTP {tool_name} executat cu succes")
@@ -367,6 +369,8 @@ class MCPHTTPClient:
     - Răspunde DOAR cu JSON valid.
     - Pentru un singur tool, folosește acțiunea "call_tool".
     - Pentru mai multe tool-uri succesive, folosește acțiunea "pipeline".
+    - Pentru informațiile mai multor noduri, folosește un singur apel get_nodes_info (cu lista de ID-uri), nu mai mulți pași get_node_info.
+    - Dacă un răspuns are câmpul 'continuation', restul se obține cu tool-ul continue (cursor = acea valoare).
     - Nu include text explicativ în afara JSON-ului.
     """
 
@@ -465,7 +469,7 @@ class MCPHTTPClient:
                     item.get("text", "") if isinstance(item, dict) else str(item)
                     for item in tool_result['content']
                 )
-            return json.dumps(tool_result, indent=2, ensure_ascii=False)
+            return JsonCodec.dumps(tool_result, pretty=True)
         
         return str(tool_result)
             
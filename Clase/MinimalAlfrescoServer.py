@@ -1,23 +1,156 @@
-import json
 import sys
 import os
-from typing import Any, Dict, List
+import asyncio
+import time
+from collections import deque
+from contextlib import aclosing, asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 import httpx
 from urllib.parse import urljoin
 import base64
+import codecs
+import re
+import tempfile
 
 from mcp.server import Server
 from mcp.types import (
     Tool,
 )
 import mcp.types as types
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+
+from Clase.NodeCache import LRUTTLCache, NodeCache
+from Clase.PersistentCache import PersistentCache
+from Clase.ChangeFeed import AuditChangeFeed, Change, ChangeFeedPoller, SearchChangeFeed
+from Clase.PathIndex import PathIndex, ROOT_ID
+from Clase.NameIndex import NameIndex
+from Clase.RepositoryMirror import RepositoryMirror
+from Clase.MultipartUpload import MmapMultipartBody
+from Clase.AlfrescoTransport import SEARCH_API, AlfrescoTransport, nodes_path
+from Clase.Projection import Projection, LISTING, NODE_INFO, NAMES, PATH, SEARCH, SEARCH_HITS
+from Clase.SearchIndex import SearchIndex
+from Clase.OutputBudget import ContinuationStore, OutputBudget
+from Clase import JsonCodec
+from Clase.SingleFlight import SingleFlight
+from Clase.ConcurrencyLimiter import AdaptiveConcurrencyLimiter
+from Clase.EndpointPool import EndpointPool
+from Clase.RateLimiter import READ_OPS, RateLimiter, background_job, parse_retry_after, request_priority
+from Clase.Resilience import (BREAKER_STATUSES, CircuitBreaker, CircuitOpenError, HedgePolicy, LatencyTracker, RetryPolicy,
+                              RETRY_STATUSES, endpoint_key)
+
+# Numărul maxim de operații acceptate într-un singur apel bulk_mutate
+MAX_BULK_OPERATIONS = 1000
+
+# Dimensiunea bucăților citite din stream-ul de conținut
+CONTENT_CHUNK_SIZE = 64 * 1024
+# Tipurile MIME (pe lângă text/*) al căror conținut poate fi arătat ca text
+TEXT_MIME_TYPES = {"application/json", "application/xml", "application/javascript", "application/x-yaml",
+                   "application/x-sh", "application/sql", "image/svg+xml"}
+# URI-ul resursei MCP pentru conținutul unui nod
+CONTENT_URI_PREFIX = "alfresco://nodes/"
+CONTENT_URI_SUFFIX = "/content"
+# Operațiile al căror timeout și concurență se adaptează la latența observată (transferurile de conținut variază cu dimensiunea)
+ADAPTIVE_OPS = {"read", "write"}
 
 class MinimalAlfrescoServer:
-    def __init__(self, base_url: str, username: str, password: str):
+    def __init__(self, base_url: str, username: str, password: str,
+                 page_size: int = 100, prefetch_window: int = 4,
+                 cache_ttl: float = 30.0, cache_size: int = 2048, path_ttl: float = 300.0,
+                 name_index_crawl: bool = True, negative_ttl: float = 60.0,
+                 mirror: bool = False, mirror_snapshot: Optional[str] = None,
+                 mirror_staleness: float = 300.0, mirror_interval: float = 60.0,
+                 bulk_concurrency: int = 8, walk_concurrency: int = 8,
+                 content_preview_bytes: int = 8192, content_spool_bytes: int = 1024 * 1024,
+                 content_max_bytes: int = 10 * 1024 * 1024, upload_root: Optional[str] = None,
+                 max_connections: int = 20, max_keepalive: int = 10, keepalive_expiry: float = 30.0,
+                 http2: bool = False, timeouts: Optional[Dict[str, float]] = None, single_flight: bool = True,
+                 retry_attempts: int = 3, retry_base_delay: float = 0.1, breaker_threshold: int = 5,
+                 breaker_recovery: float = 30.0, adaptive_timeouts: bool = True,
+                 hedging: bool = False, hedge_budget: float = 0.1, rate_limit: float = 0.0,
+                 rate_burst: Optional[float] = None, adaptive_concurrency: bool = True, min_concurrency: int = 1,
+                 endpoints: Optional[List[str]] = None, health_interval: float = 10.0,
+                 search_index: bool = True, search_index_path: Optional[str] = None,
+                 search_api: bool = True, search_facet_ttl: float = 60.0,
+                 output_budget: int = 1000, continuation_ttl: float = 600.0,
+                 persistent_cache: Optional[str] = None, persistent_cache_max_age: float = 86400.0,
+                 change_feed: Optional[str] = None, change_feed_interval: float = 30.0,
+                 change_feed_folders: Optional[List[str]] = None, audit_app: str = "alfresco-access"):
         self.base_url = base_url.rstrip('/')
+        # Nodurile clusterului Alfresco; base_url este nodul preferat (primește scrierile)
+        self.endpoints = EndpointPool([base_url] + list(endpoints or []), check_interval=health_interval)
         self.username = username
         self.password = password
         self.client = None
+        # GET-urile identice simultane împart un singur apel (None = dezactivat)
+        self.single_flight = SingleFlight() if single_flight else None
+        # Reziliență: reîncercări cu jitter pentru citiri, circuit breaker și timeout-uri după p99-ul observat
+        self.retry = RetryPolicy(attempts=retry_attempts, base_delay=retry_base_delay)
+        self.breaker = CircuitBreaker(failure_threshold=breaker_threshold, recovery_time=breaker_recovery)
+        self.latency = LatencyTracker()
+        self.adaptive_timeouts = adaptive_timeouts
+        # Hedging: o citire fără răspuns după p95 primește un duplicat, în limita bugetului (None = dezactivat)
+        self.hedge = HedgePolicy(budget=hedge_budget) if hedging else None
+        # Ritmul cererilor spre Alfresco (rate_limit <= 0 = fără limită) și pauzele cerute prin Retry-After
+        self.limiter = RateLimiter(rate=rate_limit, burst=rate_burst)
+        # Câte citiri / scrieri pot fi simultan în curs, ajustat după latență (None = doar limita pool-ului)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial=max(min_concurrency, max_connections // 2), min_limit=min_concurrency, max_limit=max_connections
+        ) if adaptive_concurrency else None
+        # Pool de conexiuni, HTTP/2 și timeout-uri pe tip de operație pentru clientul httpx
+        self.transport = AlfrescoTransport(
+            username, password, max_connections=max_connections, max_keepalive=max_keepalive,
+            keepalive_expiry=keepalive_expiry, http2=http2, timeouts=timeouts
+        )
+        # Paginare: dimensiunea unei pagini Alfresco și câte pagini se cer în avans
+        self.page_size = page_size
+        self.prefetch_window = max(1, prefetch_window)
+        # Cache TTL + LRU pentru noduri și pagini de listare (cache_ttl <= 0 îl dezactivează)
+        # Copia pe disc a cache-ului și a căilor (opțională): la repornire intrările se încarcă leneș, iar
+        # cele expirate între timp se servesc și se revalidează în fundal
+        self.persistent_cache = PersistentCache(
+            persistent_cache, max_age=persistent_cache_max_age
+        ) if persistent_cache else None
+        self._revalidation_queue: Dict[Tuple[str, Any], None] = {}
+        self._revalidation_task: Optional[asyncio.Task] = None
+        self.revalidated = 0
+        self.cache = NodeCache(max_nodes=cache_size, max_listings=max(1, cache_size // 4), ttl=cache_ttl,
+                               store=self.persistent_cache, revalidate=self.schedule_revalidation)
+        # Index path -> ID, alimentat de listări și de rezolvările de căi
+        self.path_index = PathIndex(ttl=path_ttl, store=self.persistent_cache, revalidate=self.schedule_revalidation)
+        # Index de nume pentru tot depozitul, construit de un crawl în fundal
+        self.name_index = NameIndex(negative_ttl=negative_ttl)
+        self.name_index_crawl = name_index_crawl
+        self._name_crawl_task: Optional[asyncio.Task] = None
+        # Index full-text (nume, titlu, descriere) pentru search_nodes, alimentat de același crawl și de mutații
+        self.search_index = SearchIndex(search_index_path) if search_index else None
+        # Search API (Alfresco Search Services): None = încă nesondat, False = indisponibil sau dezactivat
+        self.search_available: Optional[bool] = None if search_api else False
+        # Fațetele unei interogări, refolosite pentru paginile următoare și pentru repetări
+        self.facet_cache = LRUTTLCache(max_entries=256, ttl=search_facet_ttl)
+        # Bugetul (în tokeni) al unui răspuns de tool, comun MCP și HTTP; restul se reia cu tool-ul `continue`
+        self.output_budget = OutputBudget(max_tokens=output_budget, store=ContinuationStore(ttl=continuation_ttl))
+        # Oglinda locală a depozitului (opțională): citirile se servesc din ea cât timp e proaspătă
+        # Sincronizarea incrementală folosește un flux 'search' propriu (cu checkpoint-ul oglinzii)
+        self.mirror = RepositoryMirror(
+            self, snapshot_path=mirror_snapshot, staleness=mirror_staleness, sync_interval=mirror_interval,
+            feed=SearchChangeFeed(self._send)
+        ) if mirror else None
+        # Fluxul de modificări (opțional): invalidări precise în loc de TTL-uri scurte ('search' sau 'audit')
+        self.change_feed = ChangeFeedPoller(
+            self._change_source(change_feed, change_feed_folders, audit_app), self.apply_change,
+            interval=change_feed_interval
+        ) if change_feed else None
+        # Câte operații de scriere rulează concurent în tool-urile de tip bulk (ex: create_folder_tree)
+        self.bulk_concurrency = max(1, bulk_concurrency)
+        # Câte foldere se listează concurent la parcurgerea unui subarbore
+        self.walk_concurrency = max(1, walk_concurrency)
+        # Conținut: câți bytes intră în previzualizarea text, de la ce dimensiune se scrie pe disc
+        # și cât poate returna o citire de resursă
+        self.content_preview_bytes = max(1, content_preview_bytes)
+        self.content_spool_bytes = content_spool_bytes
+        self.content_max_bytes = max(1, content_max_bytes)
+        # Directorul local din care are voie upload_content să citească fișiere (None = upload dezactivat)
+        self.upload_root = os.path.realpath(upload_root) if upload_root else None
         self.server = Server("minimal-alfresco-server")
         self.connection_tested = False
         self.setup_handlers()
@@ -27,130 +160,23 @@ class MinimalAlfrescoServer:
         
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
-            """Tool-uri adaptate pentru configurația minimală (fără search)"""
-            return [
-                Tool(
-                    name="list_root_children",
-                    description="Listează fișierele și folderele din root-ul Alfresco",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "maxItems": {
-                                "type": "integer",
-                                "description": "Numărul maxim de elemente de returnat (default: 10)",
-                                "default": 20
-                            }
-                        }
-                    }
-                ),
-                Tool(
-                    name="get_node_children",
-                    description="Listează conținutul unui folder specific",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "node_id": {
-                                "type": "string",
-                                "description": "ID-ul nodului/folderului"
-                            },
-                            "maxItems": {
-                                "type": "integer",
-                                "description": "Numărul maxim de elemente",
-                                "default": 20
-                            }
-                        },
-                        "required": ["node_id"]
-                    }
-                ),
-                Tool(
-                    name="create_folder",
-                    description="Creează un folder nou",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Numele folderului"
-                            },
-                            "parent_id": {
-                                "type": "string",
-                                "description": "ID-ul folderului părinte (default: -root-)",
-                                "default": "-root-"
-                            },
-                            "title": {
-                                "type": "string",
-                                "description": "Titlul folderului (opțional)"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Descrierea folderului (opțional)"
-                            }
-                        },
-                        "required": ["name"]
-                    }
-                ),
-                Tool(
-                    name="get_node_info",
-                    description="Obține informații despre un nod/fișier/folder specific",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "node_id": {
-                                "type": "string",
-                                "description": "ID-ul nodului"
-                            }
-                        },
-                        "required": ["node_id"]
-                    }
-                ),
-                Tool(
-                    name="delete_node",
-                    description="Șterge un nod/fișier/folder",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "node_id": {
-                                "type": "string",
-                                "description": "ID-ul nodului de șters"
-                            },
-                            "permanent": {
-                                "type": "boolean",
-                                "description": "Ștergere permanentă (default: false - merge în trash)",
-                                "default": False
-                            }
-                        },
-                        "required": ["node_id"]
-                    }
-                ),
-                Tool(
-                    name="get_node_id_by_name",
-                    description="Returnează ID-ul unui fișier sau folder Alfresco după nume (căutare în root)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "name": {
-                                "type": "string",
-                                "description": "Numele nodului (fișier sau folder)"
-                            }
-                        },
-                        "required": ["name"]
-                    }
-                ),
-                Tool(
-                    name="browse_by_path",
-                    description="Navighează la un folder folosind calea (path) în loc de ID",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "path": {
-                                "type": "string",
-                                "description": "Calea folderului (ex: /Company Home/Sites/test-site)",
-                                "default": "/"
-                            }
-                        }
-                    }
-                )
-            ]
+            """Tool-uri adaptate pentru configurația minimală (fără Search Services; căutarea folosește indexul local)"""
+            return [Tool(**definition) for definition in self.tool_definitions()]
+        
+        @self.server.list_resource_templates()
+        async def handle_list_resource_templates() -> List[types.ResourceTemplate]:
+            """Conținutul documentelor este expus ca resursă, după ID-ul nodului"""
+            return [types.ResourceTemplate(**self.content_resource_template())]
+        
+        @self.server.read_resource()
+        async def handle_read_resource(uri) -> List[ReadResourceContents]:
+            if not self.connection_tested:
+                await self.ensure_connection()
+            content = await self.read_content_resource(str(uri))
+            data = content.get("text")
+            if data is None:
+                data = base64.b64decode(content["blob"])
+            return [ReadResourceContents(content=data, mime_type=content["mimeType"])]
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
@@ -160,15 +186,12 @@ class MinimalAlfrescoServer:
                     await self.ensure_connection()
                 
                 result = None
-                context = ""
                 
                 if name == "list_root_children":
-                    result = await self.list_root_children(min(arguments.get("maxItems", 10), 10))
-                    context = "root folder"
+                    result = await self.list_root_children(self.tool_limit(arguments), arguments.get("cursor"))
                 elif name == "get_node_children":
                     node_id = arguments["node_id"]
-                    result = await self.get_node_children(node_id, min(arguments.get("maxItems", 10), 10))
-                    context = f"folder {node_id}"
+                    result = await self.get_node_children(node_id, self.tool_limit(arguments), arguments.get("cursor"))
                 elif name == "create_folder":
                     result = await self.create_folder(
                         arguments["name"],
@@ -176,122 +199,465 @@ class MinimalAlfrescoServer:
                         arguments.get("title"),
                         arguments.get("description")
                     )
-                    context = "folder creation"
                 elif name == "get_node_info":
                     result = await self.get_node_info(arguments["node_id"])
-                    context = "node information"
+                elif name == "get_nodes_info":
+                    result = await self.get_nodes_info(arguments["node_ids"], arguments.get("concurrency"))
                 elif name == "delete_node":
                     result = await self.delete_node(arguments["node_id"], arguments.get("permanent", False))
-                    context = "node deletion"
                 elif name == "get_node_id_by_name":
                     result = await self.get_node_id_by_name(arguments["name"])
-                    context = f"node ID for name '{arguments['name']}'"
+                elif name == "search" and self.search_available:
+                    result = await self.search(arguments["query"], arguments.get("language", "afts"),
+                                               self.tool_limit(arguments, 20), arguments.get("cursor"),
+                                               arguments.get("facets"))
+                elif name == "search_nodes":
+                    result = await self.search_nodes(arguments["query"], self.tool_limit(arguments, 20),
+                                                     arguments.get("type"))
                 elif name == "browse_by_path":
-                    result = await self.browse_by_path(arguments.get("path", "/"))
-                    context = f"path {arguments.get('path', '/')}"
+                    result = await self.browse_by_path(arguments.get("path", "/"), self.tool_limit(arguments), arguments.get("cursor"))
+                elif name == "complete_path":
+                    result = await self.complete_path(arguments.get("prefix", "/"))
+                elif name == "create_folder_tree":
+                    result = await self.create_folder_tree(arguments["tree"], arguments.get("parent_id", "-root-"))
+                elif name == "bulk_mutate":
+                    result = await self.bulk_mutate(arguments["operations"], arguments.get("concurrency"))
+                elif name == "list_subtree":
+                    result = await self.list_subtree(
+                        arguments.get("node_id", "-root-"),
+                        arguments.get("max_depth", 3),
+                        arguments.get("max_nodes", 200)
+                    )
+                elif name == "get_content":
+                    result = await self.get_content(
+                        arguments["node_id"],
+                        arguments.get("offset", 0),
+                        arguments.get("length"),
+                        arguments.get("max_bytes")
+                    )
+                elif name == "upload_content":
+                    result = await self.upload_content(
+                        arguments["files"],
+                        arguments.get("parent_id", "-root-"),
+                        arguments.get("overwrite", False),
+                        arguments.get("concurrency")
+                    )
+                elif name == "continue":
+                    return [types.TextContent(type="text", text=self.continue_output(arguments["cursor"]))]
                 else:
                     return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
                 
-                # Formatează pentru TinyLlama
-                formatted_result = self.format_simple_response(result, context)
-                
-                # Răspuns mai concis
-                response_text = json.dumps(formatted_result, indent=1, ensure_ascii=False)
+                # Formatează pentru TinyLlama, în limita bugetului de output
+                response_text = self.render_tool_result(result, self.tool_context(name, arguments))
                 
                 return [types.TextContent(type="text", text=response_text)]
             
             except Exception as e:
                 error_msg = f"Error in {name}: {str(e)}"
-                return [types.TextContent(type="text", text=json.dumps({
+                return [types.TextContent(type="text", text=JsonCodec.dumps({
                     "error": True,
                     "message": error_msg,
                     "tool": name
-                }, indent=1))]
+                }, pretty=True))]
+
+    @property
+    def max_items(self) -> int:
+        """Cel mai mare număr de elemente dintr-un singur răspuns: cât încape în fereastra de prefetch"""
+        return self.page_size * self.prefetch_window
+
+    def tool_limit(self, arguments: Dict[str, Any], default: int = 20) -> int:
+        """Numărul de elemente cerut de tool ('limit' sau 'maxItems'), plafonat la max_items; restul vine prin cursor"""
+        value = arguments.get("limit")
+        if value is None:
+            value = arguments.get("maxItems", default)
+        return min(max(1, int(value)), self.max_items)
+
+    def render_tool_result(self, result: Any, context: str = "") -> str:
+        """Textul trimis modelului pentru rezultatul unui tool (MCP și HTTP), trunchiat la bugetul de output"""
+        return JsonCodec.dumps(self.output_budget.apply(self.format_simple_response(result, context)), pretty=True)
+
+    def continue_output(self, cursor: str) -> str:
+        """Următoarea bucată a unui răspuns trunchiat; ValueError dacă cursorul a expirat"""
+        return JsonCodec.dumps(self.output_budget.resume(cursor), pretty=True)
 
     async def ensure_connection(self):
         """Conexiune optimizată pentru modele rapide"""
         if not self.client:
-            self.client = httpx.AsyncClient(
-                timeout=httpx.Timeout(8.0, connect=5.0),  # Timeout-uri mai mici
-                follow_redirects=True
-            )
-            
-            auth_string = base64.b64encode(f'{self.username}:{self.password}'.encode()).decode()
-            self.client.headers.update({
-                "Authorization": f"Basic {auth_string}",
-                "Content-Type": "application/json",
-                "Accept": "application/json"
-            })
+            self.client = self.transport.create_client()
         
         if not self.connection_tested:
             try:
-                test_url = urljoin(self.base_url, "/alfresco/api/-default-/public/alfresco/versions/1/nodes/-root-")
-                response = await self.client.get(test_url)
+                response = await self._send("GET", nodes_path("-root-"))
                 response.raise_for_status()
+                self.path_index.set_root(JsonCodec.parse_response(response).get("entry", {}).get("id"))
                 self.connection_tested = True
                 # Log mai concis pentru TinyLlama
                 print("✅ Alfresco connected", file=sys.stderr)
+                if self.name_index_crawl:
+                    self.start_name_index_crawl()
+                if self.mirror:
+                    self.mirror.start()
+                if len(self.endpoints.endpoints) > 1:
+                    self.endpoints.start(self._probe)
+                if self.search_available is None:
+                    await self.probe_search()
+                if self.change_feed:
+                    self.start_change_feed()
             except Exception as e:
                 raise Exception(f"Cannot connect to Alfresco: {str(e)}")
     
-    async def list_root_children(self, max_items: int = 20) -> Dict[str, Any]:
-        """Listează conținutul root-ului"""
-        return await self.get_node_children("-root-", max_items)
+    async def _send(self, method: str, path: str, op: str = "read", **kwargs) -> httpx.Response:
+        """Trimite o cerere spre Alfresco; toate apelurile REST trec pe aici.
+        
+        GET-urile identice (aceeași cale, aceiași parametri) aflate simultan în curs împart un singur apel.
+        """
+        if method == "GET" and self.single_flight is not None:
+            key = (path, self._request_key(kwargs))
+            return await self.single_flight.do(key, lambda: self._request(method, path, op, **kwargs))
+        return await self._request(method, path, op, **kwargs)
     
-    async def get_node_children(self, node_id: str, max_items: int = 20) -> Dict[str, Any]:
-        """Obține copiii unui nod"""
-        url = urljoin(self.base_url, f"/alfresco/api/-default-/public/alfresco/versions/1/nodes/{node_id}/children")
+    @staticmethod
+    def _request_key(kwargs: Dict[str, Any]) -> tuple:
+        """Parametrii și antetele unei cereri, într-o formă hashable"""
+        return tuple(
+            (name, tuple(sorted((str(key), str(value)) for key, value in (kwargs.get(name) or {}).items())))
+            for name in ("params", "headers")
+        )
+    
+    async def _request(self, method: str, path: str, op: str = "read", **kwargs) -> httpx.Response:
+        """Cererea efectivă, prin circuit breaker; citirile (GET) se reîncearcă la erori de rețea și 502/503/504"""
+        endpoint = endpoint_key(method, path)
+        attempts = self.retry.attempts if method == "GET" else 1
         
-        params = {
-            "maxItems": max_items,
-            "skipCount": 0,
-            "include": "properties,aspectNames,path"
-        }
+        for attempt in range(attempts):
+            await self.limiter.acquire(request_priority(op))
+            probe = self.breaker.before_call()
+            timeout = kwargs.get("timeout") or self._timeout(op, endpoint)
+            started = time.monotonic()
+            try:
+                if method == "GET" and self.hedge is not None:
+                    response = await self._hedged_get(path, endpoint, op, dict(kwargs, timeout=timeout))
+                else:
+                    response = await self._call(method, path, op, dict(kwargs, timeout=timeout))
+            except httpx.TransportError:
+                self.breaker.record_failure()
+                if attempt + 1 >= attempts:
+                    raise
+            except BaseException:
+                # Anulare (prefetch oprit, hedge pierdut, client deconectat) sau altă eroare
+                self.breaker.release(probe)
+                raise
+            else:
+                self._honor_retry_after(response)
+                if self._record_outcome(response, endpoint, time.monotonic() - started) and response.status_code != 429:
+                    return response
+                if response.status_code not in RETRY_STATUSES or attempt + 1 >= attempts:
+                    return response
+            
+            self.retry.retries += 1
+            await asyncio.sleep(self.retry.delay(attempt))
+    
+    async def _hedged_get(self, path: str, endpoint: str, op: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """GET cu hedging: dacă nu a venit răspunsul până la p95-ul endpoint-ului, pleacă un duplicat.
         
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
+        Câștigă primul răspuns reușit (non-5xx); cealaltă cerere este anulată. Fără destule măsurători
+        sau cu bugetul epuizat, cererea rămâne una simplă. Cu mai multe noduri, duplicatul ajunge de regulă
+        pe alt nod (cel cu mai puține cereri în curs).
+        """
+        def attempt() -> Awaitable[httpx.Response]:
+            return self._call("GET", path, op, kwargs)
         
-        data = response.json()
+        self.hedge.requests += 1
+        delay = self.hedge.delay(self.latency, endpoint)
+        if delay is None:
+            return await attempt()
         
-        # Formatăm rezultatele să fie mai ușor de citit
-        items = []
-        for entry in data.get("list", {}).get("entries", []):
-            node = entry["entry"]
-            item_info = {
-                "id": node.get("id"),
-                "name": node.get("name"),
-                "type": "folder" if node.get("isFolder") else "file",
-                "nodeType": node.get("nodeType"),
-                "created": node.get("createdAt"),
-                "modified": node.get("modifiedAt"),
-                "createdBy": node.get("createdByUser", {}).get("displayName"),
-                "modifiedBy": node.get("modifiedByUser", {}).get("displayName"),
-            }
-            
-            # Adaugă informații specifice fișierelor
-            if not node.get("isFolder") and "content" in node:
-                item_info.update({
-                    "size": node["content"].get("sizeInBytes"),
-                    "mimeType": node["content"].get("mimeType"),
-                    "encoding": node["content"].get("encoding")
-                })
-            
-            # Adaugă path dacă este disponibil
-            if "path" in node:
-                item_info["path"] = node["path"].get("name")
+        primary = asyncio.ensure_future(attempt())
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            # Duplicatul nu așteaptă la limitator: pleacă doar dacă e un jeton liber imediat
+            if done or not self._hedge_capacity() or not self.hedge.allow() or not self.limiter.try_acquire():
+                return await primary
+            hedge = asyncio.ensure_future(attempt())
+            tasks.append(hedge)
             
-            items.append(item_info)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and self._is_success(task.result()):
+                        if task is hedge:
+                            self.hedge.wins += 1
+                        return task.result()
+            # Niciuna nu a reușit: răspunsul / eroarea cererii originale
+            return await primary
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    def _hedge_capacity(self) -> bool:
+        """Un duplicat nu stă la coadă: pleacă doar dacă limita de concurență mai are loc"""
+        return self.concurrency is None or self.concurrency.available()
+    
+    async def _call(self, method: str, path: str, op: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Un singur apel HTTP spre nodul ales; citirile și scrierile trec prin limitatorul adaptiv de concurență"""
+        target = self.endpoints.pick(write=op not in READ_OPS)
+        url = urljoin(target.url, path)
+        try:
+            with self.endpoints.track(target):
+                if self.concurrency is not None and op in ADAPTIVE_OPS:
+                    async with self.concurrency.slot():
+                        with self.transport.track(op):
+                            return await getattr(self.client, method.lower())(url, **kwargs)
+                with self.transport.track(op):
+                    return await getattr(self.client, method.lower())(url, **kwargs)
+        except (httpx.NetworkError, httpx.ConnectTimeout) as e:
+            # Nodul nu răspunde: iese din rotație până la următoarea sondă reușită (reîncercarea merge pe altul)
+            self.endpoints.mark_down(target, str(e) or e.__class__.__name__)
+            raise
+    
+    async def _probe(self, url: str) -> httpx.Response:
+        return await self.client.get(url, timeout=self.transport.timeout("read"))
+    
+    @asynccontextmanager
+    async def _stream(self, method: str, path: str, op: str = "content", **kwargs) -> AsyncIterator[httpx.Response]:
+        """Ca _send, dar cu corpul răspunsului citit în stream (fără reîncercări)"""
+        kwargs.setdefault("timeout", self.transport.timeout(op))
+        await self.limiter.acquire(request_priority(op))
+        probe = self.breaker.before_call()
+        target = self.endpoints.pick(write=op not in READ_OPS)
+        try:
+            with self.endpoints.track(target), self.transport.track(op):
+                async with self.client.stream(method, urljoin(target.url, path), **kwargs) as response:
+                    self._record_outcome(response)
+                    yield response
+        except httpx.TransportError as e:
+            self.breaker.record_failure()
+            if isinstance(e, (httpx.NetworkError, httpx.ConnectTimeout)):
+                self.endpoints.mark_down(target, str(e) or e.__class__.__name__)
+            raise
+        finally:
+            self.breaker.release(probe)
+    
+    def _timeout(self, op: str, endpoint: str) -> httpx.Timeout:
+        """Timeout-ul unei cereri: configurat pe operație sau, cu destule măsurători, derivat din p99"""
+        if not self.adaptive_timeouts or op not in ADAPTIVE_OPS:
+            return self.transport.timeout(op)
+        ceiling = self.transport.timeouts.get(op, self.transport.timeouts["read"])
+        return self.transport.timeout(op, self.latency.timeout(endpoint, ceiling))
+    
+    def _honor_retry_after(self, response: Any):
+        """La 429/503 cu Retry-After, toate cererile spre Alfresco se opresc cât a cerut serverul"""
+        if getattr(response, "status_code", None) not in (429, 503):
+            return
+        seconds = parse_retry_after(response.headers.get("Retry-After"))
+        if seconds is not None:
+            self.limiter.pause(seconds)
+    
+    @staticmethod
+    def _is_success(response: Any) -> bool:
+        status = getattr(response, "status_code", None)
+        return not (isinstance(status, int) and status >= 500)
+    
+    def _record_outcome(self, response: Any, endpoint: Optional[str] = None, elapsed: float = 0.0) -> bool:
+        """Raportează răspunsul către circuit breaker; True dacă răspunsul nu este 5xx.
         
-        return {
+        Doar 502/503/504 înseamnă Alfresco indisponibil; orice alt răspuns (și un 500) dovedește că funcționează.
+        """
+        if getattr(response, "status_code", None) in BREAKER_STATUSES:
+            self.breaker.record_failure()
+            return False
+        self.breaker.record_success()
+        if not self._is_success(response):
+            return False
+        if endpoint is not None:
+            self.latency.observe(endpoint, elapsed)
+        return True
+    
+    async def list_root_children(self, max_items: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Listează conținutul root-ului"""
+        return await self.get_node_children("-root-", max_items, cursor)
+    
+    async def get_node_children(self, node_id: str, max_items: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Obține copiii unui nod, începând de la cursor și parcurgând câte pagini sunt necesare (cel mult max_items)"""
+        skip_count = self._decode_cursor(cursor)
+        max_items = min(max_items, self.max_items)
+        
+        items = []
+        has_more = False
+        async with aclosing(self.iter_children_pages(node_id, skip_count, max_items)) as pages:
+            async for page in pages:
+                for entry in page.get("entries", []):
+                    items.append(self._format_child(entry["entry"]))
+                has_more = page.get("pagination", {}).get("hasMoreItems", False)
+        
+        result = {
             "parent_id": node_id,
             "items": items,
             "total": len(items),
             "message": f"Am găsit {len(items)} elemente în nodul {node_id}"
         }
+        
+        # Cursorul pentru pagina următoare este poziția primului element nereturnat
+        if has_more:
+            result["next_cursor"] = str(skip_count + len(items))
+            result["message"] += " (mai sunt elemente, folosește next_cursor)"
+        
+        return result
+    
+    async def iter_node_children(self, node_id: str, skip_count: int = 0, limit: Optional[int] = None,
+                                 page_size: Optional[int] = None, window: Optional[int] = None,
+                                 cache: bool = True, projection: Projection = LISTING) -> AsyncIterator[Dict[str, Any]]:
+        """Generator asincron care returnează copiii unui folder element cu element, pe măsură ce sosesc paginile"""
+        async with aclosing(self.iter_children_pages(node_id, skip_count, limit, page_size, window, cache, projection)) as pages:
+            async for page in pages:
+                for entry in page.get("entries", []):
+                    yield self._format_child(entry["entry"])
+    
+    async def iter_children_pages(self, node_id: str, skip_count: int = 0, limit: Optional[int] = None,
+                                  page_size: Optional[int] = None, window: Optional[int] = None,
+                                  cache: bool = True, projection: Projection = LISTING) -> AsyncIterator[Dict[str, Any]]:
+        """Parcurge list.pagination în ordine; paginile următoare se cer concurent, în fereastra de prefetch.
+        
+        Memoria rămâne limitată la cel mult `window` pagini în așteptare. Cu cache=False paginile se
+        citesc direct din Alfresco și nu intră în cache (parcurgeri în fundal care altfel ar evacua
+        intrările folosite de chat, respectiv sincronizarea oglinzii). `projection` alege câmpurile cerute.
+        """
+        page_size = page_size or self.page_size
+        window = max(1, window or self.prefetch_window)
+        end = skip_count + limit if limit is not None else None
+        
+        def page_items(skip: int) -> int:
+            return page_size if end is None else min(page_size, end - skip)
+        
+        # Prima pagină se cere singură: aflăm dacă mai există elemente și, eventual, totalItems
+        size = page_items(skip_count)
+        if size <= 0:
+            return
+        page = await self._fetch_children_page(node_id, skip_count, size, cache, projection)
+        yield page
+        
+        pagination = page.get("pagination", {})
+        if not pagination.get("hasMoreItems") or not page.get("entries"):
+            return
+        
+        total = pagination.get("totalItems")
+        if total is not None:
+            end = total if end is None else min(end, total)
+        
+        next_skip = skip_count + size
+        pending = deque()
+        
+        def schedule():
+            nonlocal next_skip
+            while len(pending) < window:
+                size = page_items(next_skip)
+                if size <= 0:
+                    break
+                pending.append(asyncio.create_task(self._fetch_children_page(node_id, next_skip, size, cache, projection)))
+                next_skip += size
+        
+        try:
+            schedule()
+            while pending:
+                page = await pending.popleft()
+                yield page
+                if not page.get("pagination", {}).get("hasMoreItems") or not page.get("entries"):
+                    break
+                schedule()
+        finally:
+            # Consumatorul s-a oprit sau listarea s-a terminat: anulăm prefetch-ul rămas
+            for task in pending:
+                task.cancel()
+    
+    async def _fetch_children_page(self, node_id: str, skip_count: int, max_items: int,
+                                   cache: bool = True, projection: Projection = LISTING,
+                                   refresh: bool = False) -> Dict[str, Any]:
+        """Obține o singură pagină (obiectul 'list') din listarea unui nod, din oglindă sau cache dacă e posibil.
+        
+        Cache-ul de listări ține doar pagini cu proiecția LISTING; celelalte proiecții citesc direct.
+        Cu refresh=True pagina se citește din Alfresco și înlocuiește ce era în cache.
+        """
+        cache = cache and projection is LISTING
+        if cache and not refresh:
+            if self.mirror is not None:
+                mirrored = self.mirror.page(node_id, skip_count, max_items)
+                if mirrored is not None:
+                    return mirrored
+            cached = self.cache.get_listing(node_id, skip_count, max_items)
+            if cached is not None:
+                return cached
+        
+        path = nodes_path(node_id, "children")
+        
+        params = {
+            "maxItems": max_items,
+            "skipCount": skip_count,
+            **projection.params()
+        }
+        
+        response = await self._send("GET", path, "read", params=params)
+        response.raise_for_status()
+        
+        page = projection.apply_page(JsonCodec.parse_response(response).get("list", {}))
+        if cache:
+            self.cache.set_listing(node_id, skip_count, max_items, page)
+        self._index_entries(node_id, page.get("entries", []))
+        return page
+    
+    def _index_entries(self, parent_id: str, entries: List[Dict[str, Any]]):
+        """Alimentează indexurile de căi și de nume cu intrările unei listări"""
+        self.path_index.add_children(parent_id, entries)
+        self.name_index.add_entries(parent_id, entries)
+        if self.search_index is not None:
+            self.search_index.add_entries(parent_id, entries)
+    
+    @staticmethod
+    def _decode_cursor(cursor: Optional[str]) -> int:
+        """Cursorul de paginare este poziția (skipCount) de la care se continuă listarea"""
+        if cursor in (None, ""):
+            return 0
+        try:
+            skip_count = int(cursor)
+        except (TypeError, ValueError):
+            raise ValueError(f"Cursor invalid: {cursor}")
+        if skip_count < 0:
+            raise ValueError(f"Cursor invalid: {cursor}")
+        return skip_count
+    
+    @staticmethod
+    def _format_child(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Formatează o intrare din listare să fie mai ușor de citit"""
+        item_info = {
+            "id": node.get("id"),
+            "name": node.get("name"),
+            "type": "folder" if node.get("isFolder") else "file",
+            "nodeType": node.get("nodeType"),
+            "created": node.get("createdAt"),
+            "modified": node.get("modifiedAt"),
+            "createdBy": node.get("createdByUser", {}).get("displayName"),
+            "modifiedBy": node.get("modifiedByUser", {}).get("displayName"),
+        }
+        
+        # Adaugă informații specifice fișierelor
+        if not node.get("isFolder") and "content" in node:
+            item_info.update({
+                "size": node["content"].get("sizeInBytes"),
+                "mimeType": node["content"].get("mimeType"),
+                "encoding": node["content"].get("encoding")
+            })
+        
+        # Adaugă path dacă este disponibil
+        if "path" in node:
+            item_info["path"] = node["path"].get("name")
+        
+        return item_info
     
     async def create_folder(self, name: str, parent_id: str = "-root-", title: str = None, description: str = None) -> Dict[str, Any]:
         """Creează un folder nou"""
-        url = urljoin(self.base_url, f"/alfresco/api/-default-/public/alfresco/versions/1/nodes/{parent_id}/children")
+        path = nodes_path(parent_id, "children")
         
         folder_data = {
             "name": name,
@@ -306,10 +672,13 @@ class MinimalAlfrescoServer:
             if description:
                 folder_data["properties"]["cm:description"] = description
         
-        response = await self.client.post(url, json=folder_data)
+        response = await self._send("POST", path, "write", json=folder_data)
         response.raise_for_status()
         
-        result = response.json()
+        result = JsonCodec.parse_response(response)
+        
+        self._remember_node(result["entry"]["id"], result["entry"]["name"], True, parent_id,
+                            folder_data.get("properties"))
         
         return {
             "created": True,
@@ -319,20 +688,134 @@ class MinimalAlfrescoServer:
             "message": f"Folderul '{name}' a fost creat cu succes"
         }
     
-    async def get_node_info(self, node_id: str) -> Dict[str, Any]:
-        """Obține informații detaliate despre un nod"""
-        url = urljoin(self.base_url, f"/alfresco/api/-default-/public/alfresco/versions/1/nodes/{node_id}")
+    @background_job
+    async def create_folder_tree(self, tree: List[Dict[str, Any]], parent_id: str = "-root-") -> Dict[str, Any]:
+        """Creează o ierarhie de foldere nivel cu nivel; folderele unui nivel se creează concurent"""
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.bulk_concurrency)
+        created_ids = set()
+        items = []
+        depth = 0
         
-        params = {
-            "include": "properties,aspectNames,path,permissions,allowableOperations"
+        level = [(parent_id, "", spec) for spec in tree]
+        while level:
+            depth += 1
+            # O listare (din cache dacă e posibil) per părinte, ca să sărim peste folderele existente
+            parents = list(dict.fromkeys(parent for parent, _, _ in level))
+            listings = await asyncio.gather(
+                *(self._child_folders(parent) if parent not in created_ids else self._no_children()
+                  for parent in parents),
+                return_exceptions=True
+            )
+            existing = dict(zip(parents, listings))
+            
+            outcomes = await asyncio.gather(*(
+                self._create_tree_node(semaphore, parent, prefix, spec, existing[parent])
+                for parent, prefix, spec in level
+            ))
+            
+            next_level = []
+            for (parent, prefix, spec), outcome in zip(level, outcomes):
+                items.append(outcome)
+                children = spec.get("children") or []
+                if outcome["id"]:
+                    if outcome["status"] == "created":
+                        created_ids.add(outcome["id"])
+                    next_level.extend((outcome["id"], outcome["name"], child) for child in children)
+                else:
+                    items.extend(self._skipped_tree_nodes(outcome["name"], children))
+            level = next_level
+        
+        counts = {}
+        for item in items:
+            counts[item["status"]] = counts.get(item["status"], 0) + 1
+        summary = ", ".join(f"{count} {status}" for status, count in counts.items())
+        
+        return {
+            "parent_id": parent_id,
+            "items": items,
+            "total": len(items),
+            "counts": counts,
+            "message": f"Structură procesată în {depth} niveluri și {time.monotonic() - started:.2f}s: {summary}"
         }
+    
+    async def _create_tree_node(self, semaphore: asyncio.Semaphore, parent_id: str, prefix: str,
+                                spec: Dict[str, Any], existing: Any) -> Dict[str, Any]:
+        """Creează un singur folder din specificație și întoarce rezultatul lui"""
+        name = spec.get("name")
+        path = f"{prefix}/{name}" if prefix else (name or "")
+        result = {"name": path, "type": "folder", "id": None}
         
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
+        if not name:
+            return dict(result, status="failed", error="Lipsește numele folderului")
+        if isinstance(existing, Exception):
+            return dict(result, status="failed", error=f"Nu pot lista părintele: {existing}")
+        if name.casefold() in existing:
+            return dict(result, id=existing[name.casefold()], status="exists")
         
-        node = response.json()["entry"]
+        async with semaphore:
+            try:
+                created = await self.create_folder(name, parent_id, spec.get("title"), spec.get("description"))
+                return dict(result, id=created["folder_id"], status="created")
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 409:
+                    # Creat între timp de altcineva: îl căutăm direct în Alfresco
+                    folders = await self._child_folders(parent_id, cache=False)
+                    if name.casefold() in folders:
+                        return dict(result, id=folders[name.casefold()], status="exists")
+                return dict(result, status="failed", error=str(e))
+            except Exception as e:
+                return dict(result, status="failed", error=str(e))
+    
+    async def _child_folders(self, parent_id: str, cache: bool = True) -> Dict[str, str]:
+        """Subfolderele unui folder, după nume (case-insensitive, ca în Alfresco)"""
+        folders = {}
+        async with aclosing(self.iter_node_children(parent_id, cache=cache)) as children:
+            async for item in children:
+                if item["type"] == "folder":
+                    folders[item["name"].casefold()] = item["id"]
+        return folders
+    
+    @staticmethod
+    async def _no_children() -> Dict[str, str]:
+        return {}
+    
+    @staticmethod
+    def _skipped_tree_nodes(prefix: str, children: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Descendenții unui folder eșuat nu se mai încearcă"""
+        skipped = []
+        stack = [(prefix, child) for child in children]
+        while stack:
+            parent_path, spec = stack.pop()
+            path = f"{parent_path}/{spec.get('name', '')}"
+            skipped.append({"name": path, "type": "folder", "id": None, "status": "skipped"})
+            stack.extend((path, child) for child in spec.get("children") or [])
+        return skipped
+    
+    async def get_node_info(self, node_id: str) -> Dict[str, Any]:
+        """Obține informații detaliate despre un nod"""
+        node = self._cached_node(node_id)
+        if node is None:
+            node = await self._fetch_node(node_id, NODE_INFO)
         
-        # Formatează informațiile
+        return {
+            "node": self._describe_node(node),
+            "message": f"Informații pentru nodul '{node.get('name')}'",
+            "items": [
+                {"label": "ID", "value": node.get("id")},
+                {"label": "Tip", "value": "folder" if node.get("isFolder") else "file"},
+                {"label": "Tip nod", "value": node.get("nodeType")},
+                {"label": "Creat la", "value": node.get("createdAt")},
+                {"label": "Modificat la", "value": node.get("modifiedAt")},
+                {"label": "Creat de", "value": node.get("createdByUser", {}).get("displayName")},
+                {"label": "Modificat de", "value": node.get("modifiedByUser", {}).get("displayName")},
+                {"label": "ID Părinte", "value": node.get("parentId")}
+            ]
+        }
+    
+    @staticmethod
+    def _describe_node(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Informațiile unui nod (intrare NODE_INFO) într-o formă ușor de citit"""
         info = {
             "id": node.get("id"),
             "name": node.get("name"),
@@ -367,32 +850,309 @@ class MinimalAlfrescoServer:
             if "cm:description" in props:
                 info["properties"]["description"] = props["cm:description"]
         
+        return info
+    
+    async def get_nodes_info(self, node_ids: List[str], concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """Informațiile mai multor noduri într-un singur apel: ID-uri deduplicate, cache-ul întâi, restul concurent"""
+        unique_ids = list(dict.fromkeys(node_id for node_id in node_ids if node_id))
+        if len(unique_ids) > MAX_BULK_OPERATIONS:
+            raise ValueError(f"Prea multe noduri ({len(unique_ids)}); maximul este {MAX_BULK_OPERATIONS}")
+        
+        started = time.monotonic()
+        limit = min(concurrency or self.bulk_concurrency, self.bulk_concurrency)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        cached = 0
+        
+        async def describe(node_id: str) -> Dict[str, Any]:
+            nonlocal cached
+            node = self._cached_node(node_id)
+            try:
+                if node is None:
+                    async with semaphore:
+                        node = await self._fetch_node(node_id, NODE_INFO)
+                else:
+                    cached += 1
+                return dict(self._describe_node(node), status="ok")
+            except httpx.HTTPStatusError as e:
+                error = "nu există" if e.response.status_code == 404 else f"HTTP {e.response.status_code}"
+                return {"id": node_id, "status": "failed", "error": error}
+            except Exception as e:
+                return {"id": node_id, "status": "failed", "error": str(e)}
+        
+        nodes = await asyncio.gather(*(describe(node_id) for node_id in unique_ids))
+        failed = [node for node in nodes if node["status"] != "ok"]
+        
         return {
-            "node": info,
-            "message": f"Informații pentru nodul '{node.get('name')}'",
-            "items": [
-                {"label": "ID", "value": node.get("id")},
-                {"label": "Tip", "value": "folder" if node.get("isFolder") else "file"},
-                {"label": "Tip nod", "value": node.get("nodeType")},
-                {"label": "Creat la", "value": node.get("createdAt")},
-                {"label": "Modificat la", "value": node.get("modifiedAt")},
-                {"label": "Creat de", "value": node.get("createdByUser", {}).get("displayName")},
-                {"label": "Modificat de", "value": node.get("modifiedByUser", {}).get("displayName")},
-                {"label": "ID Părinte", "value": node.get("parentId")}
-            ]
+            "nodes": nodes,
+            # Doar eșecurile ca elemente; nodurile găsite sunt în tabel
+            "items": [{"name": node["id"], "type": "?", "id": node["id"], "status": "failed",
+                       "error": node["error"]} for node in failed],
+            "text": self._nodes_table([node for node in nodes if node["status"] == "ok"]),
+            "total": len(nodes),
+            "message": (f"{len(nodes) - len(failed)}/{len(nodes)} noduri ({cached} din cache) "
+                        f"în {time.monotonic() - started:.2f}s"
+                        + (f"; {len(node_ids) - len(unique_ids)} ID-uri duplicate ignorate" if len(node_ids) > len(unique_ids) else ""))
         }
     
+    @staticmethod
+    def _nodes_table(nodes: List[Dict[str, Any]]) -> str:
+        """Tabel compact (o linie per nod) pentru get_nodes_info"""
+        lines = ["ID | Nume | Tip | Mărime | Modificat | Cale"]
+        for node in nodes:
+            size = (node.get("content") or {}).get("size")
+            lines.append(" | ".join(str(value) if value is not None else "-" for value in (
+                node["id"], node["name"], node["type"], size, node.get("modified"), node.get("path")
+            )))
+        return "\n".join(lines)
+    
+    def _cached_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Intrarea unui nod din oglindă (dacă e proaspătă) sau din cache"""
+        if self.mirror is not None:
+            entry = self.mirror.entry(node_id)
+            if entry is not None:
+                return entry
+        return self.cache.get_node(node_id)
+    
+    async def _fetch_node(self, node_id: str, projection: Projection = NODE_INFO, cache: bool = True) -> Dict[str, Any]:
+        """Citește intrarea unui nod din Alfresco; cu cache=True (și proiecția NODE_INFO) o și păstrează în cache"""
+        path = nodes_path(node_id)
+        
+        response = await self._send("GET", path, "read", params=projection.params())
+        response.raise_for_status()
+        
+        node = projection.apply(JsonCodec.parse_response(response)["entry"])
+        if cache and projection is NODE_INFO:
+            self.cache.set_node(node_id, node)
+        return node
+    
+    def _change_source(self, kind: str, folders: Optional[List[str]], audit_app: str) -> Any:
+        if kind == "search":
+            return SearchChangeFeed(self._send, folders or ())
+        if kind == "audit":
+            return AuditChangeFeed(self._send, audit_app)
+        raise ValueError(f"Flux de modificări necunoscut: {kind} (search sau audit)")
+
+    def start_change_feed(self) -> Optional[asyncio.Task]:
+        """Pornește interogarea periodică a fluxului de modificări (fluxul 'search' cere Search API)"""
+        if isinstance(self.change_feed.feed, SearchChangeFeed) and not self.search_available:
+            print("⚠️ Fluxul de modificări 'search' nu pornește: Search API indisponibil", file=sys.stderr)
+            return None
+        return self.change_feed.start()
+
+    async def apply_change(self, change: Change):
+        """O modificare din flux: invalidează exact nodul, vechiul și noul părinte, căile și indexurile lui"""
+        node_id = change["id"]
+        if change.get("deleted"):
+            self._forget_node(node_id, deleted=True)
+            return
+        if change.get("moved"):
+            # Vechiul loc dispare din cache și din căi; noul loc se află mai jos
+            self._forget_node(node_id)
+        if not change.get("parentId") or not change.get("name"):
+            # Fluxul de audit dă doar ID-ul: părintele și numele se citesc din Alfresco
+            try:
+                change = dict(change, **await self._fetch_node(node_id, SEARCH, cache=False))
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                self._forget_node(node_id, deleted=True)
+                return
+        # Intrarea nodului și listările în care apărea (inclusiv ale vechiului părinte, la mutare)
+        self.cache.invalidate_node(node_id)
+        self._remember_node(node_id, change["name"], bool(change.get("isFolder")), change.get("parentId"),
+                            change.get("properties"))
+
+    def schedule_revalidation(self, kind: str, key: Any):
+        """O intrare expirată, încărcată de pe disc, a fost servită: o recitește în fundal din Alfresco"""
+        self._revalidation_queue[(kind, key)] = None
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._revalidation_task is None or self._revalidation_task.done():
+            self._revalidation_task = asyncio.create_task(self._revalidate_stale())
+
+    @background_job
+    async def _revalidate_stale(self):
+        """Golește coada de revalidare, cu câțiva workeri în paralel (prioritate de fundal)"""
+        async def worker():
+            while self._revalidation_queue:
+                kind, key = next(iter(self._revalidation_queue))
+                del self._revalidation_queue[(kind, key)]
+                await self._revalidate(kind, key)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.walk_concurrency, len(self._revalidation_queue)))))
+
+    async def _revalidate(self, kind: str, key: Any):
+        node_id = key[0] if kind == "listing" else key
+        try:
+            if kind == "listing":
+                await self._fetch_children_page(*key, refresh=True)
+            else:
+                node = await self._fetch_node(node_id)
+                if kind == "path" and node.get("parentId"):
+                    self.path_index.add(node["parentId"], node["id"], node["name"], bool(node.get("isFolder")))
+            self.revalidated += 1
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                # Nodul a dispărut cât serverul era oprit
+                self._forget_node(node_id, deleted=True)
+            else:
+                print(f"⚠️ Revalidare eșuată pentru {kind} {node_id}: {e}", file=sys.stderr)
+        except (httpx.HTTPError, CircuitOpenError) as e:
+            print(f"⚠️ Revalidare eșuată pentru {kind} {node_id}: {e}", file=sys.stderr)
+
+    async def get_content(self, node_id: str, offset: int = 0, length: Optional[int] = None,
+                          max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Previzualizare a conținutului unui fișier, plafonată la un buget de bytes"""
+        budget = min(max_bytes or self.content_preview_bytes, self.content_preview_bytes)
+        if length is not None:
+            budget = min(budget, length)
+        
+        download = await self.download_content(node_id, offset, length, max_bytes=budget)
+        try:
+            data = download["file"].read()
+        finally:
+            download["file"].close()
+        
+        end = offset + len(data) - 1
+        size = download["size"]
+        result = {
+            "id": node_id,
+            "mime_type": download["mime_type"],
+            "size": size,
+            "offset": offset,
+            "bytes": len(data),
+            "truncated": download["truncated"],
+            "text": None,
+        }
+        
+        if self._is_text_mime(download["mime_type"]):
+            # Decodorul incremental nu emite un caracter multi-byte tăiat la capătul bugetului
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            result["text"] = decoder.decode(data, final=not download["truncated"])
+            message = f"Conținut text, bytes {offset}-{max(end, offset)}"
+        else:
+            message = f"Conținut binar ({download['mime_type']}), {len(data)} bytes citiți"
+        
+        if size is not None:
+            message += f" din {size}"
+        if download["truncated"]:
+            message += f" (trunchiat la {len(data)} bytes; folosește offset={offset + len(data)} pentru continuare)"
+        result["message"] = message
+        return result
+    
+    async def read_content_resource(self, uri: str) -> Dict[str, Any]:
+        """Citește resursa alfresco://nodes/{id}/content, plafonată la content_max_bytes"""
+        if not (uri.startswith(CONTENT_URI_PREFIX) and uri.endswith(CONTENT_URI_SUFFIX)):
+            raise ValueError(f"Resursă necunoscută: {uri}")
+        node_id = uri[len(CONTENT_URI_PREFIX):-len(CONTENT_URI_SUFFIX)]
+        if not node_id or "/" in node_id:
+            raise ValueError(f"Resursă necunoscută: {uri}")
+        
+        download = await self.download_content(node_id, max_bytes=self.content_max_bytes)
+        try:
+            data = download["file"].read()
+        finally:
+            download["file"].close()
+        
+        content = {"uri": uri, "mimeType": download["mime_type"]}
+        if self._is_text_mime(download["mime_type"]):
+            content["text"] = data.decode("utf-8", errors="replace")
+        else:
+            content["blob"] = base64.b64encode(data).decode()
+        return content
+    
+    @staticmethod
+    def content_resource_template() -> Dict[str, Any]:
+        return {
+            "uriTemplate": f"{CONTENT_URI_PREFIX}{{node_id}}{CONTENT_URI_SUFFIX}",
+            "name": "Conținut document Alfresco",
+            "description": "Conținutul unui fișier din Alfresco, după ID-ul nodului",
+        }
+    
+    async def download_content(self, node_id: str, offset: int = 0, length: Optional[int] = None,
+                               max_bytes: Optional[int] = None) -> Dict[str, Any]:
+        """Descarcă (o parte din) conținutul unui nod în stream, într-un fișier temporar.
+        
+        Corpul nu e ținut niciodată întreg în memorie: bucățile se scriu într-un SpooledTemporaryFile
+        care trece pe disc peste content_spool_bytes. Returnează fișierul poziționat la început
+        (apelantul îl închide) plus tipul MIME, dimensiunea totală și dacă s-a atins max_bytes.
+        """
+        path = nodes_path(node_id, "content")
+        offset = max(0, offset)
+        wanted = length if length is not None else None
+        if max_bytes is not None:
+            wanted = max_bytes if wanted is None else min(wanted, max_bytes)
+        
+        headers = {"Accept": "*/*"}
+        if offset or wanted is not None:
+            last = f"{offset + wanted - 1}" if wanted else ""
+            headers["Range"] = f"bytes={offset}-{last}"
+        
+        spool = tempfile.SpooledTemporaryFile(max_size=self.content_spool_bytes)
+        received = 0
+        truncated = False
+        try:
+            async with self._stream("GET", path, "content", params={"attachment": "false"}, headers=headers) as response:
+                response.raise_for_status()
+                mime_type = response.headers.get("content-type", "application/octet-stream").split(";")[0].strip()
+                size = self._content_size(response)
+                # Serverul a ignorat Range-ul (200 în loc de 206): sărim singuri peste offset
+                to_skip = offset if response.status_code == 200 else 0
+                
+                async for chunk in response.aiter_bytes(CONTENT_CHUNK_SIZE):
+                    if to_skip:
+                        skipped = min(to_skip, len(chunk))
+                        chunk = chunk[skipped:]
+                        to_skip -= skipped
+                    if wanted is not None and received + len(chunk) > wanted:
+                        chunk = chunk[:wanted - received]
+                    spool.write(chunk)
+                    received += len(chunk)
+                    if wanted is not None and received >= wanted:
+                        break
+        except BaseException:
+            spool.close()
+            raise
+        
+        # Trunchiat = intervalul cerut e mai mare decât bugetul max_bytes
+        if max_bytes is not None and received >= max_bytes:
+            if length is not None:
+                truncated = length > received
+            else:
+                truncated = size is None or size - offset > received
+        
+        spool.seek(0)
+        return {"file": spool, "mime_type": mime_type, "size": size, "received": received, "truncated": truncated}
+    
+    @staticmethod
+    def _content_size(response) -> Optional[int]:
+        """Dimensiunea totală a conținutului, din Content-Range (206) sau Content-Length (200)"""
+        content_range = response.headers.get("content-range")
+        if content_range:
+            match = re.match(r"bytes\s+\d+-\d+/(\d+)", content_range)
+            return int(match.group(1)) if match else None
+        content_length = response.headers.get("content-length")
+        return int(content_length) if content_length and content_length.isdigit() else None
+    
+    @staticmethod
+    def _is_text_mime(mime_type: str) -> bool:
+        return mime_type.startswith("text/") or mime_type in TEXT_MIME_TYPES or mime_type.endswith("+json")
+    
     async def delete_node(self, node_id: str, permanent: bool = False) -> Dict[str, Any]:
         """Șterge un nod"""
-        url = urljoin(self.base_url, f"/alfresco/api/-default-/public/alfresco/versions/1/nodes/{node_id}")
+        path = nodes_path(node_id)
         
         params = {}
         if permanent:
             params["permanent"] = "true"
         
-        response = await self.client.delete(url, params=params)
+        response = await self._send("DELETE", path, "write", params=params)
         response.raise_for_status()
         
+        self._forget_node(node_id, deleted=True)
+        
         return {
             "deleted": True,
             "node_id": node_id,
@@ -400,60 +1160,1013 @@ class MinimalAlfrescoServer:
             "message": f"Nodul {node_id} a fost șters {'permanent' if permanent else '(în trash)'}"
         }
     
+    async def move_node(self, node_id: str, target_id: str, name: Optional[str] = None) -> Dict[str, Any]:
+        """Mută un nod în alt folder (opțional cu nume nou)"""
+        path = nodes_path(node_id, "move")
+        
+        body = {"targetParentId": target_id}
+        if name:
+            body["name"] = name
+        
+        response = await self._send("POST", path, "write", json=body)
+        response.raise_for_status()
+        
+        entry = JsonCodec.parse_response(response)["entry"]
+        self._forget_node(node_id)
+        self._remember_node(entry["id"], entry["name"], bool(entry.get("isFolder")), target_id)
+        
+        return {
+            "moved": True,
+            "node_id": entry["id"],
+            "target_id": target_id,
+            "message": f"Nodul '{entry['name']}' a fost mutat în {target_id}"
+        }
+    
+    async def copy_node(self, node_id: str, target_id: str, name: Optional[str] = None) -> Dict[str, Any]:
+        """Copiază un nod în alt folder (opțional cu nume nou)"""
+        path = nodes_path(node_id, "copy")
+        
+        body = {"targetParentId": target_id}
+        if name:
+            body["name"] = name
+        
+        response = await self._send("POST", path, "write", json=body)
+        response.raise_for_status()
+        
+        entry = JsonCodec.parse_response(response)["entry"]
+        self._remember_node(entry["id"], entry["name"], bool(entry.get("isFolder")), target_id)
+        
+        return {
+            "copied": True,
+            "node_id": entry["id"],
+            "source_id": node_id,
+            "target_id": target_id,
+            "message": f"Nodul {node_id} a fost copiat ca '{entry['name']}' în {target_id}"
+        }
+    
+    async def update_node(self, node_id: str, properties: Optional[Dict[str, Any]] = None,
+                          name: Optional[str] = None) -> Dict[str, Any]:
+        """Actualizează numele și/sau proprietățile unui nod (title/description sunt prescurtări pentru cm:*)"""
+        path = nodes_path(node_id)
+        
+        body = {}
+        if name:
+            body["name"] = name
+        if properties:
+            body["properties"] = {
+                key if ":" in key else f"cm:{key}": value for key, value in properties.items()
+            }
+        
+        response = await self._send("PUT", path, "write", json=body)
+        response.raise_for_status()
+        
+        entry = JsonCodec.parse_response(response)["entry"]
+        self.cache.invalidate_node(node_id)
+        self._remember_node(entry["id"], entry["name"], bool(entry.get("isFolder")), entry.get("parentId"),
+                            entry.get("properties") or body.get("properties"))
+        
+        return {
+            "updated": True,
+            "node_id": entry["id"],
+            "message": f"Nodul '{entry['name']}' a fost actualizat"
+        }
+    
+    @background_job
+    async def bulk_mutate(self, operations: List[Dict[str, Any]], concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """Execută concurent (cu limită) o listă de operații delete/move/copy/update"""
+        if len(operations) > MAX_BULK_OPERATIONS:
+            raise ValueError(f"Prea multe operații ({len(operations)}); maximul este {MAX_BULK_OPERATIONS}")
+        
+        started = time.monotonic()
+        limit = min(concurrency or self.bulk_concurrency, self.bulk_concurrency)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def run(operation: Dict[str, Any]) -> Dict[str, Any]:
+            op = operation.get("op")
+            node_id = operation.get("node_id")
+            item = {"name": node_id or "?", "type": op or "?", "id": node_id}
+            try:
+                if not node_id:
+                    raise ValueError("Lipsește node_id")
+                async with semaphore:
+                    if op == "delete":
+                        await self.delete_node(node_id, operation.get("permanent", False))
+                    elif op in ("move", "copy"):
+                        if not operation.get("target_id"):
+                            raise ValueError("Lipsește target_id")
+                        method = self.move_node if op == "move" else self.copy_node
+                        result = await method(node_id, operation["target_id"], operation.get("name"))
+                        item["id"] = result["node_id"]
+                    elif op == "update":
+                        await self.update_node(node_id, operation.get("properties"), operation.get("name"))
+                    else:
+                        raise ValueError(f"Operație necunoscută: {op}")
+                return dict(item, status="ok")
+            except httpx.HTTPStatusError as e:
+                return dict(item, status="failed", error=f"HTTP {e.response.status_code}")
+            except Exception as e:
+                return dict(item, status="failed", error=str(e))
+        
+        items = await asyncio.gather(*(run(operation) for operation in operations))
+        failed = sum(1 for item in items if item["status"] != "ok")
+        
+        return {
+            "items": items,
+            "total": len(items),
+            "succeeded": len(items) - failed,
+            "failed": failed,
+            "message": f"{len(items) - failed}/{len(items)} operații reușite în {time.monotonic() - started:.2f}s (concurență {limit})"
+        }
+    
+    @background_job
+    async def upload_content(self, files: List[Dict[str, Any]], parent_id: str = "-root-", overwrite: bool = False,
+                             concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """Încarcă concurent (cu limită) fișiere locale, fiecare în stream direct din mmap"""
+        if not self.upload_root:
+            raise ValueError("Upload-ul de fișiere locale este dezactivat: setați ALFRESCO_UPLOAD_ROOT")
+        if len(files) > MAX_BULK_OPERATIONS:
+            raise ValueError(f"Prea multe fișiere ({len(files)}); maximul este {MAX_BULK_OPERATIONS}")
+        
+        started = time.monotonic()
+        limit = min(concurrency or self.bulk_concurrency, self.bulk_concurrency)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def run(spec: Dict[str, Any]) -> Dict[str, Any]:
+            path = spec.get("path") or ""
+            item = {"name": spec.get("name") or os.path.basename(path) or "?", "type": "file", "id": None, "size": 0}
+            try:
+                async with semaphore:
+                    entry = await self._upload_file(self._upload_path(path), item["name"],
+                                                    spec.get("parent_id") or parent_id, overwrite, item)
+                item["id"] = entry["id"]
+                return dict(item, status="ok")
+            except httpx.HTTPStatusError as e:
+                return dict(item, status="failed", error=f"HTTP {e.response.status_code}")
+            except Exception as e:
+                return dict(item, status="failed", error=str(e))
+        
+        items = await asyncio.gather(*(run(spec) for spec in files))
+        elapsed = time.monotonic() - started
+        failed = sum(1 for item in items if item["status"] != "ok")
+        uploaded = sum(item["size"] for item in items if item["status"] == "ok")
+        throughput = uploaded / elapsed if elapsed > 0 else 0.0
+        
+        return {
+            "items": items,
+            "total": len(items),
+            "succeeded": len(items) - failed,
+            "failed": failed,
+            "bytes": uploaded,
+            "bytes_per_second": round(throughput),
+            "message": (f"{len(items) - failed}/{len(items)} fișiere încărcate, {uploaded / 1048576:.1f} MB "
+                        f"în {elapsed:.2f}s ({throughput / 1048576:.1f} MB/s, concurență {limit})")
+        }
+    
+    async def _upload_file(self, file_path: str, name: str, parent_id: str, overwrite: bool,
+                           item: Dict[str, Any]) -> Dict[str, Any]:
+        """Un singur upload multipart spre /nodes/{parent}/children"""
+        path = nodes_path(parent_id, "children")
+        fields = {"name": name, "nodeType": "cm:content", "overwrite": "true" if overwrite else "false"}
+        
+        with MmapMultipartBody(file_path, fields, filename=name) as body:
+            item["size"] = body.size
+            response = await self._send("POST", path, "upload", content=body, headers=body.headers)
+            response.raise_for_status()
+        
+        entry = JsonCodec.parse_response(response)["entry"]
+        self._remember_node(entry["id"], entry["name"], False, parent_id)
+        return entry
+    
+    def _upload_path(self, path: str) -> str:
+        """Calea reală a fișierului de încărcat (cu symlink-urile rezolvate); în afara upload_root este refuzată"""
+        if not path:
+            raise ValueError("Lipsește path")
+        real_path = os.path.realpath(path)
+        if not self.upload_root or os.path.commonpath([self.upload_root, real_path]) != self.upload_root:
+            raise ValueError(f"Calea {path} este în afara directorului permis pentru upload")
+        if not os.path.isfile(real_path):
+            raise ValueError(f"Fișierul {path} nu există")
+        return real_path
+    
+    def _remember_node(self, node_id: str, name: str, is_folder: bool, parent_id: Optional[str],
+                       properties: Optional[Dict[str, Any]] = None):
+        """Un nod a apărut sau s-a schimbat sub parent_id: actualizează cache-ul, indexurile și oglinda"""
+        if not parent_id:
+            return
+        # Listările părintelui s-au decalat, iar modifiedAt-ul lui s-a schimbat
+        self.cache.invalidate_node(parent_id)
+        self.path_index.add(parent_id, node_id, name, is_folder)
+        self.name_index.add(node_id, name, "folder" if is_folder else "file", parent_id)
+        if self.search_index is not None:
+            properties = properties or {}
+            self.search_index.add(node_id, name, "folder" if is_folder else "file", parent_id,
+                                  properties.get("cm:title"), properties.get("cm:description"))
+        if self.mirror is not None:
+            self.mirror.mark_dirty(parent_id)
+    
+    def _forget_node(self, node_id: str, deleted: bool = False):
+        """Un nod a dispărut din locul lui: îl scoate din cache, indexuri și oglindă"""
+        self.cache.invalidate_node(node_id)
+        self.path_index.remove(node_id)
+        # La ștergere dispare și tot subarborele; la mutare descendenții rămân valabili
+        self.name_index.remove(node_id, subtree=deleted)
+        if self.search_index is not None:
+            self.search_index.remove(node_id, subtree=deleted)
+        if self.mirror is not None:
+            self.mirror.remove(node_id)
+    
     async def get_node_id_by_name(self, name: str) -> Dict[str, Any]:
-        """Caută în root node-ul cu un anumit nume și returnează ID-ul său"""
-        children = await self.get_node_children("-root-", 30)
-        for item in children.get("items", []):
-            if item["name"] == name:
-                return {
-                    "id": item["id"],
-                    "name": item["name"],
-                    "type": item["type"],
-                    "message": f"Nodul '{name}' are ID-ul: {item['id']} (tip: {item['type']})"
+        """Caută în indexul de nume al depozitului nodul cu un anumit nume și returnează ID-ul său"""
+        if self.name_index.is_missing(name):
+            return self._name_not_found(name)
+        
+        matches = self.name_index.exact(name) or self.name_index.case_insensitive(name)
+        if not matches and not self.name_index.complete:
+            # Crawl-ul nu s-a terminat încă: căutăm și direct în root
+            children = await self.get_node_children("-root-", self.page_size)
+            for item in children.get("items", []):
+                self.name_index.add(item["id"], item["name"], item["type"], children.get("parent_id"))
+            matches = self.name_index.exact(name) or self.name_index.case_insensitive(name)
+        
+        if not matches:
+            self.name_index.mark_missing(name)
+            return self._name_not_found(name)
+        
+        node = matches[0]
+        result = {
+            "id": node["id"],
+            "name": node["name"],
+            "type": node["type"],
+            "message": f"Nodul '{node['name']}' are ID-ul: {node['id']} (tip: {node['type']})"
+        }
+        if len(matches) > 1:
+            result["items"] = [
+                {"id": match["id"], "name": match["name"], "type": match["type"]} for match in matches
+            ]
+            result["message"] += f". Există {len(matches)} noduri cu acest nume"
+        return result
+    
+    def _name_not_found(self, name: str) -> Dict[str, Any]:
+        """Răspuns pentru un nume inexistent, cu sugestii din potrivirea aproximativă"""
+        suggestions = self.name_index.fuzzy(name)
+        where = "în depozit" if self.name_index.complete else "în root"
+        result = {
+            "error": True,
+            "message": f"Nodul '{name}' nu a fost găsit {where}"
+        }
+        if suggestions:
+            result["message"] += ". Poate te referi la: " + ", ".join(f"'{s['name']}'" for s in suggestions)
+            result["items"] = [
+                {"id": s["id"], "name": s["name"], "type": s["type"]} for s in suggestions
+            ]
+        return result
+    
+    def tool_definitions(self) -> List[Dict[str, Any]]:
+        """Definițiile tool-urilor, o singură listă pentru serverul MCP și cel HTTP"""
+        tools = [
+            {
+                "name": "list_root_children",
+                "description": "Listează fișierele și folderele din root-ul Alfresco",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "maxItems": {
+                            "type": "integer",
+                            "description": "Numărul maxim de elemente de returnat (default: 20)",
+                            "default": 20
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Numărul de elemente de returnat, parcurgând mai multe pagini (înlocuiește maxItems)"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursorul 'next_cursor' dintr-un răspuns anterior, pentru pagina următoare"
+                        }
+                    }
+                }
+            },
+            {
+                "name": "get_node_children",
+                "description": "Listează conținutul unui folder specific",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_id": {
+                            "type": "string",
+                            "description": "ID-ul nodului/folderului"
+                        },
+                        "maxItems": {
+                            "type": "integer",
+                            "description": "Numărul maxim de elemente",
+                            "default": 20
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Numărul de elemente de returnat, parcurgând mai multe pagini (înlocuiește maxItems)"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursorul 'next_cursor' dintr-un răspuns anterior, pentru pagina următoare"
+                        }
+                    },
+                    "required": ["node_id"]
+                }
+            },
+            {
+                "name": "create_folder",
+                "description": "Creează un folder nou",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Numele folderului"
+                        },
+                        "parent_id": {
+                            "type": "string",
+                            "description": "ID-ul folderului părinte (default: -root-)",
+                            "default": "-root-"
+                        },
+                        "title": {
+                            "type": "string",
+                            "description": "Titlul folderului (opțional)"
+                        },
+                        "description": {
+                            "type": "string",
+                            "description": "Descrierea folderului (opțional)"
+                        }
+                    },
+                    "required": ["name"]
+                }
+            },
+            {
+                "name": "get_node_info",
+                "description": "Obține informații despre un nod/fișier/folder specific",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_id": {
+                            "type": "string",
+                            "description": "ID-ul nodului"
+                        }
+                    },
+                    "required": ["node_id"]
+                }
+            },
+            {
+                "name": "get_nodes_info",
+                "description": "Obține într-un singur apel informațiile mai multor noduri (tabel compact), în loc de get_node_info repetat",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_ids": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "ID-urile nodurilor (duplicatele sunt ignorate)"
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Câte noduri se citesc în paralel (opțional)"
+                        }
+                    },
+                    "required": ["node_ids"]
                 }
+            },
+            {
+                "name": "delete_node",
+                "description": "Șterge un nod/fișier/folder",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_id": {
+                            "type": "string",
+                            "description": "ID-ul nodului de șters"
+                        },
+                        "permanent": {
+                            "type": "boolean",
+                            "description": "Ștergere permanentă (default: false - merge în trash)",
+                            "default": False
+                        }
+                    },
+                    "required": ["node_id"]
+                }
+            },
+            {
+                "name": "get_node_id_by_name",
+                "description": "Returnează ID-ul unui fișier sau folder Alfresco după nume (în tot depozitul, tolerant la greșeli de scriere)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Numele nodului (fișier sau folder)"
+                        }
+                    },
+                    "required": ["name"]
+                }
+            },
+            {
+                "name": "search_nodes",
+                "description": "Caută fișiere și foldere după cuvinte din nume, titlu sau descriere (index local, rezultate ordonate după relevanță)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Cuvintele căutate (ex: raport buget 2024); se potrivesc și ca prefix"
+                        },
+                        "maxItems": {
+                            "type": "integer",
+                            "description": "Numărul maxim de rezultate",
+                            "default": 20
+                        },
+                        "type": {
+                            "type": "string",
+                            "enum": ["file", "folder"],
+                            "description": "Doar fișiere sau doar foldere (opțional)"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            },
+            {
+                "name": "browse_by_path",
+                "description": "Navighează la un folder folosind calea (path) în loc de ID",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "Calea folderului (ex: /Company Home/Sites/test-site)",
+                            "default": "/"
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Numărul de elemente de returnat din folder"
+                        },
+                        "cursor": {
+                            "type": "string",
+                            "description": "Cursorul 'next_cursor' dintr-un răspuns anterior, pentru pagina următoare"
+                        }
+                    }
+                }
+            },
+            {
+                "name": "complete_path",
+                "description": "Sugerează căi existente care încep cu un prefix (autocompletare)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "prefix": {
+                            "type": "string",
+                            "description": "Începutul căii (ex: /Company Home/Sites/te)",
+                            "default": "/"
+                        }
+                    }
+                }
+            },
+            {
+                "name": "create_folder_tree",
+                "description": "Creează dintr-un singur apel o structură întreagă de foldere (folderele existente sunt păstrate)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "tree": {
+                            "type": "array",
+                            "description": "Folderele de creat: [{name, title?, description?, children?: [...]}]",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string"},
+                                    "title": {"type": "string"},
+                                    "description": {"type": "string"},
+                                    "children": {"type": "array", "items": {"type": "object"}}
+                                },
+                                "required": ["name"]
+                            }
+                        },
+                        "parent_id": {
+                            "type": "string",
+                            "description": "ID-ul folderului în care se creează structura (default: -root-)",
+                            "default": "-root-"
+                        }
+                    },
+                    "required": ["tree"]
+                }
+            },
+            {
+                "name": "bulk_mutate",
+                "description": "Execută dintr-un singur apel multe operații pe noduri: delete, move, copy, update",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "description": "Operațiile: [{op: delete|move|copy|update, node_id, target_id?, name?, properties?, permanent?}]",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "op": {"type": "string", "enum": ["delete", "move", "copy", "update"]},
+                                    "node_id": {"type": "string"},
+                                    "target_id": {"type": "string", "description": "Folderul destinație (move/copy)"},
+                                    "name": {"type": "string", "description": "Nume nou (opțional)"},
+                                    "properties": {"type": "object", "description": "Proprietăți de actualizat (update)"},
+                                    "permanent": {"type": "boolean", "description": "Ștergere permanentă (delete)"}
+                                },
+                                "required": ["op", "node_id"]
+                            }
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Câte operații rulează simultan (plafonat de configurația serverului)"
+                        }
+                    },
+                    "required": ["operations"]
+                }
+            },
+            {
+                "name": "list_subtree",
+                "description": "Listează recursiv conținutul unui folder pe mai multe niveluri, într-un singur apel",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_id": {
+                            "type": "string",
+                            "description": "ID-ul folderului de start (default: -root-)",
+                            "default": "-root-"
+                        },
+                        "max_depth": {
+                            "type": "integer",
+                            "description": "Adâncimea maximă a parcurgerii (default: 3)",
+                            "default": 3
+                        },
+                        "max_nodes": {
+                            "type": "integer",
+                            "description": "Numărul maxim de noduri returnate (default: 200)",
+                            "default": 200
+                        }
+                    }
+                }
+            },
+            {
+                "name": "get_content",
+                "description": "Citește conținutul unui fișier (previzualizare text, opțional doar un interval de bytes)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "node_id": {
+                            "type": "string",
+                            "description": "ID-ul fișierului"
+                        },
+                        "offset": {
+                            "type": "integer",
+                            "description": "Byte-ul de la care începe citirea (default: 0)",
+                            "default": 0
+                        },
+                        "length": {
+                            "type": "integer",
+                            "description": "Câți bytes se citesc (opțional)"
+                        },
+                        "max_bytes": {
+                            "type": "integer",
+                            "description": "Câți bytes intră în previzualizare (opțional)"
+                        }
+                    },
+                    "required": ["node_id"]
+                }
+            },
+            {
+                "name": "upload_content",
+                "description": "Încarcă unul sau mai multe fișiere locale în Alfresco (concurent, în stream)",
+                "inputSchema": {
+                    "type": "object",
+                    "properties": {
+                        "files": {
+                            "type": "array",
+                            "description": "Fișierele de încărcat",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "path": {"type": "string", "description": "Calea fișierului local"},
+                                    "name": {"type": "string", "description": "Numele în Alfresco (default: numele fișierului)"},
+                                    "parent_id": {"type": "string", "description": "Folderul destinație pentru acest fișier"}
+                                },
+                                "required": ["path"]
+                            }
+                        },
+                        "parent_id": {
+                            "type": "string",
+                            "description": "Folderul destinație (default: -root-)",
+                            "default": "-root-"
+                        },
+                        "overwrite": {
+                            "type": "boolean",
+                            "description": "Suprascrie fișierele existente cu același nume (default: false)",
+                            "default": False
+                        },
+                        "concurrency": {
+                            "type": "integer",
+                            "description": "Câte fișiere se încarcă în paralel (opțional)"
+                        }
+                    },
+                    "required": ["files"]
+                }
+            },
+            self.continue_tool_definition()
+        ]
+        # Fără director de upload configurat, tool-ul de upload nici nu se anunță modelului
+        if not self.upload_root:
+            tools = [tool for tool in tools if tool["name"] != "upload_content"]
+        # Tool-ul Search API apare doar dacă sonda a găsit Search Services
+        if self.search_available:
+            tools.append(self.search_tool_definition())
+        return tools
+    
+    @staticmethod
+    def tool_context(name: str, arguments: Dict[str, Any]) -> str:
+        """Contextul rezultatului unui tool în răspunsul formatat (același pe MCP și HTTP)"""
+        if name == "list_root_children":
+            return "root folder"
+        if name == "get_node_children":
+            return f"folder {arguments.get('node_id')}"
+        if name == "get_nodes_info":
+            return f"information for {len(arguments.get('node_ids') or [])} nodes"
+        if name == "get_node_id_by_name":
+            return f"node ID for name '{arguments.get('name')}'"
+        if name == "search":
+            return f"search API '{arguments.get('query')}'"
+        if name == "search_nodes":
+            return f"search '{arguments.get('query')}'"
+        if name == "browse_by_path":
+            return f"path {arguments.get('path', '/')}"
+        if name == "complete_path":
+            return f"path completion {arguments.get('prefix', '/')}"
+        if name == "list_subtree":
+            return f"subtree {arguments.get('node_id', '-root-')}"
+        if name == "get_content":
+            return f"content {arguments.get('node_id')}"
         return {
-            "error": True,
-            "message": f"Nodul '{name}' nu a fost găsit în root"
+            "create_folder": "folder creation",
+            "get_node_info": "node information",
+            "delete_node": "node deletion",
+            "create_folder_tree": "folder tree creation",
+            "bulk_mutate": "bulk operations",
+            "upload_content": "content upload"
+        }.get(name, name)
+    
+    @staticmethod
+    def search_tool_definition() -> Dict[str, Any]:
+        """Definiția tool-ului `search`, comună serverului MCP și celui HTTP"""
+        return {
+            "name": "search",
+            "description": "Caută în tot depozitul printr-o singură interogare Alfresco Search (AFTS sau CMIS), cu paginare și fațete",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Interogarea, ex: TYPE:'cm:content' AND cm:name:raport* sau SELECT * FROM cmis:document"
+                    },
+                    "language": {
+                        "type": "string",
+                        "enum": ["afts", "cmis", "lucene"],
+                        "description": "Limbajul interogării (default: afts)",
+                        "default": "afts"
+                    },
+                    "maxItems": {
+                        "type": "integer",
+                        "description": "Numărul maxim de rezultate pe pagină",
+                        "default": 20
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "Cursorul (next_cursor) primit anterior, pentru pagina următoare"
+                    },
+                    "facets": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Câmpuri pentru fațete, ex: [\"content.mimetype\", \"creator\"] (opțional)"
+                    }
+                },
+                "required": ["query"]
+            }
         }
+
+    @staticmethod
+    def continue_tool_definition() -> Dict[str, Any]:
+        """Definiția tool-ului `continue`, comună serverului MCP și celui HTTP"""
+        return {
+            "name": "continue",
+            "description": "Continuă un răspuns trunchiat: returnează următoarea bucată după cursorul 'continuation'",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "cursor": {
+                        "type": "string",
+                        "description": "Valoarea 'continuation' din răspunsul anterior (expiră după câteva minute)"
+                    }
+                },
+                "required": ["cursor"]
+            }
+        }
+
+    async def probe_search(self) -> bool:
+        """Verifică dacă Search API răspunde (instalările minimale nu au Search Services)"""
+        body = {"query": {"query": "cm:name:*", "language": "afts"}, "paging": {"maxItems": 1, "skipCount": 0},
+                "fields": ["id"]}
+        try:
+            response = await self._send("POST", SEARCH_API, "read", json=body)
+            self.search_available = response.status_code == 200
+        except (httpx.HTTPError, CircuitOpenError):
+            self.search_available = False
+        print(f"🔎 Search API {'disponibil' if self.search_available else 'indisponibil'}", file=sys.stderr)
+        return self.search_available
     
-    async def browse_by_path(self, path: str = "/") -> Dict[str, Any]:
-        """Navighează folosind path-ul"""
-        # Pentru configurația minimală, încercăm să găsim nodul după path
-        # Aceasta este o funcție simplificată
+    async def search(self, query: str, language: str = "afts", max_items: int = 20, cursor: Optional[str] = None,
+                     facets: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Interogare AFTS / CMIS prin Search API, paginată pe server; fațetele se păstrează în cache (TTL scurt)"""
+        if not self.search_available:
+            raise ValueError("Search API nu este disponibil (Alfresco Search Services nu rulează)")
+        if language not in ("afts", "cmis", "lucene"):
+            raise ValueError(f"Limbaj de interogare necunoscut: {language} (afts, cmis sau lucene)")
         
-        if path == "/" or path == "":
-            # Root
-            return await self.list_root_children()
+        skip_count = self._decode_cursor(cursor)
+        facet_fields = tuple(facets or ())
+        facet_key = (language, query, facet_fields)
+        cached_facets = self.facet_cache.get(facet_key) if facet_fields else None
+        
+        body = {
+            "query": {"query": query, "language": language},
+            "paging": {"maxItems": max_items, "skipCount": skip_count},
+            "fields": list(SEARCH_HITS.fields),
+            "include": list(SEARCH_HITS.include)
+        }
+        if facet_fields and cached_facets is None:
+            body["facetFields"] = {"facets": [{"field": field} for field in facet_fields]}
+        
+        started = time.monotonic()
+        response = await self._send("POST", SEARCH_API, "read", json=body)
+        response.raise_for_status()
+        page = JsonCodec.parse_response(response).get("list", {})
+        
+        if facet_fields and cached_facets is None:
+            cached_facets = self._parse_facets(page.get("context", {}))
+            self.facet_cache.set(facet_key, cached_facets)
+        
+        items = []
+        for wrapper in page.get("entries", []):
+            item = self._format_child(SEARCH_HITS.apply(wrapper.get("entry", {})))
+            if item.get("path"):
+                item["snippet"] = item["path"]
+            items.append(item)
         
-        # Încercăm să găsim path-ul prin Company Home
-        # Aceasta este o implementare simplificată
+        pagination = page.get("pagination", {})
+        total = pagination.get("totalItems", skip_count + len(items))
+        result = {
+            "items": items,
+            "total": total,
+            "query": query,
+            "message": f"{len(items)} din {total} rezultate pentru '{query}' în {time.monotonic() - started:.2f}s"
+        }
+        if pagination.get("hasMoreItems"):
+            result["next_cursor"] = str(skip_count + len(items))
+        if cached_facets:
+            result["facets"] = cached_facets
+        return result
+    
+    @staticmethod
+    def _parse_facets(context: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+        """context.facetsFields -> {câmp: [{value, count}, ...]}"""
+        facets = {}
+        for field in context.get("facetsFields", []):
+            facets[field.get("label")] = [
+                {"value": bucket.get("label"), "count": bucket.get("count")} for bucket in field.get("buckets", [])
+            ]
+        return facets
+    
+    async def search_nodes(self, query: str, max_items: int = 20, node_type: Optional[str] = None) -> Dict[str, Any]:
+        """Caută în indexul full-text local după nume, titlu și descriere (fără Alfresco Search Services)"""
+        if self.search_index is None:
+            raise ValueError("Indexul de căutare este dezactivat (ALFRESCO_SEARCH_INDEX=false)")
+        if node_type not in (None, "", "file", "folder"):
+            raise ValueError(f"Tip necunoscut: {node_type} (file sau folder)")
+        
+        started = time.monotonic()
+        matches = self.search_index.search(query, max(1, max_items), node_type or None)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        
+        items = []
+        for match in matches:
+            item = {"id": match["id"], "name": match["name"], "type": match["type"], "score": match["score"]}
+            details = [detail for detail in (self.path_index.path_of(match["id"]), match["title"]) if detail]
+            if details:
+                item["snippet"] = " | ".join(details)
+            items.append(item)
+        
+        scope = "" if self.name_index.complete else " (indexarea depozitului este încă în curs)"
+        return {
+            "items": items,
+            "total": len(items),
+            "query": query,
+            "message": f"{len(items)} rezultate pentru '{query}' în {elapsed_ms:.1f} ms{scope}"
+        }
+    
+    def start_name_index_crawl(self) -> asyncio.Task:
+        """Pornește (o singură dată) crawl-ul în fundal care construiește indexul de nume"""
+        if self._name_crawl_task is None or self._name_crawl_task.done():
+            self._name_crawl_task = asyncio.create_task(self._crawl_name_index())
+        return self._name_crawl_task
+    
+    @background_job
+    async def _crawl_name_index(self, root_id: str = ROOT_ID):
+        """Parcurge tot depozitul; listările alimentează indexurile prin _index_entries"""
         try:
-            # Căutăm în root pentru "Company Home"
-            root_children = await self.get_node_children("-root-", 100)
-            
-            company_home_id = None
-            for item in root_children["items"]:
-                if item["name"] == "Company Home" and item["type"] == "folder":
-                    company_home_id = item["id"]
-                    break
-            
-            if not company_home_id:
-                return {
-                    "error": True,
-                    "message": "Nu am găsit 'Company Home' în root. Pentru configurația minimală folosește ID-uri de noduri."
-                }
+            # Cu indexul full-text activ, crawl-ul aduce și titlul / descrierea
+            projection = SEARCH if self.search_index is not None else NAMES
+            async with aclosing(self.walk_subtree(root_id, max_depth=None, max_nodes=None, cache=False,
+                                                  projection=projection)) as levels:
+                async for _ in levels:
+                    pass
+            self.name_index.complete = True
+            print(f"✅ Index de nume construit: {self.name_index.stats()['nodes']} noduri", file=sys.stderr)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"⚠️ Crawl index de nume întrerupt: {e}", file=sys.stderr)
+    
+    async def list_subtree(self, node_id: str = ROOT_ID, max_depth: int = 3, max_nodes: int = 200) -> Dict[str, Any]:
+        """Listează recursiv un subarbore într-un singur apel (BFS, cu limită de adâncime și de noduri)"""
+        started = time.monotonic()
+        items = []
+        depth_reached = 0
+        truncated = False
+        
+        async with aclosing(self.walk_subtree(node_id, max_depth, max_nodes)) as levels:
+            async for level in levels:
+                items.extend(level["items"])
+                depth_reached = level["depth"]
+                truncated = level["truncated"]
+        
+        message = f"Am găsit {len(items)} noduri pe {depth_reached} niveluri în {time.monotonic() - started:.2f}s"
+        if truncated:
+            message += f" (limita de {max_nodes} noduri a fost atinsă)"
+        
+        return {
+            "root_id": node_id,
+            "items": items,
+            "total": len(items),
+            "depth": depth_reached,
+            "truncated": truncated,
+            "message": message
+        }
+    
+    async def walk_subtree(self, node_id: str = ROOT_ID, max_depth: Optional[int] = 3, max_nodes: Optional[int] = 200,
+                           cache: bool = True, projection: Projection = LISTING) -> AsyncIterator[Dict[str, Any]]:
+        """Parcurgere BFS: folderele unui nivel se listează concurent, iar fiecare nivel e returnat când se termină.
+        
+        Fiecare element primește calea relativă la nodul de start în câmpul 'name'.
+        """
+        semaphore = asyncio.Semaphore(self.walk_concurrency)
+        remaining = max_nodes
+        frontier = [(node_id, "")]
+        visited = {node_id}
+        depth = 0
+        
+        async def list_folder(folder_id: str, budget: Optional[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                children = []
+                async with aclosing(self.iter_node_children(folder_id, limit=budget, cache=cache,
+                                                            projection=projection)) as items:
+                    async for item in items:
+                        children.append(item)
+                return children
+        
+        while frontier and (max_depth is None or depth < max_depth):
+            if remaining is not None and remaining <= 0:
+                break
+            depth += 1
+            listings = await asyncio.gather(*(list_folder(folder_id, remaining) for folder_id, _ in frontier))
             
-            # Pentru simplitate, returnăm conținutul Company Home
-            result = await self.get_node_children(company_home_id)
-            result["message"] = f"Navighează la path: {path} (Company Home)"
-            return result
+            level_items = []
+            next_frontier = []
+            truncated = False
+            for (_, prefix), children in zip(frontier, listings):
+                for child in children:
+                    if remaining is not None and len(level_items) >= remaining:
+                        truncated = True
+                        break
+                    path = f"{prefix}/{child['name']}" if prefix else child["name"]
+                    level_items.append(dict(child, name=path, depth=depth))
+                    if child["type"] == "folder" and child["id"] not in visited:
+                        visited.add(child["id"])
+                        next_frontier.append((child["id"], path))
             
+            if remaining is not None:
+                remaining -= len(level_items)
+            yield {"depth": depth, "items": level_items, "truncated": truncated or (remaining is not None and remaining <= 0 and bool(next_frontier))}
+            frontier = next_frontier
+    
+    async def browse_by_path(self, path: str = "/", max_items: int = 20, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Navighează folosind path-ul: rezolvă calea la un nod și îi listează conținutul"""
+        try:
+            node_id = await self.resolve_path(path)
         except Exception as e:
             return {
                 "error": True,
-                "message": f"Nu pot naviga la path-ul '{path}': {str(e)}. În configurația minimală, folosește tool-ul 'get_node_children' cu ID-uri specifice."
+                "message": f"Nu pot naviga la path-ul '{path}': {str(e)}"
+            }
+        
+        if node_id is None:
+            message = f"Path-ul '{path}' nu există"
+            suggestions = self.path_index.complete(path, 5)
+            if suggestions:
+                message += ". Căi apropiate: " + ", ".join(suggestions)
+            return {
+                "error": True,
+                "message": message
             }
         
+        if node_id == ROOT_ID:
+            return await self.list_root_children(max_items, cursor)
+        
+        if self.path_index.is_folder(node_id) is False:
+            return await self.get_node_info(node_id)
+        
+        result = await self.get_node_children(node_id, max_items, cursor)
+        result["message"] = f"Navighează la path: {self.path_index.path_of(node_id) or path} - {result['message']}"
+        return result
+    
+    async def resolve_path(self, path: str) -> Optional[str]:
+        """Rezolvă o cale la ID-ul nodului: din index, apoi cu un singur apel relativePath, apoi segment cu segment"""
+        segments = PathIndex.split(path)
+        node_id, depth = self.path_index.lookup(segments)
+        if depth == len(segments):
+            return node_id
+        
+        remaining = segments[depth:]
+        rest_path = nodes_path(node_id)
+        params = {
+            "relativePath": "/".join(remaining),
+            **PATH.params()
+        }
+        
+        response = await self._send("GET", rest_path, "read", params=params)
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                return None
+            # relativePath nesuportat sau refuzat: coborâm segment cu segment
+            return await self._walk_path(node_id, remaining)
+        
+        node = PATH.apply(JsonCodec.parse_response(response)["entry"])
+        self.path_index.add_path_elements(node.get("path", {}).get("elements", []), node)
+        return node["id"]
+    
+    async def _walk_path(self, node_id: str, segments: List[str]) -> Optional[str]:
+        """Rezolvare de rezervă: listează fiecare folder de pe cale până găsește segmentul următor"""
+        for segment in segments:
+            found = None
+            async with aclosing(self.iter_node_children(node_id)) as children:
+                async for item in children:
+                    if item["name"].casefold() == segment.casefold():
+                        found = item
+                        break
+            if found is None:
+                return None
+            node_id = found["id"]
+        return node_id
+    
+    async def complete_path(self, prefix: str, limit: int = 20) -> Dict[str, Any]:
+        """Completează un prefix de cale pe baza indexului (listează folderul părinte dacă e nevoie)"""
+        parent_path = PathIndex.join(self.path_index.parent_segments(prefix))
+        parent_id = await self.resolve_path(parent_path)
+        
+        matches = self.path_index.complete(prefix, limit)
+        if not matches and parent_id is not None and self.path_index.is_folder(parent_id) is not False:
+            # Folderul părinte nu e încă în index: o listare (din cache dacă e caldă) îl populează
+            async with aclosing(self.iter_node_children(parent_id, limit=self.page_size * self.prefetch_window)) as children:
+                async for _ in children:
+                    pass
+            matches = self.path_index.complete(prefix, limit)
+        
+        items = []
+        for match in matches:
+            node_id = self.path_index.resolve(match)
+            items.append({
+                "id": node_id,
+                "name": match,
+                "type": "folder" if match.endswith("/") else "file"
+            })
+        
+        return {
+            "prefix": prefix,
+            "items": items,
+            "total": len(items),
+            "message": f"Am găsit {len(items)} căi care încep cu '{prefix}'"
+        }
+        
     def format_simple_response(self, result: Any, context: str = "") -> Dict[str, Any]:
         """Formatează un răspuns simplificat, text-based, pentru modele LLM mici"""
         if isinstance(result, dict):
@@ -466,16 +2179,35 @@ class MinimalAlfrescoServer:
                     name = item.get("name", "")
                     node_type = item.get("type", "")
                     node_id = item.get("id", "")
-                    simplified_items.append(f"- {name} [{node_type}] (ID: {node_id})")
+                    line = f"- {name} [{node_type}] (ID: {node_id})"
+                    if item.get("snippet"):
+                        line += f" — {item['snippet']}"
+                    if item.get("status"):
+                        line += f" - {item['status']}"
+                    if item.get("error"):
+                        line += f": {item['error']}"
+                    simplified_items.append(line)
                 elif "label" in item and "value" in item:
                     # E o informație cheie-valoare
                     simplified_items.append(f"{item['label']}: {item['value']}")
 
-            return {
+            response = {
                 "context": context,
                 "summary": message,
                 "items": simplified_items
             }
+            if result.get("next_cursor"):
+                response["next_cursor"] = result["next_cursor"]
+            if result.get("bytes_per_second") is not None:
+                response["throughput"] = f"{result['bytes_per_second'] / 1048576:.1f} MB/s"
+            if result.get("text") is not None:
+                response["text"] = result["text"]
+            if result.get("facets"):
+                response["facets"] = {
+                    field: [f"{bucket['value']} ({bucket['count']})" for bucket in buckets]
+                    for field, buckets in result["facets"].items()
+                }
+            return response
 
         elif isinstance(result, str):
             return {
@@ -489,8 +2221,49 @@ class MinimalAlfrescoServer:
                 "data": result
             }
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistici interne (cache etc.) pentru dimensionare și debug"""
+        return {
+            "cache": self.cache.stats(),
+            "path_index": self.path_index.stats(),
+            "persistent_cache": dict(self.persistent_cache.stats(), revalidated=self.revalidated,
+                                     revalidation_queue=len(self._revalidation_queue))
+            if self.persistent_cache else None,
+            "name_index": self.name_index.stats(),
+            "search_index": self.search_index.stats() if self.search_index else None,
+            "search_api": {"available": self.search_available, "facet_cache": self.facet_cache.stats()},
+            "output_budget": self.output_budget.stats(),
+            "mirror": self.mirror.stats() if self.mirror else None,
+            "transport": self.transport.stats(self.client),
+            "single_flight": self.single_flight.stats() if self.single_flight else None,
+            "resilience": {
+                "retries": self.retry.retries,
+                "breaker": self.breaker.stats(),
+                "latency": self.latency.stats(),
+                "hedging": self.hedge.stats() if self.hedge else None
+            },
+            "rate_limiter": self.limiter.stats(),
+            "concurrency": self.concurrency.stats() if self.concurrency else None,
+            "endpoints": self.endpoints.stats(),
+            "change_feed": self.change_feed.stats() if self.change_feed else None,
+            "json_codec": JsonCodec.BACKEND
+        }
+    
     async def cleanup(self):
         """Curăță resursele"""
+        if self._name_crawl_task and not self._name_crawl_task.done():
+            self._name_crawl_task.cancel()
+        if self._revalidation_task and not self._revalidation_task.done():
+            self._revalidation_task.cancel()
+        if self.mirror:
+            await self.mirror.stop()
+        if self.change_feed:
+            await self.change_feed.stop()
+        await self.endpoints.stop()
+        if self.search_index is not None:
+            self.search_index.close()
+        if self.persistent_cache is not None:
+            self.persistent_cache.close()
         if self.client:
             await self.client.aclose()
     
@@ -0,0 +1,86 @@
+"""
+Corp multipart/form-data pentru upload, citit direct dintr-un fișier mapat în memorie (mmap)
+"""
+import mimetypes
+import mmap
+import os
+import uuid
+from typing import AsyncIterator, Dict, Optional
+
+# Câți bytes din fișier se trimit într-o bucată
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class MmapMultipartBody:
+    """Corpul unui upload multipart: câmpurile text, apoi fișierul, trimis pe bucăți din mmap.
+
+    Fișierul nu e citit niciodată întreg într-un obiect bytes; în memorie ajunge doar bucata
+    curentă. Lungimea totală este cunoscută dinainte, deci cererea pleacă cu Content-Length.
+    """
+
+    def __init__(self, path: str, fields: Dict[str, str], file_field: str = "filedata",
+                 filename: Optional[str] = None, content_type: Optional[str] = None,
+                 chunk_size: int = UPLOAD_CHUNK_SIZE):
+        self.path = path
+        self.filename = filename or os.path.basename(path)
+        self.file_content_type = content_type or mimetypes.guess_type(self.filename)[0] or "application/octet-stream"
+        self.chunk_size = chunk_size
+        self.boundary = uuid.uuid4().hex
+
+        self._file = open(path, "rb")
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+            # mmap nu acceptă fișiere goale
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else None
+        except BaseException:
+            self._file.close()
+            raise
+
+        head = []
+        for name, value in fields.items():
+            head.append(self._part_header(f'name="{name}"') + str(value).encode("utf-8") + b"\r\n")
+        head.append(self._part_header(
+            f'name="{file_field}"; filename="{self._quote(self.filename)}"', self.file_content_type
+        ))
+        self._head = b"".join(head)
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("ascii")
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> int:
+        return len(self._head) + self.size + len(self._tail)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Content-Type": self.content_type, "Content-Length": str(self.content_length)}
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self._head
+        for offset in range(0, self.size, self.chunk_size):
+            yield self._map[offset:offset + self.chunk_size]
+        yield self._tail
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "MmapMultipartBody":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _part_header(self, disposition: str, content_type: Optional[str] = None) -> bytes:
+        header = f"--{self.boundary}\r\nContent-Disposition: form-data; {disposition}\r\n"
+        if content_type:
+            header += f"Content-Type: {content_type}\r\n"
+        return (header + "\r\n").encode("utf-8")
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\r", " ").replace("\n", " ")
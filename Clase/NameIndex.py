@@ -0,0 +1,173 @@
+"""
+Index de nume pentru tot depozitul Alfresco: căutare exactă, case-insensitive și tolerantă la greșeli
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+
+def trigrams(text: str) -> Set[str]:
+    """Trigramele unui nume (normalizat, cu margini) pentru potrivirea aproximativă"""
+    padded = f"  {text.casefold()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """Index în memorie nume -> noduri, cu index de trigrame și cache negativ"""
+
+    def __init__(self, negative_ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        # id -> {"id", "name", "type", "parent_id"}
+        self._nodes: Dict[str, Dict[str, Any]] = {}
+        # parent_id -> ID-urile copiilor cunoscuți (pentru ștergerea unui subarbore)
+        self._children: Dict[str, Set[str]] = {}
+        # nume normalizat (casefold) -> ID-urile nodurilor cu acest nume
+        self._by_name: Dict[str, Set[str]] = {}
+        # trigramă -> numele normalizate care o conțin
+        self._trigrams: Dict[str, Set[str]] = {}
+        # nume normalizat -> momentul până la care știm că nu există
+        self._missing: Dict[str, float] = {}
+        # True după ce crawl-ul complet al depozitului s-a terminat
+        self.complete = False
+
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+
+    # --- Actualizare ---
+
+    def add(self, node_id: str, name: str, node_type: str, parent_id: Optional[str] = None):
+        if not node_id or not name:
+            return
+        previous = self._nodes.get(node_id)
+        if previous and previous["name"] != name:
+            self.remove(node_id)
+        elif previous and previous["parent_id"] != parent_id:
+            self._unlink(node_id, previous["parent_id"])
+
+        self._nodes[node_id] = {"id": node_id, "name": name, "type": node_type, "parent_id": parent_id}
+        if parent_id:
+            self._children.setdefault(parent_id, set()).add(node_id)
+        key = name.casefold()
+        ids = self._by_name.setdefault(key, set())
+        if not ids:
+            for gram in trigrams(key):
+                self._trigrams.setdefault(gram, set()).add(key)
+        ids.add(node_id)
+        self._missing.pop(key, None)
+
+    def add_entries(self, parent_id: str, entries: List[Dict[str, Any]]):
+        """Înregistrează intrările unei pagini de listare ('list.entries')"""
+        for wrapper in entries:
+            entry = wrapper.get("entry", wrapper)
+            self.add(entry.get("id"), entry.get("name"),
+                     "folder" if entry.get("isFolder") else "file",
+                     entry.get("parentId") or parent_id)
+
+    def remove(self, node_id: str, subtree: bool = False):
+        """Scoate un nod; cu subtree=True (ștergere) și tot ce se știe sub el"""
+        if subtree:
+            pending = [node_id]
+            while pending:
+                current = pending.pop()
+                pending.extend(self._children.pop(current, ()))
+                self._remove_one(current)
+        else:
+            self._remove_one(node_id)
+
+    def _remove_one(self, node_id: str):
+        node = self._nodes.pop(node_id, None)
+        if node is None:
+            return
+        self._unlink(node_id, node["parent_id"])
+        key = node["name"].casefold()
+        ids = self._by_name.get(key)
+        if ids is None:
+            return
+        ids.discard(node_id)
+        if not ids:
+            del self._by_name[key]
+            for gram in trigrams(key):
+                names = self._trigrams.get(gram)
+                if names is not None:
+                    names.discard(key)
+                    if not names:
+                        del self._trigrams[gram]
+
+    def _unlink(self, node_id: str, parent_id: Optional[str]):
+        siblings = self._children.get(parent_id)
+        if siblings is not None:
+            siblings.discard(node_id)
+            if not siblings:
+                del self._children[parent_id]
+
+    def mark_missing(self, name: str):
+        """Cache negativ: numele nu există (până la expirarea TTL-ului sau până apare în index)"""
+        if self.negative_ttl > 0:
+            self._missing[name.casefold()] = self.clock() + self.negative_ttl
+
+    def clear(self):
+        self._nodes.clear()
+        self._children.clear()
+        self._by_name.clear()
+        self._trigrams.clear()
+        self._missing.clear()
+        self.complete = False
+
+    # --- Interogare ---
+
+    def is_missing(self, name: str) -> bool:
+        key = name.casefold()
+        expires_at = self._missing.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= self.clock():
+            del self._missing[key]
+            return False
+        self.negative_hits += 1
+        return True
+
+    def exact(self, name: str) -> List[Dict[str, Any]]:
+        """Nodurile cu exact acest nume (sensibil la majuscule)"""
+        return [node for node in self.case_insensitive(name, count=False) if node["name"] == name]
+
+    def case_insensitive(self, name: str, count: bool = True) -> List[Dict[str, Any]]:
+        ids = self._by_name.get(name.casefold(), set())
+        if count:
+            if ids:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return [self._nodes[node_id] for node_id in sorted(ids)]
+
+    def fuzzy(self, name: str, limit: int = 5, min_score: float = 0.3) -> List[Dict[str, Any]]:
+        """Nume apropiate după similaritatea Jaccard a trigramelor"""
+        query = trigrams(name)
+        overlaps: Dict[str, int] = {}
+        for gram in query:
+            for key in self._trigrams.get(gram, ()):
+                overlaps[key] = overlaps.get(key, 0) + 1
+
+        scored = []
+        for key, overlap in overlaps.items():
+            score = overlap / (len(query) + len(trigrams(key)) - overlap)
+            if score >= min_score:
+                scored.append((score, key))
+        scored.sort(key=lambda pair: (-pair[0], pair[1]))
+
+        results = []
+        for score, key in scored[:limit]:
+            for node_id in sorted(self._by_name[key]):
+                results.append(dict(self._nodes[node_id], score=round(score, 3)))
+        return results[:limit]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "nodes": len(self._nodes),
+            "names": len(self._by_name),
+            "complete": self.complete,
+            "hits": self.hits,
+            "misses": self.misses,
+            "negative_entries": len(self._missing),
+            "negative_hits": self.negative_hits
+        }
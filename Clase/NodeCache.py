@@ -0,0 +1,293 @@
+"""
+Cache în memorie pentru metadatele nodurilor Alfresco (TTL + LRU)
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from Clase.PersistentCache import PersistentCache
+
+# Apelat cu (tipul, cheia) unei intrări servite de pe disc deja expirate, ca serverul să o revalideze în fundal
+Revalidate = Callable[[str, Hashable], None]
+
+
+class LRUTTLCache:
+    """Cache mărginit: intrările expiră după TTL, iar la depășirea capacității se elimină cea mai veche folosită"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic,
+                 on_discard: Optional[Callable[[Hashable, Any], None]] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        # Apelat cu (cheie, valoare) când o intrare iese din cache: înlocuită, evacuată, expirată sau scoasă
+        self.on_discard = on_discard
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returnează valoarea dacă există și nu a expirat; o marchează ca folosită recent"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self._discarded(key, value)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Adaugă sau înlocuiește o intrare"""
+        if not self.enabled:
+            return
+
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._discarded(key, previous[1])
+        self._entries[key] = (self.clock() + (ttl if ttl is not None else self.ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, (_, evicted_value) = self._entries.popitem(last=False)
+            self._discarded(evicted, evicted_value)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return default
+        self._discarded(key, entry[1])
+        return entry[1]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Ca get(), dar fără să afecteze ordinea LRU sau contoarele"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self.clock():
+            return default
+        return entry[1]
+
+    def keys(self) -> List[Hashable]:
+        return list(self._entries.keys())
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def clear(self):
+        """Golește cache-ul (fără on_discard: cine golește își resetează singur stările derivate)"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+    def _discarded(self, key: Hashable, value: Any):
+        if self.on_discard is not None:
+            self.on_discard(key, value)
+
+
+def _discard(index: Dict[str, Set[Hashable]], node_id: Optional[str], key: Hashable):
+    keys = index.get(node_id)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[node_id]
+
+
+class NodeCache:
+    """Cache pentru nodurile Alfresco (după ID) și paginile de listare (după părinte și pagină)"""
+
+    def __init__(self, max_nodes: int = 2048, max_listings: int = 512, ttl: float = 30.0,
+                 listing_ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic,
+                 store: Optional[PersistentCache] = None, revalidate: Optional[Revalidate] = None):
+        self.nodes = LRUTTLCache(max_nodes, ttl, clock)
+        self.listings = LRUTTLCache(max_listings, listing_ttl if listing_ttl is not None else ttl, clock,
+                                    on_discard=self._unindex_listing)
+        # Indexuri inverse ale listărilor din memorie, ca invalidarea să nu parcurgă tot cache-ul:
+        # părinte -> cheile paginilor lui, copil -> cheile paginilor în care apare
+        self._pages_of: Dict[str, Set[Hashable]] = {}
+        self._pages_with: Dict[str, Set[Hashable]] = {}
+        # Alias-uri de tip '-root-' -> ID-ul real, ca invalidarea să prindă ambele forme
+        self._aliases: Dict[str, str] = {}
+        # Copia pe disc (opțională): scrierile trec și pe acolo, miss-urile unui proces proaspăt o citesc
+        self.store = store
+        self.revalidate = revalidate
+        self.invalidations = 0
+        self.warm_loads = 0
+        self.stale_loads = 0
+
+    # --- Noduri ---
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        entry = self.nodes.get(node_id)
+        if entry is None and self.store is not None:
+            entry = self._warm(self.nodes, "node", node_id, self.store.load_node(node_id))
+            if entry is not None:
+                self._remember_alias(node_id, entry.get("id"))
+        return entry
+
+    def set_node(self, node_id: str, entry: Dict[str, Any]):
+        self._remember_alias(node_id, entry.get("id"))
+        self.nodes.set(node_id, entry)
+        if self.store is not None:
+            self.store.put_node(node_id, entry)
+
+    # --- Listări ---
+
+    def get_listing(self, parent_id: str, skip_count: int, max_items: int) -> Optional[Dict[str, Any]]:
+        key = (parent_id, skip_count, max_items)
+        page = self.listings.get(key)
+        if page is None and self.store is not None:
+            page = self._warm(self.listings, "listing", key, self.store.load_listing(*key))
+            if page is not None:
+                self._remember_listing_alias(parent_id, page)
+                self._index_listing(key, page)
+        return page
+
+    def set_listing(self, parent_id: str, skip_count: int, max_items: int, page: Dict[str, Any]):
+        self._remember_listing_alias(parent_id, page)
+        key = (parent_id, skip_count, max_items)
+        self.listings.set(key, page)
+        self._index_listing(key, page)
+        if self.store is not None:
+            self.store.put_listing(parent_id, skip_count, max_items, page)
+
+    # --- Invalidare ---
+
+    def invalidate_listings(self, parent_id: str):
+        """Elimină toate paginile unui folder (o modificare decalează toate paginile următoare)"""
+        parent_ids = self._same_node(parent_id)
+        for same_id in parent_ids:
+            for key in list(self._pages_of.get(same_id, ())):
+                if self.listings.pop(key) is not None:
+                    self.invalidations += 1
+        if self.store is not None:
+            self.store.delete_listings(list(parent_ids))
+
+    def invalidate_node(self, node_id: str, parent_id: Optional[str] = None):
+        """Elimină nodul, listarea lui și listările părinților în care apare"""
+        parents = set()
+        if parent_id:
+            parents.add(parent_id)
+
+        cached = self.nodes.peek(node_id)
+        if cached and cached.get("parentId"):
+            parents.add(cached["parentId"])
+
+        for key in self._pages_with.get(node_id, ()):
+            parents.add(key[0])
+
+        if self.store is not None:
+            # Părinții cunoscuți doar de pe disc (listări salvate de un proces anterior)
+            parents.update(self.store.listing_parents(node_id))
+            parents.update(filter(None, [self.store.node_parent(node_id)]))
+
+        self._drop_nodes(node_id)
+        self.invalidate_listings(node_id)
+
+        for parent in parents:
+            # Părintele își schimbă modifiedAt, deci și intrarea lui de nod devine veche
+            self._drop_nodes(parent)
+            self.invalidate_listings(parent)
+
+    def clear(self):
+        self.nodes.clear()
+        self.listings.clear()
+        self._pages_of.clear()
+        self._pages_with.clear()
+        self._aliases.clear()
+        if self.store is not None:
+            self.store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.nodes.stats(),
+            "listings": self.listings.stats(),
+            "invalidations": self.invalidations,
+            "warm_loads": self.warm_loads,
+            "stale_loads": self.stale_loads
+        }
+
+    def _drop_nodes(self, node_id: str):
+        same_ids = self._same_node(node_id)
+        for same_id in same_ids:
+            if self.nodes.pop(same_id) is not None:
+                self.invalidations += 1
+        if self.store is not None:
+            self.store.delete_nodes(list(same_ids))
+
+    def _index_listing(self, key: Hashable, page: Dict[str, Any]):
+        if key not in self.listings:
+            return
+        self._pages_of.setdefault(key[0], set()).add(key)
+        for wrapper in page.get("entries", []):
+            child_id = wrapper.get("entry", {}).get("id")
+            if child_id:
+                self._pages_with.setdefault(child_id, set()).add(key)
+
+    def _unindex_listing(self, key: Hashable, page: Dict[str, Any]):
+        _discard(self._pages_of, key[0], key)
+        for wrapper in page.get("entries", []):
+            _discard(self._pages_with, wrapper.get("entry", {}).get("id"), key)
+
+    def _warm(self, cache: LRUTTLCache, kind: str, key: Hashable, loaded: Optional[Tuple[Any, float]]) -> Any:
+        """Pune în cache o intrare citită de pe disc; dacă a expirat între timp, o servește și cere revalidarea ei"""
+        if loaded is None:
+            return None
+        value, age = loaded
+        self.warm_loads += 1
+        if age < cache.ttl:
+            cache.set(key, value, ttl=cache.ttl - age)
+        else:
+            # Stale-while-revalidate: mai bine intrarea veche acum decât un apel Alfresco pe calea critică
+            cache.set(key, value)
+            self.stale_loads += 1
+            if self.revalidate is not None:
+                self.revalidate(kind, key)
+        return value
+
+    def _remember_listing_alias(self, parent_id: str, page: Dict[str, Any]):
+        entries = page.get("entries", [])
+        if entries:
+            self._remember_alias(parent_id, entries[0].get("entry", {}).get("parentId"))
+
+    def _remember_alias(self, key: str, real_id: Optional[str]):
+        if real_id and key != real_id:
+            self._aliases[key] = real_id
+
+    def _same_node(self, node_id: str) -> set:
+        """ID-ul împreună cu toate alias-urile lui cunoscute"""
+        ids = {node_id}
+        real_id = self._aliases.get(node_id, node_id)
+        ids.add(real_id)
+        ids.update(alias for alias, target in self._aliases.items() if target == real_id)
+        return ids
@@ -0,0 +1,153 @@
+"""
+Bugetul de output al unui tool: răspunsurile prea mari se trunchiază, iar restul rămâne pe server sub un cursor
+"""
+import secrets
+from typing import Any, Dict, List, Optional
+
+from Clase import JsonCodec
+from Clase.NodeCache import LRUTTLCache
+
+# Estimare grosieră a tokenizării: ~4 bytes de JSON per token
+BYTES_PER_TOKEN = 4
+# Cât text se trimite cel puțin într-o bucată, ca fiecare continuare să avanseze
+MIN_TEXT_CHUNK = 256
+# Prefixul rezumatului pentru bucățile următoare
+CONTINUED = "Continuare: "
+
+_TOKEN_BYTES = 9  # secrets.token_urlsafe(9) -> 12 caractere
+_PLACEHOLDER = "x" * len(secrets.token_urlsafe(_TOKEN_BYTES))
+
+
+class ContinuationStore:
+    """Resturile răspunsurilor trunchiate, după un cursor opac, cu TTL (pot fi recitite până expiră)"""
+
+    def __init__(self, ttl: float = 600.0, max_entries: int = 256):
+        self._pages = LRUTTLCache(max_entries=max_entries, ttl=ttl)
+        self.created = 0
+        self.resumed = 0
+        self.unknown = 0
+
+    def put(self, remainder: Dict[str, Any]) -> str:
+        token = secrets.token_urlsafe(_TOKEN_BYTES)
+        self._pages.set(token, remainder)
+        self.created += 1
+        return token
+
+    def take(self, token: str) -> Dict[str, Any]:
+        remainder = self._pages.get(token)
+        if remainder is None:
+            self.unknown += 1
+            raise ValueError(f"Cursor de continuare expirat sau necunoscut: {token}")
+        self.resumed += 1
+        return remainder
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pages),
+            "ttl": self._pages.ttl,
+            "created": self.created,
+            "resumed": self.resumed,
+            "unknown": self.unknown
+        }
+
+
+class OutputBudget:
+    """Limitează un răspuns formatat (format_simple_response) la `max_tokens`; 0 = fără limită.
+
+    Se păstrează câte elemente ('items') încap, apoi începutul textului ('text'); restul, împreună cu
+    next_cursor-ul paginării Alfresco, se pune în ContinuationStore și se reia cu tool-ul `continue`.
+    """
+
+    def __init__(self, max_tokens: int = 1000, store: Optional[ContinuationStore] = None):
+        self.max_bytes = max(0, max_tokens) * BYTES_PER_TOKEN
+        self.store = store or ContinuationStore()
+        self.truncated = 0
+
+    def apply(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        if self.max_bytes <= 0 or _size(response) <= self.max_bytes:
+            return response
+
+        items: List[str] = list(response.get("items") or [])
+        text: Optional[str] = response.get("text")
+        head = {key: value for key, value in response.items() if key not in ("items", "text", "next_cursor")}
+        # Câmpurile de continuare, cu valori maxime, ca dimensiunea lor să intre în calcul
+        text_bytes = len(text.encode("utf-8")) if text is not None else None
+        head.update(continuation=_PLACEHOLDER, remaining=_remaining(len(items), text_bytes, _PLACEHOLDER))
+
+        # Câte elemente încap (cel puțin unul, ca fiecare continuare să avanseze)
+        kept = self._fit_items(head, items)
+        head["items"] = items[:kept]
+        rest_items = items[kept:]
+
+        rest_text = text
+        if text is not None and not rest_items:
+            available = self.max_bytes - _size(dict(head, text=""))
+            head["text"], rest_text = _split_text(text, max(MIN_TEXT_CHUNK, available))
+            if not rest_text:
+                rest_text = None
+
+        if not rest_items and rest_text is None:
+            # Elementele încap, doar câmpurile fixe depășesc bugetul: nu are ce continua
+            head.pop("continuation")
+            head.pop("remaining")
+            if response.get("next_cursor"):
+                head["next_cursor"] = response["next_cursor"]
+            return head
+
+        summary = str(response.get("summary", ""))
+        if not summary.startswith(CONTINUED):
+            summary = CONTINUED + summary
+        remainder = {"context": response.get("context", ""), "summary": summary, "items": rest_items}
+        if rest_text is not None:
+            remainder["text"] = rest_text
+        if response.get("next_cursor"):
+            remainder["next_cursor"] = response["next_cursor"]
+
+        head["continuation"] = self.store.put(remainder)
+        head["remaining"] = _remaining(len(rest_items),
+                                       len(rest_text.encode("utf-8")) if rest_text is not None else None,
+                                       head["continuation"])
+        self.truncated += 1
+        return head
+
+    def resume(self, token: str) -> Dict[str, Any]:
+        """Următoarea bucată a unui răspuns trunchiat (trunchiată la rândul ei, dacă e nevoie)"""
+        return self.apply(self.store.take(token))
+
+    def _fit_items(self, head: Dict[str, Any], items: List[str]) -> int:
+        """Căutare binară a numărului maxim de elemente care încap în buget"""
+        low, high = 1, len(items)
+        if not items:
+            return 0
+        while low < high:
+            middle = (low + high + 1) // 2
+            if _size(dict(head, items=items[:middle])) <= self.max_bytes:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self.store.stats(), max_tokens=self.max_bytes // BYTES_PER_TOKEN, truncated=self.truncated)
+
+
+def _size(response: Dict[str, Any]) -> int:
+    return len(JsonCodec.dumpb(response, pretty=True))
+
+
+def _remaining(items: int, text_bytes: Optional[int], token: str) -> str:
+    parts = []
+    if items:
+        parts.append(f"{items} elemente")
+    if text_bytes is not None:
+        parts.append(f"{text_bytes} bytes de text")
+    return " și ".join(parts) + f" rămase; apelează tool-ul `continue` cu cursor=\"{token}\""
+
+
+def _split_text(text: str, max_bytes: int) -> tuple:
+    """Împarte textul la `max_bytes` bytes UTF-8, fără să rupă un caracter"""
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text, ""
+    head = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    return head, text[len(head):]
@@ -0,0 +1,227 @@
+"""
+Index de căi Alfresco: trie path -> ID nod, cu pointeri spre părinte pentru reconstruirea căii
+"""
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from Clase.PersistentCache import PersistentCache
+
+ROOT_ID = "-root-"
+ROOT_NAME = "Company Home"
+
+
+class PathIndex:
+    """Trie în memorie: fiecare nod își ține părintele, iar fiecare folder copiii după nume"""
+
+    def __init__(self, max_entries: int = 100000, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic,
+                 store: Optional[PersistentCache] = None, revalidate: Optional[Callable[[str, Hashable], None]] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        # Copia pe disc (opțională) a muchiilor; o muchie expirată citită de acolo se revalidează în fundal
+        self.store = store
+        self.revalidate = revalidate
+        # id -> [parent_id, name, is_folder, seen_at]
+        self._nodes: "OrderedDict[str, list]" = OrderedDict()
+        # parent_id -> {nume (case-insensitive): id}
+        self._children: Dict[str, Dict[str, str]] = {}
+        self._root_ids = {ROOT_ID}
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def split(path: str) -> List[str]:
+        """Împarte o cale în segmente; '/Company Home' este root-ul, deci se omite"""
+        segments = [segment for segment in (path or "").strip().split("/") if segment]
+        if segments and segments[0].casefold() == ROOT_NAME.casefold():
+            segments = segments[1:]
+        return segments
+
+    @staticmethod
+    def join(segments: List[str]) -> str:
+        return "/" + "/".join([ROOT_NAME] + list(segments))
+
+    # --- Actualizare ---
+
+    def set_root(self, real_id: Optional[str]):
+        """Înregistrează ID-ul real al root-ului (alias pentru '-root-')"""
+        if not real_id or real_id in self._root_ids:
+            return
+        self._root_ids.add(real_id)
+        # Copiii înregistrați sub ID-ul real trec sub alias-ul root-ului
+        moved = self._children.pop(real_id, {})
+        self._children.setdefault(ROOT_ID, {}).update(moved)
+        for child_id in moved.values():
+            if child_id in self._nodes:
+                self._nodes[child_id][0] = ROOT_ID
+
+    def add(self, parent_id: str, node_id: str, name: str, is_folder: bool = True):
+        """Adaugă sau reîmprospătează muchia parent -> node"""
+        if not node_id or not name:
+            return
+        parent_id = self._canonical(parent_id)
+        node_id = self._canonical(node_id)
+        if node_id == ROOT_ID:
+            return
+        self._insert(parent_id, node_id, name, is_folder, self.clock())
+        if self.store is not None:
+            self.store.put_path(parent_id, node_id, name, is_folder)
+
+    def _insert(self, parent_id: str, node_id: str, name: str, is_folder: bool, seen_at: float):
+        previous = self._nodes.get(node_id)
+        if previous and (previous[0] != parent_id or previous[1] != name):
+            # Nodul a fost mutat sau redenumit
+            self._unlink(node_id, previous)
+
+        self._nodes[node_id] = [parent_id, name, is_folder, seen_at]
+        self._nodes.move_to_end(node_id)
+        self._children.setdefault(parent_id, {})[name.casefold()] = node_id
+
+        while len(self._nodes) > self.max_entries:
+            old_id, old = self._nodes.popitem(last=False)
+            self._unlink(old_id, old)
+
+    def add_children(self, parent_id: str, entries: List[Dict[str, Any]]):
+        """Înregistrează intrările unei pagini de listare ('list.entries')"""
+        with self.store.batch() if self.store is not None else nullcontext():
+            for wrapper in entries:
+                entry = wrapper.get("entry", wrapper)
+                if parent_id == ROOT_ID:
+                    self.set_root(entry.get("parentId"))
+                self.add(parent_id, entry.get("id"), entry.get("name"), bool(entry.get("isFolder")))
+
+    def add_path_elements(self, elements: List[Dict[str, Any]], node: Dict[str, Any]):
+        """Înregistrează lanțul de strămoși din 'path.elements' plus nodul final"""
+        if not elements:
+            return
+        self.set_root(elements[0].get("id"))
+        parent_id = ROOT_ID
+        with self.store.batch() if self.store is not None else nullcontext():
+            for element in elements[1:]:
+                self.add(parent_id, element.get("id"), element.get("name"), True)
+                parent_id = element.get("id")
+            self.add(parent_id, node.get("id"), node.get("name"), bool(node.get("isFolder")))
+
+    def remove(self, node_id: str):
+        """Elimină nodul și tot subarborele lui cunoscut"""
+        stack = [self._canonical(node_id)]
+        if self.store is not None:
+            self.store.delete_path(stack[0])
+        while stack:
+            current = stack.pop()
+            stack.extend(self._children.pop(current, {}).values())
+            node = self._nodes.pop(current, None)
+            if node:
+                self._unlink(current, node)
+
+    def clear(self):
+        self._nodes.clear()
+        self._children.clear()
+
+    # --- Interogare ---
+
+    def lookup(self, segments: List[str]) -> Tuple[str, int]:
+        """Cel mai adânc prefix cunoscut al căii: (ID, numărul de segmente rezolvate)"""
+        node_id = ROOT_ID
+        for depth, segment in enumerate(segments):
+            child_id = self._children.get(node_id, {}).get(segment.casefold())
+            if (child_id is None or not self._fresh(child_id)) and self.store is not None:
+                child_id = self._warm(node_id, segment)
+            if child_id is None or not self._fresh(child_id):
+                self.misses += 1
+                return node_id, depth
+            node_id = child_id
+        self.hits += 1
+        return node_id, len(segments)
+
+    def resolve(self, path: str) -> Optional[str]:
+        segments = self.split(path)
+        node_id, depth = self.lookup(segments)
+        return node_id if depth == len(segments) else None
+
+    def is_folder(self, node_id: str) -> Optional[bool]:
+        node_id = self._canonical(node_id)
+        if node_id == ROOT_ID:
+            return True
+        node = self._nodes.get(node_id)
+        return node[2] if node else None
+
+    def path_of(self, node_id: str) -> Optional[str]:
+        """Reconstruiește calea urcând pe pointerii spre părinte (fără include=path)"""
+        segments = []
+        current = self._canonical(node_id)
+        seen = set()
+        while current != ROOT_ID:
+            node = self._nodes.get(current)
+            if node is None or current in seen:
+                return None
+            seen.add(current)
+            segments.append(node[1])
+            current = node[0]
+        return self.join(list(reversed(segments)))
+
+    def complete(self, prefix: str, limit: int = 20) -> List[str]:
+        """Completează un prefix de cale din intrările cunoscute (folderele se termină cu '/')"""
+        segments = self.split(prefix)
+        if prefix.endswith("/") or not segments:
+            parent_segments, partial = segments, ""
+        else:
+            parent_segments, partial = segments[:-1], segments[-1].casefold()
+
+        parent_id, depth = self.lookup(parent_segments)
+        if depth < len(parent_segments):
+            return []
+
+        matches = []
+        for key, child_id in self._children.get(parent_id, {}).items():
+            node = self._nodes.get(child_id)
+            if node is None or not key.startswith(partial):
+                continue
+            path = self.join(parent_segments + [node[1]])
+            matches.append(path + "/" if node[2] else path)
+        return sorted(matches)[:limit]
+
+    def parent_segments(self, prefix: str) -> List[str]:
+        """Segmentele folderului în care se face completarea pentru un prefix"""
+        segments = self.split(prefix)
+        return segments if prefix.endswith("/") or not segments else segments[:-1]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._nodes),
+            "max_entries": self.max_entries,
+            "folders_indexed": len(self._children),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _warm(self, parent_id: str, name: str) -> Optional[str]:
+        """Muchia parent -> copil salvată de un proces anterior; dacă a expirat, se folosește și se revalidează"""
+        loaded = self.store.load_child(parent_id, name)
+        if loaded is None:
+            return None
+        child_id, child_name, is_folder, age = loaded
+        if age < self.ttl:
+            self._insert(parent_id, child_id, child_name, is_folder, self.clock() - age)
+        else:
+            self._insert(parent_id, child_id, child_name, is_folder, self.clock())
+            if self.revalidate is not None:
+                self.revalidate("path", child_id)
+        return child_id
+
+    def _canonical(self, node_id: str) -> str:
+        return ROOT_ID if node_id in self._root_ids else node_id
+
+    def _fresh(self, node_id: str) -> bool:
+        node = self._nodes.get(node_id)
+        return node is not None and self.clock() - node[3] < self.ttl
+
+    def _unlink(self, node_id: str, node: list):
+        siblings = self._children.get(node[0])
+        if siblings and siblings.get(node[1].casefold()) == node_id:
+            del siblings[node[1].casefold()]
+            if not siblings:
+                del self._children[node[0]]
@@ -0,0 +1,237 @@
+"""
+Copia pe disc (SQLite, WAL) a cache-ului de noduri, listări și căi: repornirile pornesc cu cache-ul cald
+"""
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from Clase import JsonCodec
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id TEXT PRIMARY KEY,
+    entry TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    parent_id TEXT NOT NULL,
+    skip_count INTEGER NOT NULL,
+    max_items INTEGER NOT NULL,
+    page TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (parent_id, skip_count, max_items)
+);
+CREATE TABLE IF NOT EXISTS paths (
+    id TEXT PRIMARY KEY,
+    parent_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    is_folder INTEGER NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS paths_by_parent ON paths(parent_id, name_key);
+CREATE TABLE IF NOT EXISTS listing_children (
+    child_id TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    PRIMARY KEY (child_id, parent_id)
+) WITHOUT ROWID;
+"""
+
+
+class PersistentCache:
+    """Intrările cache-ului în memorie, scrise și pe disc, fiecare cu momentul în care a fost citită din Alfresco.
+
+    Încărcarea este leneșă: o intrare se citește de pe disc doar la primul miss pentru cheia ei din
+    procesul curent (după aceea cache-ul în memorie și scrierile o țin la zi). Vârsta intrării o decide
+    apelantul: proaspătă se servește ca atare, veche se servește și se revalidează în fundal.
+    Intrările mai vechi de `max_age` secunde se ignoră și se șterg la deschidere.
+
+    Scrierile nu se confirmă una câte una: commit-ul pleacă după `commit_every` scrieri, după
+    `commit_interval` secunde de la precedentul sau la închidere. Fiind un cache, o cădere a procesului
+    pierde cel mult ultimele scrieri, pe care Alfresco le redă la următoarea citire.
+    """
+
+    def __init__(self, path: str, max_age: float = 86400.0, clock: Callable[[], float] = time.time,
+                 commit_every: int = 200, commit_interval: float = 1.0, max_consulted: int = 100000):
+        self.path = path
+        self.max_age = max_age
+        self.clock = clock
+        self.db = sqlite3.connect(path)
+        # WAL: cititorii nu blochează scrierile, iar un commit nu mai rescrie fișierul principal
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(_SCHEMA)
+        self.commit_every = max(1, commit_every)
+        self.commit_interval = commit_interval
+        self._batch_depth = 0
+        self._pending = 0
+        self._committed_at = time.monotonic()
+        # Cheile deja consultate (sau scrise) în procesul curent: discul nu mai are nimic mai nou pentru ele.
+        # LRU limitat: o cheie uitată doar se mai citește o dată de pe disc, unde scrierile o țin la zi
+        self.max_consulted = max_consulted
+        self._consulted: "OrderedDict[Hashable, None]" = OrderedDict()
+
+        self.loads = 0
+        self.writes = 0
+        self.commits = 0
+        self.pruned = self.prune()
+
+    # --- Scriere ---
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Grupează mai multe scrieri într-o singură tranzacție (ex: o pagină de listare)"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._commit()
+
+    def put_node(self, node_id: str, entry: Dict[str, Any]):
+        self._consult(("node", node_id))
+        self.db.execute("INSERT OR REPLACE INTO nodes(id, entry, stored_at) VALUES (?, ?, ?)",
+                        (node_id, JsonCodec.dumps(entry), self.clock()))
+        self._written()
+
+    def put_listing(self, parent_id: str, skip_count: int, max_items: int, page: Dict[str, Any]):
+        self._consult(("listing", parent_id, skip_count, max_items))
+        self.db.execute(
+            "INSERT OR REPLACE INTO listings(parent_id, skip_count, max_items, page, stored_at) VALUES (?, ?, ?, ?, ?)",
+            (parent_id, skip_count, max_items, JsonCodec.dumps(page), self.clock())
+        )
+        # Indexul copil -> părinte: invalidarea unui nod găsește listările care îl conțin fără să le parcurgă
+        self.db.executemany(
+            "INSERT OR IGNORE INTO listing_children(child_id, parent_id) VALUES (?, ?)",
+            [(wrapper["entry"]["id"], parent_id) for wrapper in page.get("entries", [])
+             if wrapper.get("entry", {}).get("id")]
+        )
+        self._written()
+
+    def put_path(self, parent_id: str, node_id: str, name: str, is_folder: bool):
+        self._consult(("path", parent_id, name.casefold()))
+        self.db.execute(
+            "INSERT OR REPLACE INTO paths(id, parent_id, name, name_key, is_folder, stored_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (node_id, parent_id, name, name.casefold(), int(is_folder), self.clock())
+        )
+        self._written()
+
+    def delete_nodes(self, node_ids: List[str]):
+        self.db.executemany("DELETE FROM nodes WHERE id = ?", [(node_id,) for node_id in node_ids])
+        self._written()
+
+    def delete_listings(self, parent_ids: List[str]):
+        rows = [(parent_id,) for parent_id in parent_ids]
+        self.db.executemany("DELETE FROM listings WHERE parent_id = ?", rows)
+        self.db.executemany("DELETE FROM listing_children WHERE parent_id = ?", rows)
+        self._written()
+
+    def delete_path(self, node_id: str):
+        """Scoate nodul și tot subarborele lui cunoscut din maparea căilor"""
+        self.db.execute(
+            "WITH RECURSIVE below(id) AS (SELECT ? UNION SELECT paths.id FROM paths JOIN below "
+            "ON paths.parent_id = below.id) DELETE FROM paths WHERE id IN below",
+            (node_id,)
+        )
+        self._written()
+
+    def clear(self):
+        for table in ("nodes", "listings", "paths", "listing_children"):
+            self.db.execute(f"DELETE FROM {table}")
+        self._written()
+
+    def prune(self) -> int:
+        """Șterge intrările mai vechi decât max_age"""
+        cutoff = self.clock() - self.max_age
+        removed = sum(self.db.execute(f"DELETE FROM {table} WHERE stored_at < ?", (cutoff,)).rowcount
+                      for table in ("nodes", "listings", "paths"))
+        self.db.execute("DELETE FROM listing_children WHERE parent_id NOT IN (SELECT parent_id FROM listings)")
+        self.db.commit()
+        return removed
+
+    def flush(self):
+        """Confirmă pe disc scrierile în așteptare"""
+        if self._pending:
+            self.db.commit()
+            self.commits += 1
+        self._pending = 0
+        self._committed_at = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    # --- Încărcare leneșă ---
+
+    def load_node(self, node_id: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(intrarea, vârsta în secunde) la primul miss pentru nod, altfel None"""
+        row = self._load(("node", node_id), "SELECT entry, stored_at FROM nodes WHERE id = ?", (node_id,))
+        return (JsonCodec.loads(row[0]), row[1]) if row else None
+
+    def load_listing(self, parent_id: str, skip_count: int, max_items: int) -> Optional[Tuple[Dict[str, Any], float]]:
+        row = self._load(("listing", parent_id, skip_count, max_items),
+                         "SELECT page, stored_at FROM listings WHERE parent_id = ? AND skip_count = ? AND max_items = ?",
+                         (parent_id, skip_count, max_items))
+        return (JsonCodec.loads(row[0]), row[1]) if row else None
+
+    def load_child(self, parent_id: str, name: str) -> Optional[Tuple[str, str, bool, float]]:
+        """(ID, nume, este folder, vârstă) al copilului cu numele dat (case-insensitive), la primul miss"""
+        row = self._load(("path", parent_id, name.casefold()),
+                         "SELECT id, name, is_folder, stored_at FROM paths WHERE parent_id = ? AND name_key = ?",
+                         (parent_id, name.casefold()))
+        return (row[0], row[1], bool(row[2]), row[3]) if row else None
+
+    def node_parent(self, node_id: str) -> Optional[str]:
+        """Părintele nodului după intrarea salvată (fără s-o încarce în cache)"""
+        row = self.db.execute("SELECT json_extract(entry, '$.parentId') FROM nodes WHERE id = ?", (node_id,)).fetchone()
+        return row[0] if row else None
+
+    def listing_parents(self, node_id: str) -> List[str]:
+        """Folderele ale căror listări salvate conțin nodul"""
+        rows = self.db.execute("SELECT parent_id FROM listing_children WHERE child_id = ?", (node_id,)).fetchall()
+        return [row[0] for row in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "max_age": self.max_age,
+            **{table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+               for table in ("nodes", "listings", "paths")},
+            "loads": self.loads,
+            "writes": self.writes,
+            "commits": self.commits,
+            "pending_writes": self._pending,
+            "pruned": self.pruned
+        }
+
+    def _load(self, key: Hashable, query: str, args: tuple) -> Optional[tuple]:
+        if key in self._consulted:
+            self._consulted.move_to_end(key)
+            return None
+        self._consult(key)
+        row = self.db.execute(query, args).fetchone()
+        if row is None:
+            return None
+        age = max(0.0, self.clock() - row[-1])
+        if age > self.max_age:
+            return None
+        self.loads += 1
+        return row[:-1] + (age,)
+
+    def _consult(self, key: Hashable):
+        self._consulted[key] = None
+        self._consulted.move_to_end(key)
+        while len(self._consulted) > self.max_consulted:
+            self._consulted.popitem(last=False)
+
+    def _written(self):
+        self.writes += 1
+        self._pending += 1
+        self._commit()
+
+    def _commit(self):
+        if self._batch_depth == 0 and (self._pending >= self.commit_every
+                                       or time.monotonic() - self._committed_at >= self.commit_interval):
+            self.flush()
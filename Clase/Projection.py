@@ -0,0 +1,75 @@
+"""
+Proiecții de răspuns: fiecare tool declară câmpurile Alfresco pe care le folosește efectiv
+"""
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+class Projection:
+    """Câmpurile unei intrări de nod cerute de la Alfresco și păstrate după parsare.
+
+    `fields` devine parametrul `fields` al API-ului, `include` câmpurile opționale cerute explicit
+    (care trebuie să apară și în `fields`), iar `properties` restrânge dicționarul de proprietăți
+    la cheile folosite, pentru că Alfresco îl trimite întotdeauna întreg.
+    """
+
+    def __init__(self, name: str, fields: Iterable[str], include: Iterable[str] = (),
+                 properties: Optional[Iterable[str]] = None):
+        self.name = name
+        self.include: Tuple[str, ...] = tuple(include)
+        self.fields: Tuple[str, ...] = tuple(dict.fromkeys(tuple(fields) + self.include))
+        self.properties = frozenset(properties) if properties is not None else None
+
+    def params(self) -> Dict[str, str]:
+        """Parametrii de query pentru această proiecție"""
+        params = {"fields": ",".join(self.fields)}
+        if self.include:
+            params["include"] = ",".join(self.include)
+        return params
+
+    def apply(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Păstrează din intrare doar câmpurile proiecției (și dacă serverul a ignorat `fields`)"""
+        projected = {key: entry[key] for key in self.fields if key in entry}
+        if self.properties is not None and isinstance(projected.get("properties"), dict):
+            projected["properties"] = {
+                key: value for key, value in projected["properties"].items() if key in self.properties
+            }
+        return projected
+
+    def apply_page(self, page: Dict[str, Any]) -> Dict[str, Any]:
+        """Aplică proiecția pe toate intrările unei pagini de listare ('list')"""
+        projected = dict(page)
+        projected["entries"] = [{"entry": self.apply(wrapper.get("entry", {}))} for wrapper in page.get("entries", [])]
+        return projected
+
+    def __repr__(self) -> str:
+        return f"Projection({self.name!r}, fields={','.join(self.fields)})"
+
+
+# Câmpurile de identitate, necesare indexurilor de căi și de nume
+IDENTITY_FIELDS = ("id", "name", "isFolder", "parentId")
+# Metadatele afișate de listări și de get_node_info
+AUDIT_FIELDS = ("nodeType", "createdAt", "modifiedAt", "createdByUser", "modifiedByUser", "content")
+# Proprietățile folosite (titlu și descriere)
+DESCRIPTIVE_PROPERTIES = ("cm:title", "cm:description")
+
+# Listări: list_root_children, get_node_children, browse_by_path, list_subtree
+LISTING = Projection("listing", IDENTITY_FIELDS + AUDIT_FIELDS)
+# get_node_info: metadate plus calea și titlul / descrierea
+NODE_INFO = Projection("node_info", IDENTITY_FIELDS + AUDIT_FIELDS, include=("path", "properties"),
+                       properties=DESCRIPTIVE_PROPERTIES)
+# Crawl-ul indexului de nume și căutarea de foldere existente: doar identitatea
+NAMES = Projection("names", IDENTITY_FIELDS)
+# Crawl-ul cu indexul full-text activ: identitatea plus titlul și descrierea
+SEARCH = Projection("search", IDENTITY_FIELDS, include=("properties",), properties=DESCRIPTIVE_PROPERTIES)
+# Rezultatele Search API: ca listările, plus calea fiecărui rezultat
+SEARCH_HITS = Projection("search_hits", IDENTITY_FIELDS + AUDIT_FIELDS, include=("path",))
+# Rezolvarea unei căi cu relativePath: identitatea plus lanțul de strămoși
+PATH = Projection("path", IDENTITY_FIELDS, include=("path",))
+# Oglinda locală: tot ce păstrează o înregistrare compactă
+MIRROR = Projection("mirror", IDENTITY_FIELDS + AUDIT_FIELDS, include=("properties",),
+                    properties=DESCRIPTIVE_PROPERTIES)
+# Fluxul de modificări: identitatea, momentul modificării și titlul / descrierea
+CHANGES = Projection("changes", IDENTITY_FIELDS + ("modifiedAt",), include=("properties",),
+                     properties=DESCRIPTIVE_PROPERTIES)
+# Verificarea de modificare a unui folder (sincronizarea incrementală a oglinzii)
+MODIFIED = Projection("modified", ("id", "modifiedAt"))
@@ -0,0 +1,180 @@
+"""
+Limitarea ritmului de cereri spre Alfresco: token bucket cu cozi pe priorități și respectarea Retry-After
+"""
+import asyncio
+import functools
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Prioritățile (valoare mică = servită prima): citirile interactive înaintea scrierilor, lucrul în fundal la final
+READ = 0
+WRITE = 1
+BULK = 2
+PRIORITY_NAMES = {READ: "read", WRITE: "write", BULK: "bulk"}
+# Operațiile care doar citesc (inclusiv căutările trimise prin POST)
+READ_OPS = frozenset({"read", "content"})
+
+# Setat pe durata operațiilor în masă și a crawl-urilor; task-urile pornite între timp îl moștenesc
+_background: ContextVar[bool] = ContextVar("alfresco_background", default=False)
+
+# Cât se așteaptă cel mult pentru un Retry-After (un server care cere ore nu trebuie să blocheze totul)
+MAX_RETRY_AFTER = 60.0
+
+
+@contextmanager
+def background() -> Iterator[None]:
+    """Marchează cererile pornite în acest context (și în task-urile create din el) ca lucru în fundal"""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def background_job(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Decorator: toată corutina (operație în masă, crawl) rulează cu prioritatea de fundal"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with background():
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+def request_priority(op: str) -> int:
+    """Prioritatea după tipul operației (read / content / write / upload), nu după metoda HTTP"""
+    if _background.get():
+        return BULK
+    return READ if op in READ_OPS else WRITE
+
+
+def parse_retry_after(value: Optional[str], now: Callable[[], float] = time.time) -> Optional[float]:
+    """Secundele din antetul Retry-After (număr sau dată HTTP), plafonate la MAX_RETRY_AFTER"""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - now()
+        except (TypeError, ValueError):
+            return None
+    return min(MAX_RETRY_AFTER, max(0.0, seconds))
+
+
+class RateLimiter:
+    """Token bucket de `rate` cereri/secundă (rafale de cel mult `burst`); rate <= 0 înseamnă fără limită.
+
+    Când nu sunt jetoane, cererile așteaptă într-o coadă ordonată după prioritate, apoi după sosire.
+    `pause` (de la un Retry-After) oprește toate cererile până la termenul primit, indiferent de rată.
+    """
+
+    def __init__(self, rate: float = 0.0, burst: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.clock = clock
+        self.tokens = self.burst
+        self.updated = clock()
+        self.paused_until = 0.0
+
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self.granted = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.queued = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.waited = {name: 0.0 for name in PRIORITY_NAMES.values()}
+        self.throttled = 0
+
+    async def acquire(self, priority: int = READ):
+        """Așteaptă un jeton (direct, dacă nimeni nu e la coadă și bucket-ul nu e gol)"""
+        name = PRIORITY_NAMES[priority]
+        if not self._waiters and self._take():
+            self.granted[name] += 1
+            return
+
+        started = self.clock()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self.queued[name] += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Dacă jetonul fusese deja acordat, îl returnăm
+            if future.done() and not future.cancelled():
+                self.tokens = min(self.burst, self.tokens + 1)
+            raise
+        self.granted[name] += 1
+        self.waited[name] += self.clock() - started
+
+    def try_acquire(self) -> bool:
+        """Un jeton doar dacă e disponibil imediat (ex: pentru cereri opționale, cum sunt hedge-urile)"""
+        return not self._waiters and self._take()
+
+    def pause(self, seconds: float):
+        """Oprește cererile `seconds` secunde (Alfresco a răspuns 429/503 cu Retry-After)"""
+        self.throttled += 1
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        waiting = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                waiting[PRIORITY_NAMES[priority]] += 1
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self.tokens, 2),
+            "granted": dict(self.granted),
+            "queued": dict(self.queued),
+            "waiting": waiting,
+            "wait_seconds": {name: round(seconds, 3) for name, seconds in self.waited.items()},
+            "throttled": self.throttled,
+            "paused_for": round(max(0.0, self.paused_until - self.clock()), 3)
+        }
+
+    def _refill(self):
+        now = self.clock()
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _take(self) -> bool:
+        if self.clock() < self.paused_until:
+            return False
+        if self.rate <= 0:
+            return True
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+    def _delay(self) -> float:
+        """Cât trebuie așteptat până la următorul jeton"""
+        pause = self.paused_until - self.clock()
+        if pause > 0:
+            return pause
+        if self.rate <= 0:
+            return 0.0
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    async def _dispatch(self):
+        """Acordă jetoanele, pe rând, celor din coadă, în ordinea priorității"""
+        while self._waiters:
+            while self._waiters and self._waiters[0][2].done():
+                heapq.heappop(self._waiters)  # anulate între timp
+            if not self._waiters:
+                break
+            if self._take():
+                heapq.heappop(self._waiters)[2].set_result(None)
+            else:
+                await asyncio.sleep(self._delay())
@@ -0,0 +1,607 @@
+"""
+Oglindă locală a depozitului Alfresco: arborele de foldere și metadatele nodurilor,
+sincronizate incremental din fluxul de modificări (Search API) sau după modifiedAt-ul folderelor
+"""
+import asyncio
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from Clase.PathIndex import ROOT_ID
+from Clase.Projection import MIRROR, MODIFIED
+from Clase.RateLimiter import background_job
+
+# Câmpurile unei înregistrări de nod (tuplu compact, fără dict per nod)
+(R_ID, R_NAME, R_PARENT, R_FOLDER, R_TYPE, R_CREATED, R_MODIFIED,
+ R_CREATED_BY, R_MODIFIED_BY, R_SIZE, R_MIME, R_TITLE, R_DESCRIPTION) = range(13)
+
+NodeRecord = Tuple[Any, ...]
+
+
+def entry_to_record(entry: Dict[str, Any]) -> NodeRecord:
+    """Transformă o intrare Alfresco într-o înregistrare compactă"""
+    content = entry.get("content") or {}
+    properties = entry.get("properties") or {}
+    return (
+        entry.get("id"),
+        entry.get("name"),
+        entry.get("parentId"),
+        bool(entry.get("isFolder")),
+        entry.get("nodeType"),
+        entry.get("createdAt"),
+        entry.get("modifiedAt"),
+        (entry.get("createdByUser") or {}).get("displayName"),
+        (entry.get("modifiedByUser") or {}).get("displayName"),
+        content.get("sizeInBytes"),
+        content.get("mimeType"),
+        properties.get("cm:title"),
+        properties.get("cm:description"),
+    )
+
+
+def record_to_entry(record: NodeRecord) -> Dict[str, Any]:
+    """Reconstruiește forma de intrare Alfresco folosită de formatarea răspunsurilor"""
+    entry = {
+        "id": record[R_ID],
+        "name": record[R_NAME],
+        "parentId": record[R_PARENT],
+        "isFolder": record[R_FOLDER],
+        "nodeType": record[R_TYPE],
+        "createdAt": record[R_CREATED],
+        "modifiedAt": record[R_MODIFIED],
+        "createdByUser": {"displayName": record[R_CREATED_BY]},
+        "modifiedByUser": {"displayName": record[R_MODIFIED_BY]},
+    }
+    if not record[R_FOLDER] and (record[R_SIZE] is not None or record[R_MIME] is not None):
+        entry["content"] = {"sizeInBytes": record[R_SIZE], "mimeType": record[R_MIME]}
+    properties = {}
+    if record[R_TITLE] is not None:
+        properties["cm:title"] = record[R_TITLE]
+    if record[R_DESCRIPTION] is not None:
+        properties["cm:description"] = record[R_DESCRIPTION]
+    if properties:
+        entry["properties"] = properties
+    return entry
+
+
+class MirrorSnapshot:
+    """Snapshot binar, mapat în memorie, al arborelui oglindit.
+
+    Format (little-endian):
+      antet    : magic, versiune, nr. noduri, offset înregistrări, offset index ID, offset șiruri
+      noduri   : înregistrări de dimensiune fixă în ordine BFS; copiii unui folder sunt contigui
+      index ID : perechi (offset șir ID, index înregistrare) sortate după ID, pentru căutare binară
+      șiruri   : tabel deduplicat de șiruri UTF-8 prefixate cu lungimea (offset 0 = None)
+    """
+
+    MAGIC = b"AMS1"
+    VERSION = 1
+    HEADER = struct.Struct("<4sIIxxxxQQQ")
+    # id, nume, index părinte, flags, tip, creat, modificat, creat de, modificat de,
+    # mărime, mime, titlu, descriere, primul copil, număr copii
+    RECORD = struct.Struct("<IIiB3xIIIIIqIIIII")
+    ID_ENTRY = struct.Struct("<II")
+    LENGTH = struct.Struct("<I")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count, self._records, self._ids, self._strings = self.HEADER.unpack_from(self._mm, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f"Snapshot invalid: {path}")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def _string(self, offset: int) -> Optional[str]:
+        if offset == 0:
+            return None
+        position = self._strings + offset
+        (length,) = self.LENGTH.unpack_from(self._mm, position)
+        start = position + self.LENGTH.size
+        return self._mm[start:start + length].decode("utf-8")
+
+    def _raw(self, index: int) -> tuple:
+        return self.RECORD.unpack_from(self._mm, self._records + index * self.RECORD.size)
+
+    def record(self, index: int) -> NodeRecord:
+        raw = self._raw(index)
+        parent = self._string(self._raw(raw[2])[0]) if raw[2] >= 0 else None
+        return (
+            self._string(raw[0]), self._string(raw[1]), parent, bool(raw[3] & 1),
+            self._string(raw[4]), self._string(raw[5]), self._string(raw[6]),
+            self._string(raw[7]), self._string(raw[8]), raw[9] if raw[9] >= 0 else None,
+            self._string(raw[10]), self._string(raw[11]), self._string(raw[12]),
+        )
+
+    def children(self, index: int) -> range:
+        raw = self._raw(index)
+        return range(raw[13], raw[13] + raw[14])
+
+    def find(self, node_id: str) -> Optional[int]:
+        """Căutare binară în indexul de ID-uri: O(log n), fără să încarce snapshot-ul în memorie"""
+        low, high = 0, self.count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            id_offset, index = self.ID_ENTRY.unpack_from(self._mm, self._ids + middle * self.ID_ENTRY.size)
+            current = self._string(id_offset)
+            if current == node_id:
+                return index
+            if current < node_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    @classmethod
+    def write(cls, path: str, root: NodeRecord,
+              children_of: Callable[[str], List[NodeRecord]]) -> int:
+        """Scrie arborele (parcurs BFS din root) atomic în `path`; returnează numărul de noduri"""
+        strings = bytearray(b"\0")
+        offsets: Dict[str, int] = {}
+
+        def string(value: Optional[str]) -> int:
+            if value is None:
+                return 0
+            offset = offsets.get(value)
+            if offset is None:
+                encoded = value.encode("utf-8")
+                offset = len(strings)
+                strings.extend(cls.LENGTH.pack(len(encoded)))
+                strings.extend(encoded)
+                offsets[value] = offset
+            return offset
+
+        order: List[NodeRecord] = [root]
+        parents: List[int] = [-1]
+        ranges: List[Tuple[int, int]] = []
+        position = 0
+        while position < len(order):
+            record = order[position]
+            kids = children_of(record[R_ID]) if record[R_FOLDER] else []
+            ranges.append((len(order), len(kids)))
+            order.extend(kids)
+            parents.extend([position] * len(kids))
+            position += 1
+
+        records = bytearray()
+        for index, record in enumerate(order):
+            first_child, child_count = ranges[index]
+            records.extend(cls.RECORD.pack(
+                string(record[R_ID]), string(record[R_NAME]), parents[index], 1 if record[R_FOLDER] else 0,
+                string(record[R_TYPE]), string(record[R_CREATED]), string(record[R_MODIFIED]),
+                string(record[R_CREATED_BY]), string(record[R_MODIFIED_BY]),
+                record[R_SIZE] if record[R_SIZE] is not None else -1,
+                string(record[R_MIME]), string(record[R_TITLE]), string(record[R_DESCRIPTION]),
+                first_child, child_count
+            ))
+
+        ids = bytearray()
+        for index in sorted(range(len(order)), key=lambda i: order[i][R_ID]):
+            ids.extend(cls.ID_ENTRY.pack(string(order[index][R_ID]), index))
+
+        records_offset = cls.HEADER.size
+        ids_offset = records_offset + len(records)
+        strings_offset = ids_offset + len(ids)
+
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(order), records_offset, ids_offset, strings_offset))
+            f.write(records)
+            f.write(ids)
+            f.write(strings)
+        os.replace(temporary, path)
+        return len(order)
+
+
+class RepositoryMirror:
+    """Copie locală a depozitului, servită citirilor cât timp nu e mai veche decât `staleness`.
+
+    Starea curentă = snapshot-ul mapat în memorie + un strat de modificări (overlay) în dict-uri.
+    Cu un flux de modificări (`feed`, ex: SearchChangeFeed) sincronizarea incrementală este o singură
+    interogare: nodurile schimbate de la ultimul checkpoint, după care se re-listează doar părinții lor.
+    Fără flux (Search API indisponibil), sau până la prima trecere completă, se verifică modifiedAt-ul
+    fiecărui folder cunoscut (o cerere mică per folder, deci O(foldere) la fiecare interval) și se
+    re-listează doar cele schimbate, bazându-ne pe propagarea modifiedAt la folderul părinte.
+    Overlay-ul se compactează periodic, într-un fir separat, într-un snapshot nou.
+    """
+
+    def __init__(self, server, snapshot_path: Optional[str] = None, staleness: float = 300.0,
+                 sync_interval: float = 60.0, concurrency: int = 8, compact_threshold: int = 10000,
+                 feed: Optional[Any] = None, clock: Callable[[], float] = time.monotonic):
+        self.server = server
+        self.feed = feed
+        # Checkpoint-ul fluxului de la ultima sincronizare reușită (None = trebuie o trecere completă)
+        self.checkpoint: Optional[str] = None
+        self.snapshot_path = snapshot_path
+        self.staleness = staleness
+        self.sync_interval = sync_interval
+        self.concurrency = max(1, concurrency)
+        self.compact_threshold = compact_threshold
+        self.clock = clock
+
+        self.root_id: Optional[str] = None
+        self._snapshot: Optional[MirrorSnapshot] = None
+        self._nodes: Dict[str, NodeRecord] = {}
+        self._children: Dict[str, List[str]] = {}
+        self._removed: Set[str] = set()
+        self._dirty: Set[str] = set()
+
+        self.synced_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+        self.syncs = 0
+        self.delta_syncs = 0
+        self.folders_checked = 0
+        self.folders_relisted = 0
+        self.served = 0
+
+    # --- Ciclu de viață ---
+
+    def start(self) -> asyncio.Task:
+        """Pornește bucla de sincronizare în fundal (încarcă snapshot-ul existent, dacă există)"""
+        if self._task is None or self._task.done():
+            if self.snapshot_path and os.path.exists(self.snapshot_path) and self._snapshot is None:
+                try:
+                    self._open_snapshot()
+                except (OSError, ValueError, struct.error) as e:
+                    print(f"⚠️ Snapshot oglindă ignorat: {e}", file=sys.stderr)
+            self._task = asyncio.create_task(self._run())
+        return self._task
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._snapshot:
+            self._snapshot.close()
+            self._snapshot = None
+
+    @background_job
+    async def _run(self):
+        while True:
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Sincronizare oglindă eșuată: {e}", file=sys.stderr)
+            await asyncio.sleep(self.sync_interval)
+
+    # --- Citire ---
+
+    def is_fresh(self) -> bool:
+        return self.synced_at is not None and self.clock() - self.synced_at <= self.staleness
+
+    def node(self, node_id: str) -> Optional[NodeRecord]:
+        node_id = self._resolve(node_id)
+        if node_id is None or node_id in self._removed:
+            return None
+        record = self._nodes.get(node_id)
+        if record is None and self._snapshot is not None:
+            index = self._snapshot.find(node_id)
+            if index is not None:
+                record = self._snapshot.record(index)
+        return record
+
+    def children_ids(self, folder_id: str) -> Optional[List[str]]:
+        """ID-urile copiilor, în ordinea din Alfresco; None dacă folderul nu e oglindit"""
+        folder_id = self._resolve(folder_id)
+        if folder_id is None or folder_id in self._removed:
+            return None
+        ids = self._children.get(folder_id)
+        if ids is None and self._snapshot is not None:
+            index = self._snapshot.find(folder_id)
+            if index is not None:
+                ids = [self._snapshot.record(child)[R_ID] for child in self._snapshot.children(index)]
+        if ids is None:
+            return None
+        return [child for child in ids if child not in self._removed]
+
+    def page(self, folder_id: str, skip_count: int, max_items: int) -> Optional[Dict[str, Any]]:
+        """O pagină de listare în formatul Alfresco ('list'), dacă oglinda e proaspătă"""
+        if not self.is_fresh() or self._resolve(folder_id) in self._dirty:
+            return None
+        ids = self.children_ids(folder_id)
+        if ids is None:
+            return None
+        selected = ids[skip_count:skip_count + max_items]
+        entries = []
+        for child_id in selected:
+            record = self.node(child_id)
+            if record is not None:
+                entries.append({"entry": record_to_entry(record)})
+        self.served += 1
+        return {
+            "pagination": {
+                "count": len(entries),
+                "hasMoreItems": skip_count + max_items < len(ids),
+                "totalItems": len(ids),
+                "skipCount": skip_count,
+                "maxItems": max_items
+            },
+            "entries": entries
+        }
+
+    def entry(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Intrarea unui nod (cu calea părintelui), dacă oglinda e proaspătă"""
+        if not self.is_fresh() or self._resolve(node_id) in self._dirty:
+            return None
+        record = self.node(node_id)
+        if record is None:
+            return None
+        entry = record_to_entry(record)
+        parent_path = self._path_of(record[R_PARENT]) if record[R_PARENT] else None
+        if parent_path:
+            entry["path"] = {"name": parent_path, "isRoot": False}
+        elif record[R_ID] == self.root_id:
+            entry["path"] = {"name": "/", "isRoot": True}
+        self.served += 1
+        return entry
+
+    # --- Modificări locale ---
+
+    def mark_dirty(self, folder_id: str):
+        """Folderul s-a modificat prin acest server: nu îl mai servim până la re-listare"""
+        resolved = self._resolve(folder_id)
+        if resolved:
+            self._dirty.add(resolved)
+
+    def remove(self, node_id: str):
+        record = self.node(node_id)
+        if record is None:
+            return
+        if record[R_PARENT]:
+            self.mark_dirty(record[R_PARENT])
+        self._remove_subtree(record[R_ID])
+
+    # --- Sincronizare ---
+
+    async def sync(self):
+        """Crawl complet la prima rulare, apoi doar părinții nodurilor schimbate (sau folderele cu modifiedAt schimbat)"""
+        async with self._lock:
+            feed = self._feed()
+            if feed is not None and self.checkpoint is not None and self.root_id is not None:
+                await self._refresh_delta(feed)
+            else:
+                # Checkpoint-ul se fixează înaintea trecerii complete, ca modificările din timpul ei să nu se piardă
+                checkpoint = await self._start_checkpoint(feed)
+                if self.root_id is None:
+                    root = await self.server._fetch_node(ROOT_ID, MIRROR, cache=False)
+                    self.root_id = root["id"]
+                    self._nodes[self.root_id] = entry_to_record(root)
+                    await self._crawl([self.root_id])
+                else:
+                    await self._refresh()
+                self.checkpoint = checkpoint
+            self.syncs += 1
+            self.synced_at = self.clock()
+            if len(self._nodes) >= self.compact_threshold or (self.snapshot_path and self.syncs == 1):
+                await self.compact()
+
+    def _feed(self) -> Optional[Any]:
+        """Fluxul de modificări, dacă există și Search API nu s-a dovedit indisponibil"""
+        if self.feed is None or getattr(self.server, "search_available", None) is False:
+            return None
+        return self.feed
+
+    async def _start_checkpoint(self, feed: Optional[Any]) -> Optional[str]:
+        if feed is None:
+            return None
+        try:
+            _, checkpoint = await feed.changes(None)
+            return checkpoint
+        except Exception as e:
+            print(f"⚠️ Fluxul de modificări al oglinzii indisponibil: {e}", file=sys.stderr)
+            return None
+
+    async def _refresh_delta(self, feed: Any):
+        """O interogare pentru nodurile schimbate de la checkpoint; se re-listează doar părinții lor (vechi și noi)"""
+        changes, checkpoint = await feed.changes(self.checkpoint)
+        parents = set(self._dirty)
+        for change in changes:
+            record = self.node(change["id"])
+            if record is not None and record[R_PARENT]:
+                parents.add(record[R_PARENT])
+            if change.get("parentId"):
+                parents.add(change["parentId"])
+
+        folders = []
+        for folder_id in parents:
+            record = self.node(folder_id)
+            # Părinții necunoscuți sunt foldere noi: apar la re-listarea strămoșului lor, care s-a schimbat și el
+            if record is not None and record[R_FOLDER]:
+                folders.append(record[R_ID])
+        await self._crawl(folders, only_new=True)
+        self.checkpoint = checkpoint
+        self.delta_syncs += 1
+
+    async def _refresh(self):
+        folders = [self.root_id] + [f for f in self._known_folders() if f != self.root_id]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        changed: Dict[str, Optional[str]] = {}
+
+        async def check(folder_id: str):
+            async with semaphore:
+                try:
+                    current = await self.server._fetch_node(folder_id, MODIFIED, cache=False)
+                except Exception as e:
+                    if getattr(getattr(e, "response", None), "status_code", None) == 404:
+                        self._remove_subtree(folder_id)
+                        return
+                    raise
+            self.folders_checked += 1
+            record = self.node(folder_id)
+            if folder_id in self._dirty or record is None or record[R_MODIFIED] != current.get("modifiedAt"):
+                changed[folder_id] = current.get("modifiedAt")
+
+        await asyncio.gather(*(check(folder_id) for folder_id in folders))
+        await self._crawl(list(changed), only_new=True)
+
+        # Abia după re-listare reținem noul modifiedAt, ca un eșec să fie reîncercat data viitoare
+        for folder_id, modified_at in changed.items():
+            record = self.node(folder_id)
+            if record is not None:
+                self._nodes[folder_id] = record[:R_MODIFIED] + (modified_at,) + record[R_MODIFIED + 1:]
+
+    async def _crawl(self, folders: Iterable[str], only_new: bool = False):
+        """Listează folderele nivel cu nivel, concurent; cu only_new coboară doar în subfolderele noi"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        level = list(folders)
+        while level:
+            async def relist(folder_id: str) -> List[str]:
+                async with semaphore:
+                    entries = []
+                    try:
+                        async for page in self.server.iter_children_pages(folder_id, cache=False, projection=MIRROR):
+                            entries.extend(wrapper["entry"] for wrapper in page.get("entries", []))
+                    except Exception as e:
+                        if getattr(getattr(e, "response", None), "status_code", None) == 404:
+                            self._remove_subtree(folder_id)
+                            return []
+                        raise
+                return self._apply_listing(folder_id, entries, only_new)
+
+            results = await asyncio.gather(*(relist(folder_id) for folder_id in level))
+            level = [child for children in results for child in children]
+
+    def _apply_listing(self, folder_id: str, entries: List[Dict[str, Any]], only_new: bool) -> List[str]:
+        """Înlocuiește copiii folderului; returnează subfolderele în care trebuie coborât"""
+        previous = set(self.children_ids(folder_id) or [])
+        current = []
+        descend = []
+        for entry in entries:
+            record = entry_to_record(entry)
+            child_id = record[R_ID]
+            known = self.node(child_id)
+            self._removed.discard(child_id)
+            self._nodes[child_id] = record
+            current.append(child_id)
+            if record[R_FOLDER] and (not only_new or known is None):
+                descend.append(child_id)
+        for child_id in previous - set(current):
+            self._remove_subtree(child_id)
+
+        self._children[folder_id] = current
+        self._dirty.discard(folder_id)
+        self.folders_relisted += 1
+        return descend
+
+    def _remove_subtree(self, node_id: str):
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.children_ids(current) or [])
+            self._removed.add(current)
+            self._nodes.pop(current, None)
+            self._children.pop(current, None)
+
+    def _known_folders(self) -> List[str]:
+        folders = []
+        stack = [self.root_id]
+        while stack:
+            folder_id = stack.pop()
+            folders.append(folder_id)
+            for child_id in self.children_ids(folder_id) or []:
+                record = self.node(child_id)
+                if record is not None and record[R_FOLDER]:
+                    stack.append(child_id)
+        return folders
+
+    # --- Snapshot ---
+
+    async def compact(self):
+        """Scrie starea curentă într-un snapshot nou și scoate din overlay ce a intrat în el.
+
+        Snapshot-ul se construiește într-un fir separat, dintr-o copie a overlay-ului, ca bucla de
+        evenimente să nu stea pe un depozit mare; modificările sosite între timp rămân în overlay.
+        """
+        if not self.snapshot_path or self.root_id is None:
+            return
+        root = self.node(self.root_id)
+        if root is None:
+            return
+        nodes, children, removed = dict(self._nodes), dict(self._children), set(self._removed)
+        snapshot = self._snapshot
+
+        def node(node_id: str) -> Optional[NodeRecord]:
+            if node_id in removed:
+                return None
+            record = nodes.get(node_id)
+            if record is None and snapshot is not None:
+                index = snapshot.find(node_id)
+                if index is not None:
+                    record = snapshot.record(index)
+            return record
+
+        def children_of(folder_id: str) -> List[NodeRecord]:
+            ids = children.get(folder_id)
+            if ids is None and snapshot is not None:
+                index = snapshot.find(folder_id)
+                if index is not None:
+                    ids = [snapshot.record(child)[R_ID] for child in snapshot.children(index)]
+            return [record for record in map(node, ids or []) if record is not None]
+
+        count = await asyncio.to_thread(MirrorSnapshot.write, self.snapshot_path, root, children_of)
+        if self._snapshot:
+            self._snapshot.close()
+        self._open_snapshot()
+        for node_id, record in nodes.items():
+            if self._nodes.get(node_id) is record:
+                del self._nodes[node_id]
+        for folder_id, ids in children.items():
+            if self._children.get(folder_id) is ids:
+                del self._children[folder_id]
+        self._removed -= removed
+        print(f"💾 Snapshot oglindă scris: {count} noduri", file=sys.stderr)
+
+    def _open_snapshot(self):
+        self._snapshot = MirrorSnapshot(self.snapshot_path)
+        if len(self._snapshot):
+            self.root_id = self._snapshot.record(0)[R_ID]
+
+    # --- Utilitare ---
+
+    def _resolve(self, node_id: Optional[str]) -> Optional[str]:
+        return self.root_id if node_id == ROOT_ID else node_id
+
+    def _path_of(self, node_id: str) -> Optional[str]:
+        names = []
+        current = node_id
+        while current:
+            record = self.node(current)
+            if record is None:
+                return None
+            names.append(record[R_NAME])
+            if current == self.root_id:
+                break
+            current = record[R_PARENT]
+        return "/" + "/".join(reversed(names))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "fresh": self.is_fresh(),
+            "age": round(self.clock() - self.synced_at, 1) if self.synced_at is not None else None,
+            "snapshot_nodes": len(self._snapshot) if self._snapshot else 0,
+            "overlay_nodes": len(self._nodes),
+            "dirty_folders": len(self._dirty),
+            "syncs": self.syncs,
+            "delta_syncs": self.delta_syncs,
+            "checkpoint": self.checkpoint,
+            "folders_checked": self.folders_checked,
+            "folders_relisted": self.folders_relisted,
+            "served": self.served
+        }
@@ -0,0 +1,197 @@
+"""
+Reziliență pentru apelurile spre Alfresco: reîncercări cu jitter, circuit breaker și timeout-uri adaptive
+"""
+import math
+import random
+import re
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+# Răspunsuri după care o citire merită reîncercată (Alfresco sau proxy-ul din fața lui e temporar indisponibil
+# ori cere să încetinim)
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Răspunsuri care arată că Alfresco (sau proxy-ul din fața lui) nu este disponibil și contează pentru
+# circuit breaker; un alt 5xx (ex: o interogare de căutare greșită) privește doar cererea respectivă
+BREAKER_STATUSES = {502, 503, 504}
+
+# Segmentul de după /nodes/ este un ID; îl înlocuim ca endpoint-urile să se grupeze pe tip de cerere
+_NODE_ID = re.compile(r"(/nodes/)[^/]+")
+
+
+def endpoint_key(method: str, path: str) -> str:
+    """Cheia de endpoint pentru statistici: metoda plus calea cu ID-urile înlocuite"""
+    return method + " " + _NODE_ID.sub(r"\1{id}", path)
+
+
+class CircuitOpenError(Exception):
+    """Alfresco este considerat indisponibil; cererea este refuzată fără să mai plece"""
+
+
+class RetryPolicy:
+    """Reîncercări cu backoff exponențial și full jitter, doar pentru cereri idempotente"""
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.1, max_delay: float = 2.0,
+                 rng: Callable[[float, float], float] = random.uniform):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng
+        self.retries = 0
+
+    def delay(self, attempt: int) -> float:
+        """Pauza înaintea reîncercării cu numărul `attempt` (0 = prima reîncercare)"""
+        return self.rng(0.0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    """closed -> open după `failure_threshold` eșecuri consecutive; după `recovery_time` lasă o cerere de probă.
+
+    Eșecuri sunt doar erorile de conexiune și BREAKER_STATUSES, ca o singură cerere care primește 500
+    să nu închidă accesul tuturor tool-urilor la Alfresco.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_time: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_time = recovery_time
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    def before_call(self) -> bool:
+        """Ridică CircuitOpenError dacă cererea nu are voie să plece; True dacă cererea este proba de revenire"""
+        if self.state == self.OPEN:
+            if self.clock() - self.opened_at < self.recovery_time:
+                self.rejected += 1
+                remaining = self.recovery_time - (self.clock() - self.opened_at)
+                raise CircuitOpenError(f"Alfresco indisponibil (circuit deschis), reîncearcă peste {remaining:.0f}s")
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probe_in_flight:
+                self.rejected += 1
+                raise CircuitOpenError("Alfresco indisponibil (se testează revenirea)")
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def release(self, probe: bool):
+        """Cererea s-a încheiat fără rezultat (anulată sau altă excepție): proba eliberează locul.
+
+        Fără asta, o probă anulată ar lăsa circuitul blocat în half_open pentru totdeauna.
+        """
+        if probe:
+            self._probe_in_flight = False
+
+    def record_success(self):
+        self.failures = 0
+        self._probe_in_flight = False
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        self._probe_in_flight = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = self.clock()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+
+class LatencyTracker:
+    """Latențele recente pe endpoint și timeout-ul derivat din p99-ul lor"""
+
+    def __init__(self, window: int = 200, min_samples: int = 20, multiplier: float = 3.0, floor: float = 1.0):
+        self.window = window
+        self.min_samples = min_samples
+        self.multiplier = multiplier
+        self.floor = floor
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, endpoint: str, seconds: float):
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def samples(self, endpoint: str) -> int:
+        return len(self._samples.get(endpoint, ()))
+
+    def percentile(self, endpoint: str, percent: float) -> Optional[float]:
+        samples = self._samples.get(endpoint)
+        if not samples:
+            return None
+        # Metoda nearest-rank
+        ordered = sorted(samples)
+        index = max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        return ordered[index]
+
+    def timeout(self, endpoint: str, ceiling: float) -> float:
+        """multiplier * p99, între `floor` și timeout-ul configurat; fără destule măsurători, cel configurat"""
+        samples = self._samples.get(endpoint)
+        if samples is None or len(samples) < self.min_samples:
+            return ceiling
+        return min(ceiling, max(self.floor, self.multiplier * self.percentile(endpoint, 99)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            endpoint: {
+                "samples": len(samples),
+                "p50": round(self.percentile(endpoint, 50), 4),
+                "p99": round(self.percentile(endpoint, 99), 4)
+            }
+            for endpoint, samples in self._samples.items()
+        }
+
+
+class HedgePolicy:
+    """Bugetul pentru cereri duplicate (hedging): cel mult `budget` hedge-uri per citire eligibilă"""
+
+    def __init__(self, budget: float = 0.1, percentile: float = 95, min_delay: float = 0.01):
+        self.budget = budget
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        self.denied = 0
+
+    def delay(self, latency: "LatencyTracker", endpoint: str) -> Optional[float]:
+        """După cât timp fără răspuns se trimite duplicatul (p95 observat); None = prea puține măsurători"""
+        if latency.samples(endpoint) < latency.min_samples:
+            return None
+        return max(self.min_delay, latency.percentile(endpoint, self.percentile))
+
+    def allow(self) -> bool:
+        if self.hedges >= self.budget * self.requests:
+            self.denied += 1
+            return False
+        self.hedges += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "wins": self.wins,
+            "denied": self.denied,
+            "budget": self.budget
+        }
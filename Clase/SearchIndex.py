@@ -0,0 +1,188 @@
+"""
+Index full-text local (SQLite FTS5) peste numele, titlul și descrierea nodurilor: căutare fără Solr
+"""
+import re
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+# Ponderile bm25 pe coloane: o potrivire în nume contează mai mult decât una în descriere
+NAME_WEIGHT, TITLE_WEIGHT, DESCRIPTION_WEIGHT = 10.0, 5.0, 1.0
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    title TEXT,
+    description TEXT,
+    type TEXT,
+    parent_id TEXT
+);
+"""
+
+# Tabela FTS oglindește `nodes` (external content), ținută la zi prin triggere
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS nodes_fts USING fts5(
+    name, title, description, content='nodes', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS nodes_ai AFTER INSERT ON nodes BEGIN
+    INSERT INTO nodes_fts(rowid, name, title, description) VALUES (new.rowid, new.name, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_ad AFTER DELETE ON nodes BEGIN
+    INSERT INTO nodes_fts(nodes_fts, rowid, name, title, description)
+    VALUES ('delete', old.rowid, old.name, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS nodes_au AFTER UPDATE ON nodes BEGIN
+    INSERT INTO nodes_fts(nodes_fts, rowid, name, title, description)
+    VALUES ('delete', old.rowid, old.name, old.title, old.description);
+    INSERT INTO nodes_fts(rowid, name, title, description) VALUES (new.rowid, new.name, new.title, new.description);
+END;
+"""
+
+
+def fts5_available() -> bool:
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class SearchIndex:
+    """Index de căutare în SQLite (în memorie sau într-un fișier, ca să supraviețuiască repornirilor).
+
+    Cu FTS5 rezultatele sunt ordonate după bm25 și fiecare termen se potrivește și ca prefix;
+    fără FTS5 (SQLite compilat fără el) se folosește LIKE pe aceleași coloane, cu un scor simplu.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or ":memory:"
+        self.db = sqlite3.connect(self.path)
+        self.db.executescript(_SCHEMA)
+        self.fts = fts5_available()
+        if self.fts:
+            self.db.executescript(_FTS_SCHEMA)
+        self.db.commit()
+
+        self.queries = 0
+        self.updates = 0
+
+    # --- Actualizare ---
+
+    def add(self, node_id: str, name: str, node_type: str, parent_id: Optional[str] = None,
+            title: Optional[str] = None, description: Optional[str] = None):
+        """Adaugă sau actualizează un nod; un titlu / o descriere lipsă (None) păstrează valoarea știută"""
+        self._upsert(node_id, name, node_type, parent_id, title, description)
+        self.db.commit()
+
+    def _upsert(self, node_id: str, name: str, node_type: str, parent_id: Optional[str],
+                title: Optional[str], description: Optional[str]):
+        if not node_id or not name:
+            return
+        self.db.execute(
+            "INSERT INTO nodes(id, name, title, description, type, parent_id) VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET name = excluded.name, type = excluded.type, "
+            "parent_id = COALESCE(excluded.parent_id, nodes.parent_id), "
+            "title = COALESCE(excluded.title, nodes.title), "
+            "description = COALESCE(excluded.description, nodes.description)",
+            (node_id, name, title, description, node_type, parent_id)
+        )
+        self.updates += 1
+
+    def add_entries(self, parent_id: str, entries: List[Dict[str, Any]]):
+        """Înregistrează intrările unei pagini de listare ('list.entries'), cu titlul și descrierea dacă au venit"""
+        for wrapper in entries:
+            entry = wrapper.get("entry", wrapper)
+            properties = entry.get("properties") or {}
+            self._upsert(entry.get("id"), entry.get("name"), "folder" if entry.get("isFolder") else "file",
+                         entry.get("parentId") or parent_id,
+                         properties.get("cm:title"), properties.get("cm:description"))
+        self.db.commit()
+
+    def remove(self, node_id: str, subtree: bool = False):
+        """Scoate un nod; cu subtree=True (ștergere) și tot ce se știe sub el"""
+        if subtree:
+            self.db.execute(
+                "WITH RECURSIVE below(id) AS (SELECT ? UNION SELECT nodes.id FROM nodes JOIN below "
+                "ON nodes.parent_id = below.id) DELETE FROM nodes WHERE id IN below",
+                (node_id,)
+            )
+        else:
+            self.db.execute("DELETE FROM nodes WHERE id = ?", (node_id,))
+        self.db.commit()
+        self.updates += 1
+
+    def clear(self):
+        self.db.execute("DELETE FROM nodes")
+        self.db.commit()
+
+    def close(self):
+        self.db.close()
+
+    # --- Interogare ---
+
+    def search(self, query: str, limit: int = 20, node_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Nodurile care conțin toți termenii (sau, dacă nu există, oricare dintre ei), cele mai relevante primele"""
+        terms = _TOKEN.findall(query)
+        if not terms:
+            return []
+        self.queries += 1
+        results = self._search(terms, " AND ", limit, node_type)
+        if not results and len(terms) > 1:
+            results = self._search(terms, " OR ", limit, node_type)
+        return results
+
+    def _search(self, terms: List[str], operator: str, limit: int, node_type: Optional[str]) -> List[Dict[str, Any]]:
+        type_filter = " AND nodes.type = ?" if node_type else ""
+        type_args = (node_type,) if node_type else ()
+        if self.fts:
+            match = operator.join('"' + term.replace('"', '""') + '"*' for term in terms)
+            rows = self.db.execute(
+                "SELECT nodes.id, nodes.name, nodes.type, nodes.parent_id, nodes.title, nodes.description, "
+                f"bm25(nodes_fts, {NAME_WEIGHT}, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}) AS rank "
+                "FROM nodes_fts JOIN nodes ON nodes.rowid = nodes_fts.rowid "
+                f"WHERE nodes_fts MATCH ?{type_filter} ORDER BY rank LIMIT ?",
+                (match,) + type_args + (limit,)
+            ).fetchall()
+            return [self._row(row[:6], -row[6]) for row in rows]
+
+        # Fallback fără FTS5: fiecare termen trebuie (AND) / poate (OR) să apară într-una din coloane
+        clauses, args, score_parts, score_args = [], [], [], []
+        for term in terms:
+            pattern = f"%{term}%"
+            clauses.append("(name LIKE ? OR COALESCE(title, '') LIKE ? OR COALESCE(description, '') LIKE ?)")
+            args += [pattern] * 3
+            score_parts.append(f"(name LIKE ?) * {NAME_WEIGHT} + (COALESCE(title, '') LIKE ?) * {TITLE_WEIGHT} "
+                               f"+ (COALESCE(description, '') LIKE ?) * {DESCRIPTION_WEIGHT}")
+            score_args += [pattern] * 3
+        rows = self.db.execute(
+            f"SELECT id, name, type, parent_id, title, description, {' + '.join(score_parts)} AS score FROM nodes "
+            f"WHERE ({operator.join(clauses)}){type_filter} ORDER BY score DESC, name LIMIT ?",
+            score_args + args + list(type_args) + [limit]
+        ).fetchall()
+        return [self._row(row[:6], row[6]) for row in rows]
+
+    @staticmethod
+    def _row(row: tuple, score: float) -> Dict[str, Any]:
+        node_id, name, node_type, parent_id, title, description = row
+        return {
+            "id": node_id,
+            "name": name,
+            "type": node_type,
+            "parent_id": parent_id,
+            "title": title,
+            "description": description,
+            "score": round(score, 3)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "fts5" if self.fts else "like",
+            "path": self.path,
+            "nodes": self.db.execute("SELECT COUNT(*) FROM nodes").fetchone()[0],
+            "queries": self.queries,
+            "updates": self.updates
+        }
@@ -0,0 +1,48 @@
+"""
+Single-flight: cererile identice care rulează simultan împart un singur apel spre Alfresco
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Primul apelant pentru o cheie pornește apelul; cei care vin cât timp e în curs îi așteaptă rezultatul.
+
+    Apelul rulează într-un task separat, ca anularea unui apelant să nu-i anuleze și pe ceilalți.
+    După terminare cheia dispare, deci nu se servesc rezultate vechi (nu este un cache).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._finish(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / total, 4) if total else 0.0,
+            "in_flight": len(self._calls)
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Eroarea este deja propagată apelanților; o marcăm ca preluată și dacă toți au fost anulați
+        if not task.cancelled():
+            task.exception()
@@ -3,7 +3,6 @@
 OpenWebUI Adapter pentru MCP HTTP - Versiune adaptată pentru comunicație HTTP
 """
 import asyncio
-import json
 import sys
 import time
 import uuid
@@ -13,6 +12,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from Clase.OpenWebUI import OpenWebUIHTTPAdapter
 from Clase.OpenWebUI import ChatRequest
+from Clase import JsonCodec
+from Clase.JsonCodec import CodecJSONResponse
 
 # Configurare logging
 logging.basicConfig(
@@ -28,7 +29,8 @@ openwebui_adapter = None
 app = FastAPI(
     title="OpenWebUI MCP HTTP Adapter", 
     version="3.0.0",
-    description="Adapter pentru integrarea OpenWebUI cu clientul LLM și serverul MCP Alfresco prin HTTP"
+    description="Adapter pentru integrarea OpenWebUI cu clientul LLM și serverul MCP Alfresco prin HTTP",
+    default_response_class=CodecJSONResponse
 )
 
 # CORS pentru OpenWebUI
@@ -309,7 +311,7 @@ async def stream_chat_response_http(request: ChatRequest, adapter: OpenWebUIHTTP
             }
             
             # Formatează ca Server-Sent Events
-            yield f"data: {json.dumps(chunk)}\n\n"
+            yield f"data: {JsonCodec.dumps(chunk)}\n\n"
             
             # Mică pauză pentru efect de streaming natural
             await asyncio.sleep(0.01)
@@ -329,7 +331,7 @@ async def stream_chat_response_http(request: ChatRequest, adapter: OpenWebUIHTTP
             ]
         }
         
-        yield f"data: {json.dumps(final_chunk)}\n\n"
+        yield f"data: {JsonCodec.dumps(final_chunk)}\n\n"
         yield "data: [DONE]\n\n"
         
         logger.info("✅ Streaming HTTP complet")
@@ -354,7 +356,7 @@ async def stream_chat_response_http(request: ChatRequest, adapter: OpenWebUIHTTP
             ]
         }
         
-        yield f"data: {json.dumps(error_chunk)}\n\n"
+        yield f"data: {JsonCodec.dumps(error_chunk)}\n\n"
         yield "data: [DONE]\n\n"
 
 # Endpoint-urile de management pentru HTTP
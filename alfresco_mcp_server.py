@@ -6,6 +6,7 @@ import asyncio
 import sys
 import os
 from Clase.HttpServer import HTTPAlfrescoMCPServer
+from Clase.AlfrescoTransport import parse_timeouts
 
 def setup_virtual_env():
     """Detectează și activează virtual environment-ul automat"""
@@ -66,18 +67,72 @@ def main():
     setup_virtual_env()
     
     # Configurare din environment variables
-    alfresco_url = os.getenv("ALFRESCO_URL", "http://localhost:8080")
+    # Mai multe noduri ale aceluiași cluster se dau separate prin virgulă; primul primește scrierile
+    alfresco_urls = [url.strip() for url in os.getenv("ALFRESCO_URL", "http://localhost:8080").split(",") if url.strip()]
+    alfresco_url = alfresco_urls[0]
     alfresco_user = os.getenv("ALFRESCO_USER", "admin")
     alfresco_password = os.getenv("ALFRESCO_PASSWORD", "admin")
     server_port = int(os.getenv("MCP_SERVER_PORT", "8002"))
     server_host = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
     
+    # Tuning pentru accesul la Alfresco (paginare, cache)
+    alfresco_options = {
+        "page_size": int(os.getenv("ALFRESCO_PAGE_SIZE", "100")),
+        "prefetch_window": int(os.getenv("ALFRESCO_PREFETCH_WINDOW", "4")),
+        "cache_ttl": float(os.getenv("ALFRESCO_CACHE_TTL", "30")),
+        "cache_size": int(os.getenv("ALFRESCO_CACHE_SIZE", "2048")),
+        "path_ttl": float(os.getenv("ALFRESCO_PATH_TTL", "300")),
+        "name_index_crawl": os.getenv("ALFRESCO_NAME_INDEX_CRAWL", "true").lower() == "true",
+        "mirror": os.getenv("ALFRESCO_MIRROR", "false").lower() == "true",
+        "mirror_snapshot": os.getenv("ALFRESCO_MIRROR_SNAPSHOT") or None,
+        "mirror_staleness": float(os.getenv("ALFRESCO_MIRROR_STALENESS", "300")),
+        "mirror_interval": float(os.getenv("ALFRESCO_MIRROR_INTERVAL", "60")),
+        "bulk_concurrency": int(os.getenv("ALFRESCO_BULK_CONCURRENCY", "8")),
+        "walk_concurrency": int(os.getenv("ALFRESCO_WALK_CONCURRENCY", "8")),
+        "content_preview_bytes": int(os.getenv("ALFRESCO_CONTENT_PREVIEW_BYTES", "8192")),
+        "content_spool_bytes": int(os.getenv("ALFRESCO_CONTENT_SPOOL_BYTES", str(1024 * 1024))),
+        "content_max_bytes": int(os.getenv("ALFRESCO_CONTENT_MAX_BYTES", str(10 * 1024 * 1024))),
+        "upload_root": os.getenv("ALFRESCO_UPLOAD_ROOT") or None,
+        "max_connections": int(os.getenv("ALFRESCO_MAX_CONNECTIONS", "20")),
+        "max_keepalive": int(os.getenv("ALFRESCO_MAX_KEEPALIVE", "10")),
+        "keepalive_expiry": float(os.getenv("ALFRESCO_KEEPALIVE_EXPIRY", "30")),
+        "http2": os.getenv("ALFRESCO_HTTP2", "false").lower() == "true",
+        "timeouts": parse_timeouts(os.getenv("ALFRESCO_TIMEOUTS")),
+        "single_flight": os.getenv("ALFRESCO_SINGLE_FLIGHT", "true").lower() == "true",
+        "retry_attempts": int(os.getenv("ALFRESCO_RETRY_ATTEMPTS", "3")),
+        "breaker_threshold": int(os.getenv("ALFRESCO_BREAKER_THRESHOLD", "5")),
+        "breaker_recovery": float(os.getenv("ALFRESCO_BREAKER_RECOVERY", "30")),
+        "adaptive_timeouts": os.getenv("ALFRESCO_ADAPTIVE_TIMEOUTS", "true").lower() == "true",
+        "hedging": os.getenv("ALFRESCO_HEDGING", "false").lower() == "true",
+        "hedge_budget": float(os.getenv("ALFRESCO_HEDGE_BUDGET", "0.1")),
+        "rate_limit": float(os.getenv("ALFRESCO_RATE_LIMIT", "0")),
+        "rate_burst": float(os.getenv("ALFRESCO_RATE_BURST")) if os.getenv("ALFRESCO_RATE_BURST") else None,
+        "adaptive_concurrency": os.getenv("ALFRESCO_ADAPTIVE_CONCURRENCY", "true").lower() == "true",
+        "min_concurrency": int(os.getenv("ALFRESCO_MIN_CONCURRENCY", "1")),
+        "endpoints": alfresco_urls[1:],
+        "health_interval": float(os.getenv("ALFRESCO_HEALTH_INTERVAL", "10")),
+        "search_index": os.getenv("ALFRESCO_SEARCH_INDEX", "true").lower() == "true",
+        "search_index_path": os.getenv("ALFRESCO_SEARCH_INDEX_PATH") or None,
+        "search_api": os.getenv("ALFRESCO_SEARCH_API", "true").lower() == "true",
+        "search_facet_ttl": float(os.getenv("ALFRESCO_SEARCH_FACET_TTL", "60")),
+        "output_budget": int(os.getenv("ALFRESCO_OUTPUT_BUDGET", "1000")),
+        "continuation_ttl": float(os.getenv("ALFRESCO_CONTINUATION_TTL", "600")),
+        "persistent_cache": os.getenv("ALFRESCO_PERSISTENT_CACHE") or None,
+        "persistent_cache_max_age": float(os.getenv("ALFRESCO_PERSISTENT_CACHE_MAX_AGE", "86400")),
+        "change_feed": os.getenv("ALFRESCO_CHANGE_FEED") or None,
+        "change_feed_interval": float(os.getenv("ALFRESCO_CHANGE_FEED_INTERVAL", "30")),
+        "change_feed_folders": [folder.strip() for folder in os.getenv("ALFRESCO_CHANGE_FEED_FOLDERS", "").split(",")
+                                if folder.strip()],
+        "audit_app": os.getenv("ALFRESCO_AUDIT_APP", "alfresco-access"),
+    }
+    
     # Creează și pornește serverul HTTP
     server = HTTPAlfrescoMCPServer(
         base_url=alfresco_url,
         username=alfresco_user,
         password=alfresco_password,
-        port=server_port
+        port=server_port,
+        alfresco_options=alfresco_options
     )
     
     server.run(host=server_host)
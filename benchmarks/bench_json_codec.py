@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru codec-ul JSON: timpul per hop cu json standard vs orjson
+
+Rulare: python benchmarks/bench_json_codec.py [numar_elemente]
+"""
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase import JsonCodec
+
+
+def alfresco_listing(count: int) -> bytes:
+    """Un răspuns de listare Alfresco cu `count` intrări"""
+    entries = [{"entry": {
+        "id": f"5f3c9a1e-0000-4000-8000-{index:012d}", "name": f"Document ofertă {index}.pdf",
+        "isFolder": False, "isFile": True, "parentId": "8e2d6b7a-0000-4000-8000-000000000001",
+        "nodeType": "cm:content", "createdAt": "2024-05-10T09:12:44.123+0000",
+        "modifiedAt": "2024-05-11T15:02:13.456+0000",
+        "createdByUser": {"id": "admin", "displayName": "Administrator"},
+        "modifiedByUser": {"id": "admin", "displayName": "Administrator"},
+        "content": {"mimeType": "application/pdf", "sizeInBytes": 1024 * index, "encoding": "UTF-8"},
+    }} for index in range(count)]
+    return json.dumps({"list": {"pagination": {"count": count, "hasMoreItems": False}, "entries": entries}}).encode()
+
+
+def tool_result(count: int) -> dict:
+    """Rezultatul formatat de format_simple_response pentru o listare"""
+    return {
+        "context": "folder 8e2d6b7a",
+        "summary": f"Folderul conține {count} elemente",
+        "items": [f"- Document ofertă {index}.pdf [file] (ID: 5f3c9a1e-{index:012d})" for index in range(count)],
+    }
+
+
+def sse_chunk(word: str) -> dict:
+    return {"id": "chatcmpl-1", "object": "chat.completion.chunk", "created": 1700000000, "model": "alfresco",
+            "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]}
+
+
+def measure(label: str, stdlib, codec, number: int):
+    stdlib_time = min(timeit.repeat(stdlib, number=number, repeat=5)) / number
+    codec_time = min(timeit.repeat(codec, number=number, repeat=5)) / number
+    print(f"{label:<38} {stdlib_time * 1e6:>10.1f} µs {codec_time * 1e6:>10.1f} µs {stdlib_time / codec_time:>8.1f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    listing = alfresco_listing(count)
+    result = tool_result(count)
+    chunk = sse_chunk("Ofertă ")
+    mcp_response = {"jsonrpc": "2.0", "id": "1", "result": {"content": [{"type": "text", "text": json.dumps(result)}]}}
+
+    print(f"Codec: {JsonCodec.BACKEND}, listare de {count} elemente ({len(listing) / 1024:.0f} KB)\n")
+    print(f"{'Hop':<38} {'json':>13} {JsonCodec.BACKEND:>13} {'câștig':>9}")
+    measure("Răspuns Alfresco (decode)", lambda: json.loads(listing), lambda: JsonCodec.loads(listing), 20)
+    measure("Rezultat tool MCP (encode, indentat)",
+            lambda: json.dumps(result, indent=1, ensure_ascii=False), lambda: JsonCodec.dumps(result, pretty=True), 50)
+    measure("Răspuns HTTP /mcp (encode)",
+            lambda: json.dumps(mcp_response, ensure_ascii=False).encode(), lambda: JsonCodec.dumpb(mcp_response), 50)
+    measure("Chunk SSE în adapter (encode)", lambda: json.dumps(chunk), lambda: JsonCodec.dumps(chunk), 20000)
+    measure("Debug dump în client (encode, indentat)",
+            lambda: json.dumps(mcp_response, indent=2), lambda: JsonCodec.dumps(mcp_response, pretty=True), 50)
+
+
+if __name__ == "__main__":
+    main()
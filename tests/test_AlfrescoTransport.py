@@ -0,0 +1,52 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.AlfrescoTransport import AlfrescoTransport, nodes_path, parse_timeouts, CORE_API
+
+def test_nodes_path_and_timeouts():
+    assert nodes_path("-root-") == f"{CORE_API}/nodes/-root-"
+    assert nodes_path("abc", "children") == f"{CORE_API}/nodes/abc/children"
+
+    timeouts = parse_timeouts("read=3, upload=600,invalid")
+    assert timeouts["read"] == 3.0
+    assert timeouts["upload"] == 600.0
+    assert timeouts["write"] == 15.0
+
+    transport = AlfrescoTransport("admin", "admin", timeouts=timeouts)
+    assert transport.timeout("upload").read == 600.0
+    assert transport.timeout("necunoscut").read == 3.0
+    assert transport.timeout("read").connect == 5.0
+
+@pytest.mark.asyncio
+async def test_client_limits_and_headers():
+    transport = AlfrescoTransport("admin", "secret", max_connections=4, max_keepalive=10, keepalive_expiry=12.0)
+    assert transport.max_keepalive == 4
+
+    client = transport.create_client()
+    try:
+        pool = client._transport._pool
+        assert pool._max_connections == 4
+        assert pool._keepalive_expiry == 12.0
+        assert client.headers["Authorization"].startswith("Basic ")
+        stats = transport.stats(client)
+        assert stats["connections"] == 0
+        assert stats["idle"] == 0
+    finally:
+        await client.aclose()
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(AlfrescoTransport, "_http2_available", staticmethod(lambda: False))
+    assert AlfrescoTransport("admin", "admin", http2=True).http2 is False
+
+def test_track_counts_in_use_and_waits():
+    transport = AlfrescoTransport("admin", "admin", max_connections=2)
+    with transport.track("read"):
+        with transport.track("read"):
+            with transport.track("write"):
+                assert transport.stats()["in_use"] == 3
+    stats = transport.stats()
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 3
+    assert stats["waits"] == 1
+    assert stats["per_operation"] == {"read": 2, "write": 1}
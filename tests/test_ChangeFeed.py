@@ -0,0 +1,121 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import MagicMock
+from Clase.ChangeFeed import (DELETED_NODES, AuditChangeFeed, ChangeFeedPoller, LocalChangeFeed, SearchChangeFeed,
+                              format_time, parse_time)
+
+def json_response(body):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value=body)
+    return response
+
+@pytest.mark.asyncio
+async def test_poller_coalesces_changes_and_advances_checkpoint():
+    feed = LocalChangeFeed()
+    applied = []
+
+    async def apply(change):
+        applied.append(change)
+
+    poller = ChangeFeedPoller(feed, apply)
+    feed.record("old", name="inainte de pornire")
+    assert await poller.poll() == 0
+
+    feed.record("a", parent_id="f1", name="v1")
+    feed.record("b", deleted=True)
+    feed.record("a", parent_id="f1", name="v2")
+    assert await poller.poll() == 2
+    assert [(c["id"], c.get("name")) for c in applied] == [("b", None), ("a", "v2")]
+    assert poller.stats()["coalesced"] == 1
+    assert await poller.poll() == 0
+
+@pytest.mark.asyncio
+async def test_failed_round_is_retried_from_the_same_checkpoint():
+    feed = LocalChangeFeed()
+    attempts = []
+
+    async def apply(change):
+        attempts.append(change["id"])
+        if len(attempts) == 1:
+            raise RuntimeError("Alfresco indisponibil")
+
+    poller = ChangeFeedPoller(feed, apply)
+    await poller.poll()
+    feed.record("a", parent_id="f1", name="doc")
+    with pytest.raises(RuntimeError):
+        await poller.poll()
+    assert await poller.poll() == 1
+    assert attempts == ["a", "a"]
+
+@pytest.mark.asyncio
+async def test_search_feed_queries_modified_since_checkpoint_and_trashcan():
+    requests = []
+
+    async def send(method, path, op="read", **kwargs):
+        requests.append((method, path, kwargs))
+        if path == DELETED_NODES:
+            return json_response({"list": {"entries": [
+                {"entry": {"id": "gone", "parentId": "f1", "archivedAt": "2024-05-01T10:00:09.000+0000"}},
+                {"entry": {"id": "older", "archivedAt": "2024-04-01T00:00:00.000+0000"}}
+            ]}})
+        return json_response({"list": {"pagination": {"hasMoreItems": False}, "entries": [
+            {"entry": {"id": "a", "name": "doc", "parentId": "f1", "isFolder": False,
+                       "modifiedAt": "2024-05-01T10:00:07.000+0000", "aspectNames": ["x"]}}
+        ]}})
+
+    feed = SearchChangeFeed(send, folders=["f1"], overlap=5.0)
+    changes, checkpoint = await feed.changes("2024-05-01T10:00:00.000Z")
+
+    query = requests[0][2]["json"]["query"]["query"]
+    assert 'cm:modified:["2024-05-01T09:59:55.000Z" TO MAX]' in query
+    assert 'ANCESTOR:"workspace://SpacesStore/f1"' in query
+    assert changes == [
+        {"id": "a", "name": "doc", "parentId": "f1", "isFolder": False,
+         "modifiedAt": "2024-05-01T10:00:07.000+0000", "deleted": False},
+        {"id": "gone", "parentId": "f1", "deleted": True}
+    ]
+    assert checkpoint == "2024-05-01T10:00:09.000Z"
+
+@pytest.mark.asyncio
+async def test_search_feed_pages_through_a_burst_sharing_one_timestamp():
+    burst = [{"entry": {"id": f"n{index}", "name": f"n{index}", "parentId": "f1", "isFolder": False,
+                        "modifiedAt": "2024-05-01T10:00:07.000+0000"}} for index in range(5)]
+    queries = []
+
+    async def send(method, path, op="read", **kwargs):
+        if path == DELETED_NODES:
+            return json_response({"list": {"entries": []}})
+        paging = kwargs["json"]["paging"]
+        queries.append((kwargs["json"]["query"]["query"], paging["skipCount"]))
+        end = paging["skipCount"] + paging["maxItems"]
+        return json_response({"list": {"pagination": {"hasMoreItems": end < len(burst)},
+                                        "entries": burst[paging["skipCount"]:end]}})
+
+    feed = SearchChangeFeed(send, page_size=2, max_changes=3, overlap=5.0)
+    first, checkpoint = await feed.changes("2024-05-01T10:00:05.000Z")
+    assert [c["id"] for c in first] == ["n0", "n1", "n2", "n3"]
+    assert checkpoint == "2024-05-01T10:00:00.000Z#4"
+
+    rest, checkpoint = await feed.changes(checkpoint)
+    assert [c["id"] for c in rest] == ["n4"]
+    assert checkpoint == "2024-05-01T10:00:07.000Z"
+    # Continuarea folosește aceeași fereastră, fără să scadă din nou suprapunerea
+    assert queries[-1] == (queries[0][0], 4)
+
+def test_audit_entries_map_to_changes():
+    assert AuditChangeFeed.parse_entry({
+        "/alfresco-access/transaction/action": "DELETE",
+        "/alfresco-access/transaction/node": "workspace://SpacesStore/abc-1"
+    }) == {"id": "abc-1", "deleted": True, "moved": False}
+    assert AuditChangeFeed.parse_entry({
+        "/alfresco-access/transaction/copy/from/node": "workspace://SpacesStore/source",
+        "/alfresco-access/transaction/action": "MOVE",
+        "/alfresco-access/transaction/node": "workspace://SpacesStore/abc-2"
+    })["id"] == "abc-2"
+    assert AuditChangeFeed.parse_entry({"/alfresco-access/login/user": "admin"}) is None
+
+def test_time_round_trip():
+    assert format_time(parse_time("2024-05-01T10:00:00.250+0000")) == "2024-05-01T10:00:00.250Z"
@@ -0,0 +1,70 @@
+import pytest
+import asyncio
+import httpx
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.ConcurrencyLimiter import AdaptiveConcurrencyLimiter
+
+def test_limit_grows_while_latency_is_flat_and_backs_off_when_it_inflates():
+    now = [0.0]
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=6, clock=lambda: now[0])
+
+    for _ in range(40):
+        limiter.observe(0.1)
+    assert limiter.limit == 6
+    assert limiter.baseline == pytest.approx(0.1)
+
+    now[0] = 10
+    limiter.observe(0.5)
+    assert limiter.limit == pytest.approx(5.4)
+    # Cel mult o scădere pe round-trip
+    limiter.observe(0.5)
+    assert limiter.limit == pytest.approx(5.4)
+    now[0] = 11
+    limiter.observe(0.5)
+    assert limiter.limit == pytest.approx(4.86)
+    assert limiter.stats()["decreases"] == 2
+
+def test_unused_limit_does_not_grow():
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=10)
+    limiter.observe(0.1, utilized=False)
+    assert limiter.limit == 4
+
+@pytest.mark.asyncio
+async def test_requests_over_the_limit_queue_and_network_errors_shrink_it():
+    limiter = AdaptiveConcurrencyLimiter(initial=2, min_limit=1, max_limit=2)
+    release = asyncio.Event()
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            await release.wait()
+
+    tasks = [asyncio.create_task(request()) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert limiter.stats()["queue_depth"] == 3
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2 and limiter.in_flight == 0
+    assert limiter.stats()["peak_queue_depth"] == 3
+
+    with pytest.raises(httpx.ConnectError):
+        async with limiter.slot():
+            raise httpx.ConnectError("refused")
+    assert limiter.drops == 1 and limiter.limit == pytest.approx(1.8)
+    assert limiter.in_flight == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    limiter.release()
+    assert limiter.in_flight == 0 and limiter.stats()["queue_depth"] == 0
@@ -0,0 +1,52 @@
+import pytest
+import httpx
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.EndpointPool import READY_PROBE, EndpointPool
+from unittest.mock import MagicMock
+
+def test_reads_pick_least_outstanding_writes_the_preferred_node():
+    pool = EndpointPool(["http://a:8080/", "http://b:8080", "http://c:8080"])
+    a, b, c = pool.endpoints
+
+    with pool.track(a), pool.track(b):
+        assert pool.pick() is c
+    with pool.track(a):
+        assert pool.pick() in (b, c)
+        assert pool.pick(write=True) is a
+
+    # Fără încărcare, citirile se rotesc prin toate nodurile
+    assert {pool.pick().url for _ in range(3)} == {"http://a:8080", "http://b:8080", "http://c:8080"}
+
+def test_unhealthy_nodes_leave_rotation_and_writes_fail_over():
+    pool = EndpointPool(["http://a:8080", "http://b:8080"])
+    a, b = pool.endpoints
+    pool.mark_down(a, "refused")
+
+    assert pool.pick() is b and pool.pick(write=True) is b
+    # Niciun nod sănătos: se încearcă totuși
+    pool.mark_down(b, "refused")
+    assert pool.pick(write=True) is a
+
+@pytest.mark.asyncio
+async def test_health_check_marks_nodes_down_and_back_up():
+    pool = EndpointPool(["http://a:8080", "http://b:8080"])
+    probed = []
+    down = {"http://b:8080"}
+
+    async def probe(url):
+        probed.append(url)
+        if url.startswith(tuple(down)):
+            raise httpx.ConnectError("refused")
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+    await pool.check(probe)
+    assert probed == ["http://a:8080" + READY_PROBE, "http://b:8080" + READY_PROBE]
+    assert pool.stats()["healthy"] == 1
+
+    down.clear()
+    await pool.check(probe)
+    assert pool.stats()["healthy"] == 2
@@ -181,4 +181,63 @@ async def test_handle_prompts_get(http_server, monkeypatch):
     result = data["result"]
     assert result["name"]["name"] == "test_prompt"
     assert result["description"] == "Fake description"
-    assert isinstance(result["messages"], list)
\ No newline at end of file
+    assert isinstance(result["messages"], list)
+
+@pytest.mark.asyncio
+async def test_debug_stats(http_server):
+
+    http_server.alfresco_server.get_stats.return_value = {"cache": {"nodes": {"hits": 3}}}
+
+    client = TestClient(http_server.app)
+    response = client.get("/debug/stats")
+
+    assert response.status_code == 200
+    assert response.json()["cache"]["nodes"]["hits"] == 3
+
+@pytest.mark.asyncio
+async def test_handle_resources_read_content(http_server):
+
+    http_server.alfresco_server.ensure_connection = AsyncMock()
+    http_server.alfresco_server.read_content_resource = AsyncMock(return_value={
+        "uri": "alfresco://nodes/abc/content", "mimeType": "text/plain", "text": "Salut"
+    })
+
+    client = TestClient(http_server.app)
+    response = client.post("/mcp", json={
+        "jsonrpc": "2.0",
+        "id": "13",
+        "method": "resources/read",
+        "params": {"uri": "alfresco://nodes/abc/content"}
+    })
+
+    assert response.status_code == 200
+    assert response.json()["result"]["contents"][0]["text"] == "Salut"
+    http_server.alfresco_server.read_content_resource.assert_awaited_once_with("alfresco://nodes/abc/content")
+
+@pytest.mark.asyncio
+async def test_search_tool_registered_only_when_probe_succeeds():
+    server = HTTPAlfrescoMCPServer("http://fake-url", "admin", "admin")
+    assert "search" not in [tool["name"] for tool in server._define_tools()]
+
+    server.alfresco_server.search_available = True
+    tools = server._define_tools()
+    assert tools[-1]["name"] == "search"
+    assert tools[-1]["inputSchema"]["required"] == ["query"]
+
+@pytest.mark.asyncio
+async def test_http_and_mcp_share_one_tool_registry(tmp_path):
+    import mcp.types as types
+    server = HTTPAlfrescoMCPServer("http://fake-url", "admin", "admin")
+    alfresco = server.alfresco_server
+    handler = alfresco.get_server().request_handlers[types.ListToolsRequest]
+
+    async def mcp_tools():
+        result = await handler(types.ListToolsRequest(method="tools/list"))
+        return [tool.model_dump(exclude_none=True) for tool in result.root.tools]
+
+    assert "upload_content" not in [tool["name"] for tool in server._define_tools()]
+    alfresco.upload_root = str(tmp_path)
+    alfresco.search_available = True
+    assert server._define_tools() == await mcp_tools()
+    assert {"upload_content", "search", "continue"} <= {tool["name"] for tool in server._define_tools()}
+    assert alfresco.tool_context("get_node_children", {"node_id": "f1"}) == "folder f1"
@@ -0,0 +1,42 @@
+import json
+import pytest
+import httpx
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from unittest.mock import MagicMock
+from Clase import JsonCodec
+
+PAYLOAD = {"summary": "Folderul 'Ofertă' conține 2 elemente", "items": ["- a [file]", "- b [folder]"], 1: None}
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(JsonCodec, "orjson", None)
+    elif JsonCodec.orjson is None:
+        pytest.skip("orjson nu este instalat")
+    return request.param
+
+def test_roundtrip_keeps_diacritics(backend):
+    text = JsonCodec.dumps(PAYLOAD)
+    assert "Ofertă" in text
+    assert JsonCodec.loads(text) == {**{k: v for k, v in PAYLOAD.items() if k != 1}, "1": None}
+    assert JsonCodec.loads(JsonCodec.dumpb(PAYLOAD, pretty=True)) == json.loads(text)
+    assert "\n  " in JsonCodec.dumps(PAYLOAD, pretty=True)
+
+def test_values_orjson_rejects_fall_back_to_stdlib(backend):
+    big = {"size": 2 ** 70}
+    assert JsonCodec.loads(JsonCodec.dumps(big)) == big
+
+def test_parse_response_reads_bytes_or_uses_json_method(backend):
+    response = httpx.Response(200, content='{"entry": {"name": "Ofertă"}}'.encode("utf-8"))
+    assert JsonCodec.parse_response(response)["entry"]["name"] == "Ofertă"
+
+    mocked = MagicMock()
+    mocked.json.return_value = {"list": {}}
+    assert JsonCodec.parse_response(mocked) == {"list": {}}
+
+def test_codec_json_response_renders_utf8(backend):
+    response = JsonCodec.CodecJSONResponse({"text": "Ofertă"})
+    assert response.body == '{"text":"Ofertă"}'.encode("utf-8")
+    assert response.headers["content-type"] == "application/json"
@@ -1,4 +1,7 @@
 import pytest
+import asyncio
+import base64
+from contextlib import asynccontextmanager
 import pytest_asyncio
 import httpx
 import sys
@@ -254,21 +257,78 @@ async def test_get_node_info_not_found(server):
         await server.get_node_info(node_id)
 
 @pytest.mark.asyncio
-async def test_browse_by_path_company_home_found(server):
-    # Simulăm că avem un folder "Company Home"
-    server.get_node_children = AsyncMock(side_effect=[
-        {
-            "items": [{"name": "Company Home", "type": "folder", "id": "company-home-id"}]
-        },
-        {
-            "items": [{"id": "abc", "name": "doc", "type": "file"}],
-            "message": "conținut companie"
-        }
-    ])
+async def test_browse_by_path_resolves_relative_path(server):
+    # Un singur apel cu relativePath rezolvă toată calea și populează indexul
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value={"entry": {
+        "id": "site-id", "name": "test-site", "isFolder": True, "parentId": "sites-id",
+        "path": {"elements": [{"id": "root-id", "name": "Company Home"}, {"id": "sites-id", "name": "Sites"}]}
+    }})
+    server.client.get = AsyncMock(return_value=response)
+    server.get_node_children = AsyncMock(return_value={
+        "items": [{"id": "abc", "name": "doc", "type": "file"}],
+        "message": "conținut site"
+    })
 
-    result = await server.browse_by_path("/Company Home")
-    assert "Navighează la path" in result["message"]
+    result = await server.browse_by_path("/Company Home/Sites/test-site")
+    assert "Navighează la path: /Company Home/Sites/test-site" in result["message"]
     assert result["items"][0]["name"] == "doc"
+    server.get_node_children.assert_awaited_with("site-id", 20, None)
+    assert server.client.get.call_args.kwargs["params"]["relativePath"] == "Sites/test-site"
+
+    # A doua oară calea vine din index, fără apel către Alfresco
+    await server.browse_by_path("/Sites/test-site")
+    assert server.client.get.await_count == 1
+    assert server.path_index.path_of("sites-id") == "/Company Home/Sites"
+
+@pytest.mark.asyncio
+async def test_browse_by_path_falls_back_to_segment_walk(server):
+    rejected = MagicMock()
+    rejected.status_code = 400
+    rejected.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Bad Request", request=MagicMock(), response=rejected
+    )
+
+    async def fake_get(url, params=None, **kwargs):
+        if "relativePath" in params:
+            return rejected
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {"entries": [
+            {"entry": {"id": "docs-id", "name": "Docs", "isFolder": True}}
+        ]}} if url.endswith("/-root-/children") else {"list": {"entries": []}})
+        return response
+
+    server.client.get = fake_get
+
+    result = await server.browse_by_path("/docs")
+    assert result["parent_id"] == "docs-id"
+
+@pytest.mark.asyncio
+async def test_browse_by_path_not_found(server):
+    response = MagicMock()
+    response.status_code = 404
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "Not Found", request=MagicMock(), response=response
+    )
+    server.client.get = AsyncMock(return_value=response)
+
+    result = await server.browse_by_path("/Inexistent")
+    assert result["error"] is True
+
+@pytest.mark.asyncio
+async def test_complete_path(server):
+    server.path_index.add("-root-", "sites-id", "Sites", True)
+    server.path_index.add("sites-id", "a", "team-a", True)
+    server.path_index.add("sites-id", "b", "team-b", True)
+    server.path_index.add("sites-id", "c", "other", False)
+
+    result = await server.complete_path("/Company Home/Sites/te")
+    assert [item["name"] for item in result["items"]] == [
+        "/Company Home/Sites/team-a/", "/Company Home/Sites/team-b/"
+    ]
+    assert result["items"][0]["id"] == "a"
 
 @pytest.mark.asyncio
 async def test_browse_by_path_root(server):
@@ -322,4 +382,859 @@ async def test_format_simple_response(server):
 
     formatted = server.format_simple_response(raw, "context_test")
     assert formatted["summary"] == "Test Response"
-    assert "- FolderA [folder] (ID: id-001)" in formatted["items"][0]
\ No newline at end of file
+    assert "- FolderA [folder] (ID: id-001)" in formatted["items"][0]
+
+def make_paged_get(total_items, with_total=True):
+    """Simulează un folder Alfresco cu `total_items` copii, paginat după skipCount/maxItems"""
+    calls = []
+
+    async def fake_get(url, params=None, **kwargs):
+        calls.append(dict(params))
+        skip, size = params["skipCount"], params["maxItems"]
+        ids = range(skip, min(skip + size, total_items))
+        pagination = {"count": len(ids), "skipCount": skip, "maxItems": size,
+                      "hasMoreItems": skip + size < total_items}
+        if with_total:
+            pagination["totalItems"] = total_items
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {
+            "pagination": pagination,
+            "entries": [{"entry": {"id": f"n{i}", "name": f"doc{i}", "isFolder": False}} for i in ids]
+        }})
+        return response
+
+    return fake_get, calls
+
+@pytest.mark.asyncio
+async def test_get_node_children_pages_with_cursor(server):
+    server.page_size = 4
+    server.client.get, calls = make_paged_get(10)
+
+    first = await server.get_node_children("big", max_items=6)
+    assert [item["id"] for item in first["items"]] == [f"n{i}" for i in range(6)]
+    assert first["next_cursor"] == "6"
+    assert [c["skipCount"] for c in calls] == [0, 4]
+    assert calls[1]["maxItems"] == 2
+
+    rest = await server.get_node_children("big", max_items=100, cursor=first["next_cursor"])
+    assert [item["id"] for item in rest["items"]] == [f"n{i}" for i in range(6, 10)]
+    assert "next_cursor" not in rest
+
+@pytest.mark.asyncio
+async def test_get_node_children_caps_limit_at_prefetch_window(server):
+    server.page_size = 4
+    server.prefetch_window = 2
+    server.client.get, calls = make_paged_get(20)
+
+    assert server.tool_limit({"limit": 10 ** 6}) == 8
+    result = await server.get_node_children("big", max_items=10 ** 6)
+    assert len(result["items"]) == 8
+    assert result["next_cursor"] == "8"
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_iter_node_children_streams_all_pages(server):
+    server.client.get, calls = make_paged_get(23, with_total=False)
+
+    names = [item["name"] async for item in server.iter_node_children("big", page_size=5, window=3)]
+
+    assert names == [f"doc{i}" for i in range(23)]
+    # Fără totalItems se cer speculativ cel mult `window` pagini după ultima pagină
+    assert len(calls) <= 5 + 3
+
+@pytest.mark.asyncio
+async def test_get_node_children_invalid_cursor(server):
+    with pytest.raises(ValueError):
+        await server.get_node_children("big", cursor="abc")
+
+@pytest.mark.asyncio
+async def test_get_node_info_served_from_cache(server):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value={"entry": {"id": "n1", "name": "doc", "isFolder": False, "parentId": "p1"}})
+    server.client.get = AsyncMock(return_value=response)
+
+    await server.get_node_info("n1")
+    result = await server.get_node_info("n1")
+
+    assert result["node"]["name"] == "doc"
+    assert server.client.get.await_count == 1
+    assert server.get_stats()["cache"]["nodes"]["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_create_folder_invalidates_parent_listing(server):
+    server.client.get, calls = make_paged_get(3)
+    await server.get_node_children("parent", max_items=10)
+    await server.get_node_children("parent", max_items=10)
+    assert len(calls) == 1
+
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value={"entry": {"id": "new", "name": "Nou"}})
+    server.client.post = AsyncMock(return_value=response)
+    await server.create_folder("Nou", parent_id="parent")
+
+    await server.get_node_children("parent", max_items=10)
+    assert len(calls) == 2
+
+def make_tree_get(tree):
+    """Simulează un arbore Alfresco: tree = {folder_id: [(id, name, is_folder), ...]}"""
+    calls = []
+
+    async def fake_get(url, params=None, **kwargs):
+        folder_id = url.rstrip("/").split("/")[-2]
+        calls.append(folder_id)
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {"entries": [
+            {"entry": {"id": i, "name": n, "isFolder": f, "parentId": folder_id}}
+            for i, n, f in tree.get(folder_id, [])
+        ]}})
+        return response
+
+    return fake_get, calls
+
+@pytest.mark.asyncio
+async def test_get_node_id_by_name_uses_crawled_index(server):
+    server.client.get, calls = make_tree_get({
+        "-root-": [("a", "Proiecte", True)],
+        "a": [("b", "Client X", True)],
+        "b": [("c", "Oferta finala.docx", False)],
+    })
+
+    await server.start_name_index_crawl()
+    assert server.name_index.complete
+    requests_after_crawl = len(calls)
+
+    result = await server.get_node_id_by_name("oferta FINALA.docx")
+    assert result["id"] == "c"
+
+    missing = await server.get_node_id_by_name("Oferta finla.docx")
+    assert missing["error"] is True
+    assert "Oferta finala.docx" in missing["message"]
+    assert missing["items"][0]["id"] == "c"
+    assert len(calls) == requests_after_crawl
+    assert server.name_index.is_missing("Oferta finla.docx")
+
+@pytest.mark.asyncio
+async def test_get_node_children_served_from_fresh_mirror():
+    srv = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", mirror=True)
+    srv.client = AsyncMock()
+    srv.mirror.page = MagicMock(return_value={"entries": [
+        {"entry": {"id": "m1", "name": "Din oglindă", "isFolder": True}}
+    ]})
+
+    result = await srv.get_node_children("folder")
+
+    assert result["items"][0]["name"] == "Din oglindă"
+    srv.client.get.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_create_folder_tree_levels_and_existing(server):
+    server.client.get, listed = make_tree_get({"-root-": [("p1", "Proiect", True)]})
+    created = []
+
+    async def fake_post(url, json=None, **kwargs):
+        parent = url.rstrip("/").split("/")[-2]
+        response = MagicMock()
+        if json["name"] == "Eroare":
+            response.status_code = 500
+            response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "Server Error", request=MagicMock(), response=response
+            )
+            return response
+        created.append((parent, json["name"]))
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"entry": {"id": f"id-{json['name']}", "name": json["name"]}})
+        return response
+
+    server.client.post = fake_post
+
+    result = await server.create_folder_tree([
+        {"name": "Proiect", "children": [{"name": "Docs"}, {"name": "Eroare", "children": [{"name": "Sub"}]}]},
+        {"name": "Arhiva", "children": [{"name": "2024"}]},
+    ])
+
+    statuses = {item["name"]: item["status"] for item in result["items"]}
+    assert statuses == {
+        "Proiect": "exists", "Arhiva": "created", "Proiect/Docs": "created",
+        "Proiect/Eroare": "failed", "Arhiva/2024": "created", "Proiect/Eroare/Sub": "skipped",
+    }
+    assert ("p1", "Docs") in created
+    assert ("id-Arhiva", "2024") in created
+    # Folderul nou creat nu mai este listat; doar root-ul și "Proiect" existent
+    assert sorted(listed) == ["-root-", "p1"]
+    assert result["counts"]["created"] == 3
+
+@pytest.mark.asyncio
+async def test_bulk_mutate_bounded_concurrency_and_statuses(server):
+    server.bulk_concurrency = 3
+    in_flight = {"now": 0, "max": 0}
+
+    def ok_response(entry=None):
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"entry": entry or {}})
+        return response
+
+    async def track():
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+
+    async def fake_delete(url, params=None, **kwargs):
+        await track()
+        if url.endswith("/missing"):
+            response = MagicMock()
+            response.status_code = 404
+            response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "Not Found", request=MagicMock(), response=response
+            )
+            return response
+        return ok_response()
+
+    async def fake_post(url, json=None, **kwargs):
+        await track()
+        node_id = url.split("/")[-2]
+        new_id = node_id if url.endswith("/move") else f"copy-of-{node_id}"
+        return ok_response({"id": new_id, "name": json.get("name") or node_id, "isFolder": False,
+                            "parentId": json["targetParentId"]})
+
+    async def fake_put(url, json=None, **kwargs):
+        await track()
+        return ok_response({"id": url.split("/")[-1], "name": json.get("name", "x"), "parentId": "p"})
+
+    server.client.delete = fake_delete
+    server.client.post = fake_post
+    server.client.put = fake_put
+
+    operations = [{"op": "delete", "node_id": f"d{i}"} for i in range(10)] + [
+        {"op": "delete", "node_id": "missing"},
+        {"op": "move", "node_id": "m1", "target_id": "t"},
+        {"op": "copy", "node_id": "c1", "target_id": "t", "name": "Copie"},
+        {"op": "update", "node_id": "u1", "properties": {"title": "Nou"}},
+        {"op": "rename", "node_id": "x"},
+        {"op": "move", "node_id": "m2"},
+    ]
+    result = await server.bulk_mutate(operations, concurrency=10)
+
+    assert in_flight["max"] == 3
+    assert result["succeeded"] == 13
+    assert result["failed"] == 3
+    by_name = {item["name"]: item for item in result["items"]}
+    assert by_name["missing"]["error"] == "HTTP 404"
+    assert by_name["c1"]["id"] == "copy-of-c1"
+    assert server.name_index.exact("Copie")[0]["id"] == "copy-of-c1"
+
+@pytest.mark.asyncio
+async def test_update_node_maps_short_property_names(server):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value={"entry": {"id": "n1", "name": "Doc", "parentId": "p"}})
+    server.client.put = AsyncMock(return_value=response)
+
+    await server.update_node("n1", {"title": "T", "cm:description": "D"})
+
+    body = server.client.put.call_args.kwargs["json"]
+    assert body["properties"] == {"cm:title": "T", "cm:description": "D"}
+
+@pytest.mark.asyncio
+async def test_list_subtree_depth_and_node_budget(server):
+    server.client.get, listed = make_tree_get({
+        "-root-": [("a", "Proiecte", True), ("f", "note.txt", False)],
+        "a": [("b", "Client X", True), ("c", "Client Y", True)],
+        "b": [("d", "Oferta.docx", False)],
+        "c": [("e", "Contract.pdf", False)],
+    })
+
+    result = await server.list_subtree("-root-", max_depth=2)
+    names = [item["name"] for item in result["items"]]
+    assert names == ["Proiecte", "note.txt", "Proiecte/Client X", "Proiecte/Client Y"]
+    assert result["depth"] == 2
+    assert not result["truncated"]
+    assert sorted(listed) == ["-root-", "a"]
+
+    limited = await server.list_subtree("-root-", max_depth=5, max_nodes=3)
+    assert limited["total"] == 3
+    assert limited["truncated"]
+
+    full = await server.list_subtree("a", max_depth=5, max_nodes=100)
+    assert {item["name"] for item in full["items"]} == {
+        "Client X", "Client Y", "Client X/Oferta.docx", "Client Y/Contract.pdf"
+    }
+    assert server.name_index.exact("Contract.pdf")[0]["id"] == "e"
+
+def make_content_stream(body, mime_type="text/plain", honor_range=True):
+    """Simulează client.stream pentru /content, cu sau fără suport pentru Range"""
+    requests = []
+
+    @asynccontextmanager
+    async def fake_stream(method, url, params=None, headers=None, **kwargs):
+        requests.append(dict(headers or {}))
+        data, status = body, 200
+        response_headers = {"content-type": f"{mime_type}; charset=UTF-8", "content-length": str(len(body))}
+        range_header = (headers or {}).get("Range")
+        if range_header and honor_range:
+            start, _, end = range_header[len("bytes="):].partition("-")
+            end = min(int(end), len(body) - 1) if end else len(body) - 1
+            data, status = body[int(start):end + 1], 206
+            response_headers = {"content-type": mime_type, "content-range": f"bytes {start}-{end}/{len(body)}"}
+
+        async def aiter_bytes(chunk_size=None):
+            for i in range(0, len(data), 7):
+                yield data[i:i + 7]
+
+        response = MagicMock()
+        response.status_code = status
+        response.headers = response_headers
+        response.raise_for_status = MagicMock()
+        response.aiter_bytes = aiter_bytes
+        yield response
+
+    return fake_stream, requests
+
+@pytest.mark.asyncio
+async def test_get_content_preview_budget_and_range(server):
+    body = "Contract semnat în București, anexa ă".encode("utf-8")
+    # Bugetul taie caracterul final 'ă' (2 bytes) la jumătate
+    budget = len(body) - 1
+    server.content_preview_bytes = budget
+    server.client.stream, requests = make_content_stream(body)
+
+    result = await server.get_content("doc-1")
+    assert requests[0]["Range"] == f"bytes=0-{budget - 1}"
+    assert result["truncated"]
+    assert result["size"] == len(body)
+    assert result["text"] == "Contract semnat în București, anexa "
+
+    rest = await server.get_content("doc-1", offset=10)
+    assert not rest["truncated"]
+    assert rest["text"] == body[10:].decode("utf-8")
+
+@pytest.mark.asyncio
+async def test_get_content_without_range_support_and_binary(server):
+    body = bytes(range(100))
+    server.client.stream, _ = make_content_stream(body, "application/pdf", honor_range=False)
+
+    result = await server.get_content("doc-2", offset=10, length=20)
+    assert result["text"] is None
+    assert result["bytes"] == 20
+    assert not result["truncated"]
+
+    download = await server.download_content("doc-2", offset=90)
+    assert download["file"].read() == body[90:]
+    download["file"].close()
+
+    resource = await server.read_content_resource("alfresco://nodes/doc-2/content")
+    assert base64.b64decode(resource["blob"]) == body
+    with pytest.raises(ValueError):
+        await server.read_content_resource("alfresco://altceva")
+
+@pytest.mark.asyncio
+async def test_upload_content_concurrent_with_throughput(server, tmp_path):
+    server.upload_root = os.path.realpath(str(tmp_path))
+    for index in range(4):
+        (tmp_path / f"scan{index}.pdf").write_bytes(b"%PDF" + bytes(1000 * index))
+    outside = tmp_path.parent / "secret.txt"
+    outside.write_text("nu")
+
+    uploaded = {}
+
+    async def fake_post(url, content=None, headers=None, **kwargs):
+        payload = b"".join([chunk async for chunk in content])
+        assert headers["Content-Length"] == str(len(payload))
+        name = payload.split(b'name="name"\r\n\r\n')[1].split(b"\r\n")[0].decode()
+        uploaded[name] = url.rstrip("/").split("/")[-2]
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"entry": {"id": f"id-{name}", "name": name}})
+        return response
+
+    server.client.post = fake_post
+
+    files = [{"path": str(tmp_path / f"scan{index}.pdf")} for index in range(4)]
+    files.append({"path": str(tmp_path / "scan0.pdf"), "name": "copie.pdf", "parent_id": "f2"})
+    files.append({"path": str(outside)})
+    result = await server.upload_content(files, "f1")
+
+    assert result["succeeded"] == 5
+    assert result["items"][-1]["status"] == "failed"
+    assert "în afara" in result["items"][-1]["error"]
+    assert uploaded["copie.pdf"] == "f2" and uploaded["scan3.pdf"] == "f1"
+    assert result["bytes"] == sum(4 + 1000 * index for index in range(4)) + 4
+    assert server.name_index.exact("scan2.pdf")[0]["id"] == "id-scan2.pdf"
+
+@pytest.mark.asyncio
+async def test_upload_content_is_refused_without_upload_root(server, tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("nu")
+    server.client.post = AsyncMock()
+    assert server.upload_root is None
+    with pytest.raises(ValueError, match="ALFRESCO_UPLOAD_ROOT"):
+        await server.upload_content([{"path": str(secret)}], "f1")
+
+    # Un symlink din upload_root spre exterior este refuzat după rezolvare
+    root = tmp_path / "upload"
+    root.mkdir()
+    (root / "link.txt").symlink_to(secret)
+    server.upload_root = os.path.realpath(str(root))
+    result = await server.upload_content([{"path": str(root / "link.txt")}], "f1")
+    assert result["failed"] == 1 and "în afara" in result["items"][0]["error"]
+    server.client.post.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_requests_use_operation_timeouts(server):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.json = MagicMock(return_value={"entry": {"id": "n1", "name": "a", "isFolder": True}})
+    server.client.get = AsyncMock(return_value=response)
+    server.client.delete = AsyncMock(return_value=response)
+
+    await server.get_node_info("n1")
+    await server.delete_node("n1")
+
+    assert server.client.get.call_args.kwargs["timeout"].read == server.transport.timeouts["read"]
+    assert server.client.delete.call_args.kwargs["timeout"].read == server.transport.timeouts["write"]
+    assert server.get_stats()["transport"]["per_operation"] == {"read": 1, "write": 1}
+
+@pytest.mark.asyncio
+async def test_listing_and_crawl_request_only_projected_fields(server):
+    seen = []
+
+    async def fake_get(url, params=None, **kwargs):
+        seen.append(dict(params))
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {"entries": [{"entry": {
+            "id": "f1", "name": "a.txt", "isFolder": False, "parentId": "-root-",
+            "aspectNames": ["cm:titled"], "properties": {"cm:title": "x"}
+        }}]}})
+        return response
+
+    server.client.get = fake_get
+
+    result = await server.get_node_children("-root-", 5)
+    assert "include" not in seen[0]
+    assert "nodeType" in seen[0]["fields"].split(",")
+    cached = server.cache.get_listing("-root-", 0, 5)
+    assert "aspectNames" not in cached["entries"][0]["entry"]
+    assert result["items"][0]["name"] == "a.txt"
+
+    await server.start_name_index_crawl()
+    # Crawl-ul alimentează și indexul full-text, deci cere titlul / descrierea
+    assert seen[-1]["fields"] == "id,name,isFolder,parentId,properties"
+    assert seen[-1]["include"] == "properties"
+    assert server.name_index.exact("a.txt")[0]["id"] == "f1"
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_reads_are_coalesced(server):
+    calls = []
+
+    async def fake_get(url, params=None, **kwargs):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {"entries": [
+            {"entry": {"id": "a", "name": "A", "isFolder": True, "parentId": "-root-"}}
+        ]}})
+        return response
+
+    server.client.get = fake_get
+    results = await asyncio.gather(*(server.get_node_children("-root-", 10) for _ in range(4)),
+                                   server.get_node_children("-root-", 5))
+
+    assert len(calls) == 2
+    assert all(result["items"][0]["id"] == "a" for result in results)
+    assert server.get_stats()["single_flight"]["coalesced"] == 3
+
+def status_response(status, entry=None):
+    response = MagicMock()
+    response.status_code = status
+    response.json = MagicMock(return_value={"entry": entry or {"id": "n1", "name": "a"}})
+    if status >= 400:
+        response.raise_for_status.side_effect = httpx.HTTPStatusError("err", request=MagicMock(), response=response)
+    return response
+
+@pytest.mark.asyncio
+async def test_reads_are_retried_writes_are_not(server):
+    server.retry.base_delay = 0
+    server.client.get = AsyncMock(side_effect=[
+        httpx.ConnectError("refused"), status_response(503), status_response(200)
+    ])
+    result = await server.get_node_info("n1")
+    assert result["node"]["id"] == "n1"
+    assert server.client.get.await_count == 3
+    assert server.retry.retries == 2
+
+    server.client.delete = AsyncMock(return_value=status_response(503))
+    with pytest.raises(httpx.HTTPStatusError):
+        await server.delete_node("n1")
+    assert server.client.delete.await_count == 1
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_sheds_load_while_alfresco_is_down(server):
+    from Clase.Resilience import CircuitOpenError
+    server.retry.attempts = 1
+    unavailable = status_response(503)
+    unavailable.headers = {}
+    server.client.get = AsyncMock(return_value=unavailable)
+
+    for _ in range(server.breaker.failure_threshold):
+        with pytest.raises(httpx.HTTPStatusError):
+            await server.get_node_info("n1")
+
+    with pytest.raises(CircuitOpenError):
+        await server.get_node_info("n2")
+    assert server.client.get.await_count == server.breaker.failure_threshold
+    assert server.get_stats()["resilience"]["breaker"]["state"] == "open"
+
+@pytest.mark.asyncio
+async def test_internal_errors_of_single_requests_do_not_open_the_breaker(server):
+    server.retry.attempts = 1
+    server.client.get = AsyncMock(return_value=status_response(500))
+
+    for _ in range(server.breaker.failure_threshold + 1):
+        with pytest.raises(httpx.HTTPStatusError):
+            await server.get_node_info("n1")
+    assert server.get_stats()["resilience"]["breaker"]["state"] == "closed"
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_probe_does_not_block_the_breaker(server):
+    from Clase.Resilience import CircuitBreaker
+    now = [0.0]
+    server.breaker = CircuitBreaker(failure_threshold=1, recovery_time=10, clock=lambda: now[0])
+    server.breaker.record_failure()
+    now[0] = 11.0
+
+    started = asyncio.Event()
+
+    async def hanging_post(url, **kwargs):
+        started.set()
+        await asyncio.sleep(3600)
+
+    # POST: nu trece prin single-flight, deci nimic nu se poate alătura cererii blocate
+    server.client.post = hanging_post
+    probe = asyncio.create_task(server._send("POST", "/probe", "write"))
+    await asyncio.wait_for(started.wait(), 5)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(probe, 5)
+
+    # Proba anulată a eliberat locul: următoarea cerere devine noua probă și închide circuitul
+    server.client.post = AsyncMock(return_value=status_response(200, {"id": "n1"}))
+    response = await asyncio.wait_for(server._send("POST", "/probe", "write"), 5)
+    assert response.status_code == 200
+    assert server.breaker.state == CircuitBreaker.CLOSED
+
+@pytest.mark.asyncio
+async def test_slow_read_is_hedged_and_loser_cancelled():
+    from Clase.AlfrescoTransport import nodes_path
+    from Clase.Resilience import endpoint_key
+    srv = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", hedging=True, hedge_budget=0.5)
+    srv.client = AsyncMock()
+    endpoint = endpoint_key("GET", nodes_path("n1"))
+    for _ in range(srv.latency.min_samples):
+        srv.latency.observe(endpoint, 0.01)
+
+    calls, cancelled = [], []
+
+    async def fake_get(url, params=None, **kwargs):
+        call = len(calls)
+        calls.append(url)
+        try:
+            await asyncio.sleep(5 if call == 0 else 0)
+        except asyncio.CancelledError:
+            cancelled.append(call)
+            raise
+        return status_response(200, {"id": "n1", "name": f"raspuns-{call}"})
+
+    srv.client.get = fake_get
+    result = await srv.get_node_info("n1")
+    await asyncio.sleep(0)
+
+    assert result["node"]["name"] == "raspuns-1"
+    assert len(calls) == 2 and cancelled == [0]
+    assert srv.get_stats()["resilience"]["hedging"] == {
+        "requests": 1, "hedges": 1, "wins": 1, "denied": 0, "budget": 0.5
+    }
+
+    # Bugetul epuizat: următoarea citire lentă nu mai primește duplicat
+    calls.clear()
+    srv.cache.clear()
+
+    async def slow_get(url, params=None, **kwargs):
+        calls.append(url)
+        await asyncio.sleep(0.05)
+        return status_response(200)
+
+    srv.client.get = slow_get
+    await srv.get_node_info("n1")
+    assert len(calls) == 1
+    assert srv.hedge.denied == 1
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_requests_and_read_is_retried(server):
+    server.retry.base_delay = 0
+    throttled = status_response(429)
+    throttled.headers = {"Retry-After": "0.05"}
+    server.client.get = AsyncMock(side_effect=[throttled, status_response(200)])
+
+    started = asyncio.get_running_loop().time()
+    result = await server.get_node_info("n1")
+
+    assert result["node"]["id"] == "n1"
+    assert server.client.get.await_count == 2
+    assert asyncio.get_running_loop().time() - started >= 0.04
+    stats = server.get_stats()["rate_limiter"]
+    assert stats["throttled"] == 1
+    assert server.get_stats()["resilience"]["breaker"]["state"] == "closed"
+
+@pytest.mark.asyncio
+async def test_reads_respect_adaptive_concurrency_limit():
+    srv = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", max_connections=4, name_index_crawl=False)
+    srv.client = AsyncMock()
+    srv.concurrency.limit = 2
+    srv.concurrency.max_limit = 2
+    active, peak = 0, 0
+
+    async def fake_get(url, params=None, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return status_response(200, {"id": url.rsplit("/", 1)[-1], "name": "x"})
+
+    srv.client.get = fake_get
+    await asyncio.gather(*(srv.get_node_info(f"n{i}") for i in range(6)))
+
+    assert peak == 2
+    stats = srv.get_stats()["concurrency"]
+    assert stats["peak_queue_depth"] == 4 and stats["in_flight"] == 0
+
+@pytest.mark.asyncio
+async def test_reads_fail_over_to_another_alfresco_node():
+    srv = MinimalAlfrescoServer("http://alf1:8080", "admin", "admin", endpoints=["http://alf2:8080"])
+    srv.client = AsyncMock()
+    srv.retry.base_delay = 0
+    urls = []
+
+    async def fake_get(url, params=None, **kwargs):
+        urls.append(url)
+        if url.startswith("http://alf1"):
+            raise httpx.ConnectError("refused")
+        return status_response(200)
+
+    srv.client.get = fake_get
+    for node_id in ("n1", "n2", "n3"):
+        await srv.get_node_info(node_id)
+
+    # După primul eșec, alf1 iese din rotație
+    assert sum(url.startswith("http://alf1") for url in urls) == 1
+    assert srv.get_stats()["endpoints"]["healthy"] == 1
+
+    srv.client.post = AsyncMock(return_value=status_response(201, {"id": "f1", "name": "nou"}))
+    await srv.create_folder("nou")
+    assert srv.client.post.await_args.args[0].startswith("http://alf2")
+
+@pytest.mark.asyncio
+async def test_search_nodes_uses_crawled_index_and_tracks_mutations(server):
+    tree = {
+        "-root-": [{"id": "f1", "name": "Rapoarte", "isFolder": True}],
+        "f1": [{"id": "d1", "name": "buget.xlsx", "isFolder": False,
+                "properties": {"cm:title": "Raport financiar 2024", "cm:owner": "x"}}],
+    }
+
+    async def fake_get(url, params=None, **kwargs):
+        folder_id = url.rstrip("/").split("/")[-2]
+        response = MagicMock()
+        response.raise_for_status = MagicMock()
+        response.json = MagicMock(return_value={"list": {"entries": [
+            {"entry": dict(entry, parentId=folder_id)} for entry in tree.get(folder_id, [])
+        ]}})
+        return response
+
+    server.client.get = fake_get
+    await server.start_name_index_crawl()
+
+    result = await server.search_nodes("financiar")
+    assert [item["id"] for item in result["items"]] == ["d1"]
+    assert "Raport financiar 2024" in result["items"][0]["snippet"]
+    formatted = server.format_simple_response(result)
+    assert formatted["items"][0] == "- buget.xlsx [file] (ID: d1) — /Company Home/Rapoarte/buget.xlsx | Raport financiar 2024"
+
+    server.client.post = AsyncMock(return_value=status_response(201, {"id": "f2", "name": "Arhiva"}))
+    await server.create_folder("Arhiva", "f1", description="Documente financiare vechi")
+    assert {item["id"] for item in (await server.search_nodes("financiar"))["items"]} == {"d1", "f2"}
+
+    server.client.delete = AsyncMock(return_value=status_response(204))
+    await server.delete_node("f1")
+    assert (await server.search_nodes("financiar"))["items"] == []
+    # Și indexul de nume uită tot subarborele folderului șters
+    assert server.name_index.exact("buget.xlsx") == [] and server.name_index.exact("Arhiva") == []
+
+def search_response(entries, has_more=False, total=None, facets=None):
+    response = MagicMock()
+    response.status_code = 200
+    response.raise_for_status = MagicMock()
+    page = {"entries": [{"entry": entry} for entry in entries],
+            "pagination": {"hasMoreItems": has_more, "totalItems": total if total is not None else len(entries)}}
+    if facets is not None:
+        page["context"] = {"facetsFields": facets}
+    response.json = MagicMock(return_value={"list": page})
+    return response
+
+@pytest.mark.asyncio
+async def test_search_pages_on_server_and_caches_facets(server):
+    server.search_available = True
+    facets = [{"label": "creator", "buckets": [{"label": "admin", "count": 7}]}]
+    server.client.post = AsyncMock(side_effect=[
+        search_response([{"id": "d1", "name": "raport.pdf", "isFolder": False, "path": {"name": "/Company Home/R"}}],
+                        has_more=True, total=2, facets=facets),
+        search_response([{"id": "d2", "name": "raport2.pdf", "isFolder": False}], total=2),
+    ])
+
+    first = await server.search("cm:name:raport*", max_items=1, facets=["creator"])
+    body = server.client.post.await_args_list[0].kwargs["json"]
+    assert body["paging"] == {"maxItems": 1, "skipCount": 0}
+    assert body["facetFields"] == {"facets": [{"field": "creator"}]}
+    assert body["include"] == ["path"]
+    assert first["next_cursor"] == "1" and first["total"] == 2
+    assert first["items"][0]["snippet"] == "/Company Home/R"
+    assert server.format_simple_response(first)["facets"] == {"creator": ["admin (7)"]}
+
+    second = await server.search("cm:name:raport*", max_items=1, cursor=first["next_cursor"], facets=["creator"])
+    body = server.client.post.await_args_list[1].kwargs["json"]
+    assert body["paging"]["skipCount"] == 1
+    assert "facetFields" not in body
+    assert second["facets"] == {"creator": [{"value": "admin", "count": 7}]}
+    assert "next_cursor" not in second
+
+@pytest.mark.asyncio
+async def test_search_probe_disables_tool_without_search_services(server):
+    server.client.post = AsyncMock(return_value=status_response(501))
+    assert await server.probe_search() is False
+    with pytest.raises(ValueError):
+        await server.search("cm:name:x")
+
+    server.client.post = AsyncMock(return_value=search_response([]))
+    assert await server.probe_search() is True
+
+@pytest.mark.asyncio
+async def test_get_nodes_info_dedupes_uses_cache_and_fetches_concurrently(server):
+    server.cache.set_node("n1", {"id": "n1", "name": "din-cache", "isFolder": True})
+    active, peak, fetched = 0, 0, []
+
+    async def fake_get(url, params=None, **kwargs):
+        nonlocal active, peak
+        node_id = url.rsplit("/", 1)[-1]
+        fetched.append(node_id)
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        if node_id == "lipsa":
+            return status_response(404)
+        return status_response(200, {"id": node_id, "name": f"doc-{node_id}", "isFolder": False,
+                                     "content": {"sizeInBytes": 10}, "path": {"name": "/Company Home"}})
+
+    server.client.get = fake_get
+    result = await server.get_nodes_info(["n1", "n2", "n3", "n2", "lipsa"], concurrency=2)
+
+    assert sorted(fetched) == ["lipsa", "n2", "n3"]
+    assert peak == 2
+    assert [node["status"] for node in result["nodes"]] == ["ok", "ok", "ok", "failed"]
+    assert result["items"] == [{"name": "lipsa", "type": "?", "id": "lipsa", "status": "failed", "error": "nu există"}]
+    assert result["text"].splitlines()[1:] == [
+        "n1 | din-cache | folder | - | - | -",
+        "n2 | doc-n2 | file | 10 | - | /Company Home",
+        "n3 | doc-n3 | file | 10 | - | /Company Home",
+    ]
+    assert "(1 din cache)" in result["message"] and "1 ID-uri duplicate" in result["message"]
+
+@pytest.mark.asyncio
+async def test_large_tool_output_is_truncated_and_continued(server):
+    from Clase import JsonCodec
+    from Clase.OutputBudget import OutputBudget
+    server.output_budget = OutputBudget(max_tokens=150)
+    server.client.get, _ = make_paged_get(60)
+
+    result = await server.get_node_children("big", max_items=40)
+    page = JsonCodec.loads(server.render_tool_result(result, "folder big"))
+    names = [line.split(" ")[1] for line in page["items"]]
+    while "continuation" in page:
+        page = JsonCodec.loads(server.continue_output(page["continuation"]))
+        names += [line.split(" ")[1] for line in page["items"]]
+
+    assert names == [f"doc{i}" for i in range(40)]
+    # Paginarea Alfresco continuă de unde a rămas, după ce bucățile s-au terminat
+    assert page["next_cursor"] == "40"
+    with pytest.raises(ValueError):
+        server.continue_output("expirat")
+
+@pytest.mark.asyncio
+async def test_warm_restart_serves_persisted_listing_and_revalidates(tmp_path):
+    import time
+    db = str(tmp_path / "cache.db")
+    first = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", persistent_cache=db)
+    first.client = AsyncMock()
+    first.client.get, _ = make_paged_get(10)
+    await first.get_node_children("big", max_items=6)
+    await first.cleanup()
+
+    # Repornire: pagina vine de pe disc, fără niciun apel Alfresco
+    second = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", persistent_cache=db)
+    second.client = AsyncMock()
+    second.client.get, calls = make_paged_get(10)
+    result = await second.get_node_children("big", max_items=6)
+    assert [item["id"] for item in result["items"]] == [f"n{i}" for i in range(6)]
+    assert calls == []
+    await second.cleanup()
+
+    # Repornire după o oră: pagina expirată se servește imediat și se recitește în fundal
+    third = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", persistent_cache=db)
+    third.persistent_cache.clock = lambda: time.time() + 3600
+    third.client = AsyncMock()
+    third.client.get, calls = make_paged_get(10)
+    result = await third.get_node_children("big", max_items=6)
+    assert len(result["items"]) == 6 and calls == []
+    await third._revalidation_task
+    assert len(calls) == 1 and third.revalidated == 1
+    assert third.get_stats()["persistent_cache"]["revalidation_queue"] == 0
+    await third.cleanup()
+
+@pytest.mark.asyncio
+async def test_change_feed_invalidates_exactly_the_changed_folders():
+    from Clase.ChangeFeed import ChangeFeedPoller, LocalChangeFeed
+    srv = MinimalAlfrescoServer("http://localhost:8080", "admin", "admin", cache_ttl=3600, path_ttl=3600)
+    srv.client = AsyncMock()
+    tree = {"f1": [("a", "doc.txt", False)], "f2": [("b", "alt.txt", False)]}
+    srv.client.get, calls = make_tree_get(tree)
+    feed = LocalChangeFeed()
+    srv.change_feed = ChangeFeedPoller(feed, srv.apply_change)
+    await srv.change_feed.poll()
+
+    await srv.get_node_children("f1")
+    await srv.get_node_children("f2")
+    assert calls == ["f1", "f2"]
+
+    # Un document nou în f1, creat direct în Alfresco
+    tree["f1"].append(("c", "nou.txt", False))
+    feed.record("c", parent_id="f1", name="nou.txt")
+    await srv.change_feed.poll()
+    assert [item["name"] for item in (await srv.get_node_children("f1"))["items"]] == ["doc.txt", "nou.txt"]
+    await srv.get_node_children("f2")
+    assert calls == ["f1", "f2", "f1"]
+    assert srv.path_index.is_folder("c") is False
+
+    # Ștergerea lui 'a' invalidează doar f1
+    tree["f1"].pop(0)
+    feed.record("a", deleted=True)
+    await srv.change_feed.poll()
+    assert [item["id"] for item in (await srv.get_node_children("f1"))["items"]] == ["c"]
+    assert calls == ["f1", "f2", "f1", "f1"]
+    assert srv.path_index.is_folder("a") is None
+    assert srv.get_stats()["change_feed"]["applied"] == 2
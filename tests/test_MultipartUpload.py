@@ -0,0 +1,44 @@
+import pytest
+import httpx
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.MultipartUpload import MmapMultipartBody
+
+@pytest.mark.asyncio
+async def test_multipart_body_streams_file_in_chunks(tmp_path):
+    path = tmp_path / "scan.pdf"
+    data = os.urandom(10_000)
+    path.write_bytes(data)
+
+    with MmapMultipartBody(str(path), {"name": "scan.pdf", "nodeType": "cm:content"}, chunk_size=4096) as body:
+        chunks = [chunk async for chunk in body]
+        assert body.content_length == sum(len(chunk) for chunk in chunks)
+        # antet, 3 bucăți din fișier, terminator
+        assert len(chunks) == 5
+        assert body.content_type.startswith("multipart/form-data; boundary=")
+
+    payload = b"".join(chunks)
+    assert data in payload
+    assert b'name="nodeType"\r\n\r\ncm:content\r\n' in payload
+    assert b'filename="scan.pdf"\r\nContent-Type: application/pdf' in payload
+
+@pytest.mark.asyncio
+async def test_multipart_body_is_parsed_by_httpx_request(tmp_path):
+    path = tmp_path / "gol.txt"
+    path.write_bytes(b"")
+    received = {}
+
+    def handler(request: httpx.Request):
+        received["headers"] = request.headers
+        received["body"] = request.read()
+        return httpx.Response(201, json={"entry": {"id": "x"}})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with MmapMultipartBody(str(path), {"name": "gol.txt"}) as body:
+            response = await client.post("http://alfresco/upload", content=body, headers=body.headers)
+
+    assert response.status_code == 201
+    assert received["headers"]["content-length"] == str(len(received["body"]))
+    assert "transfer-encoding" not in received["headers"]
+    assert received["body"].endswith(f"--{body.boundary}--\r\n".encode())
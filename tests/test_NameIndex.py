@@ -0,0 +1,57 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.NameIndex import NameIndex
+
+def build_index():
+    index = NameIndex()
+    index.add("1", "Contracte 2024", "folder", "-root-")
+    index.add("2", "Raport anual.pdf", "file", "1")
+    index.add("3", "raport ANUAL.pdf", "file", "4")
+    return index
+
+def test_exact_and_case_insensitive():
+    index = build_index()
+    assert [n["id"] for n in index.exact("Raport anual.pdf")] == ["2"]
+    assert [n["id"] for n in index.case_insensitive("RAPORT ANUAL.PDF")] == ["2", "3"]
+
+def test_fuzzy_tolerates_typos():
+    index = build_index()
+    results = index.fuzzy("Contrcte 2024")
+    assert results[0]["id"] == "1"
+    assert 0 < results[0]["score"] < 1
+
+def test_remove_and_rename():
+    index = build_index()
+    index.remove("2")
+    assert index.exact("Raport anual.pdf") == []
+    index.add("3", "Altceva", "file", "4")
+    assert index.case_insensitive("raport anual.pdf") == []
+    assert index.fuzzy("raport anual") == []
+
+def test_remove_subtree_drops_nested_descendants():
+    index = build_index()
+    index.add("5", "Anexe", "folder", "1")
+    index.add("6", "Anexa 1.pdf", "file", "5")
+    index.remove("1", subtree=True)
+    assert index.exact("Anexa 1.pdf") == [] and index.exact("Anexe") == []
+    assert [n["id"] for n in index.case_insensitive("raport anual.pdf")] == ["3"]
+
+    # Un nod mutat nu mai pleacă odată cu vechiul părinte
+    index.add("7", "Dosar", "folder", "-root-")
+    index.add("8", "Mutat.pdf", "file", "7")
+    index.add("8", "Mutat.pdf", "file", "4")
+    index.remove("7", subtree=True)
+    assert [n["id"] for n in index.exact("Mutat.pdf")] == ["8"]
+
+def test_negative_cache_expires_and_clears_on_add():
+    now = [0.0]
+    index = NameIndex(negative_ttl=10, clock=lambda: now[0])
+    index.mark_missing("Nou")
+    assert index.is_missing("nou")
+    index.add("9", "Nou", "folder")
+    assert not index.is_missing("Nou")
+
+    index.mark_missing("Altul")
+    now[0] = 10
+    assert not index.is_missing("Altul")
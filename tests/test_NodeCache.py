@@ -0,0 +1,79 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.NodeCache import LRUTTLCache, NodeCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def page(parent_id, *ids):
+    return {"entries": [{"entry": {"id": i, "parentId": parent_id}} for i in ids]}
+
+def test_lru_eviction_and_counters():
+    cache = LRUTTLCache(max_entries=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    # "b" era cel mai puțin folosit recent
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+def test_ttl_expiration():
+    clock = FakeClock()
+    cache = LRUTTLCache(max_entries=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+def test_disabled_cache_stores_nothing():
+    cache = LRUTTLCache(max_entries=10, ttl=0)
+    cache.set("a", 1)
+    assert len(cache) == 0
+
+def test_invalidate_node_drops_parent_listings_and_alias():
+    cache = NodeCache(ttl=60)
+    cache.set_listing("-root-", 0, 10, page("root-uuid", "n1", "n2"))
+    cache.set_listing("-root-", 10, 10, page("root-uuid", "n3"))
+    cache.set_listing("other", 0, 10, page("other", "x"))
+    cache.set_node("n1", {"id": "n1", "parentId": "root-uuid"})
+    cache.set_node("root-uuid", {"id": "root-uuid"})
+
+    cache.invalidate_node("n1")
+
+    assert cache.get_node("n1") is None
+    assert cache.get_node("root-uuid") is None
+    assert cache.get_listing("-root-", 0, 10) is None
+    assert cache.get_listing("-root-", 10, 10) is None
+    assert cache.get_listing("other", 0, 10) is not None
+
+def test_invalidate_listings_by_real_id_clears_alias():
+    cache = NodeCache(ttl=60)
+    cache.set_listing("-root-", 0, 10, page("root-uuid", "n1"))
+    cache.invalidate_listings("root-uuid")
+    assert cache.get_listing("-root-", 0, 10) is None
+
+def test_reverse_index_follows_listing_evictions():
+    cache = NodeCache(max_listings=2, ttl=60)
+    cache.set_listing("f1", 0, 10, page("f1", "a", "b"))
+    cache.set_listing("f2", 0, 10, page("f2", "b"))
+    cache.set_listing("f3", 0, 10, page("f3", "c"))
+
+    # f1 a fost evacuat: indexul invers nu mai ține minte paginile lui
+    assert "a" not in cache._pages_with and "f1" not in cache._pages_of
+    cache.invalidate_node("b")
+    assert cache.get_listing("f2", 0, 10) is None
+    assert cache.get_listing("f3", 0, 10) is not None
+    assert set(cache._pages_with) == {"c"}
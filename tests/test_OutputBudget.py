@@ -0,0 +1,64 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase import JsonCodec
+from Clase.OutputBudget import BYTES_PER_TOKEN, ContinuationStore, OutputBudget
+
+def listing(count):
+    return {
+        "context": "folder f1",
+        "summary": f"Am găsit {count} elemente",
+        "items": [f"- document-{i:03}.pdf [file] (ID: node-{i:03})" for i in range(count)],
+        "next_cursor": "100"
+    }
+
+def test_small_response_is_returned_unchanged():
+    budget = OutputBudget(max_tokens=1000)
+    response = listing(3)
+    assert budget.apply(response) is response
+    assert budget.stats()["truncated"] == 0
+
+def test_items_are_paged_through_continuations_within_budget():
+    budget = OutputBudget(max_tokens=200)
+    page = budget.apply(listing(60))
+    seen = list(page["items"])
+    assert len(JsonCodec.dumpb(page, pretty=True)) <= 200 * BYTES_PER_TOKEN
+    assert "next_cursor" not in page and page["continuation"] in page["remaining"]
+
+    while "continuation" in page:
+        page = budget.resume(page["continuation"])
+        assert len(JsonCodec.dumpb(page, pretty=True)) <= 200 * BYTES_PER_TOKEN
+        seen += page["items"]
+
+    assert seen == listing(60)["items"]
+    # Cursorul paginării Alfresco apare abia pe ultima bucată
+    assert page["next_cursor"] == "100"
+    assert budget.stats()["resumed"] >= 1
+
+def test_long_text_is_split_without_breaking_characters():
+    budget = OutputBudget(max_tokens=100)
+    text = "ăîșțâ" * 400
+    page = budget.apply({"context": "content n1", "summary": "", "items": [], "text": text})
+    chunks = [page["text"]]
+    while "continuation" in page:
+        page = budget.resume(page["continuation"])
+        chunks.append(page["text"])
+    assert len(chunks) > 2 and "".join(chunks) == text
+
+def test_unknown_or_expired_cursor_is_an_error():
+    now = [0.0]
+    store = ContinuationStore(ttl=10)
+    store._pages.clock = lambda: now[0]
+    budget = OutputBudget(max_tokens=100, store=store)
+    cursor = budget.apply(listing(40))["continuation"]
+    now[0] = 11.0
+    with pytest.raises(ValueError):
+        budget.resume(cursor)
+    with pytest.raises(ValueError):
+        budget.resume("inexistent")
+    assert store.stats()["unknown"] == 2
+
+def test_zero_budget_disables_truncation():
+    response = listing(500)
+    assert OutputBudget(max_tokens=0).apply(response) is response
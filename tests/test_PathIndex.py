@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.PathIndex import PathIndex, ROOT_ID
+
+def build_index():
+    index = PathIndex()
+    index.add_children(ROOT_ID, [
+        {"entry": {"id": "sites", "name": "Sites", "isFolder": True, "parentId": "root-uuid"}},
+        {"entry": {"id": "readme", "name": "README.txt", "isFolder": False, "parentId": "root-uuid"}},
+    ])
+    index.add("sites", "team", "Team", True)
+    return index
+
+def test_split_ignores_company_home():
+    assert PathIndex.split("/Company Home/Sites/x/") == ["Sites", "x"]
+    assert PathIndex.split("/") == []
+
+def test_resolve_and_path_of():
+    index = build_index()
+    assert index.resolve("/Company Home/sites/TEAM") == "team"
+    assert index.path_of("team") == "/Company Home/Sites/Team"
+    # ID-ul real al root-ului este alias pentru '-root-'
+    assert index.resolve("/") == ROOT_ID
+    index.add("root-uuid", "other", "Other", True)
+    assert index.path_of("other") == "/Company Home/Other"
+
+def test_lookup_returns_deepest_known_prefix():
+    index = build_index()
+    node_id, depth = index.lookup(["Sites", "Team", "Missing", "Deeper"])
+    assert (node_id, depth) == ("team", 2)
+
+def test_move_and_remove():
+    index = build_index()
+    index.add("sites", "sub", "Sub", True)
+    index.add(ROOT_ID, "team", "Team", True)
+    assert index.resolve("/Team") == "team"
+    assert index.resolve("/Sites/Team") is None
+
+    index.remove("sites")
+    assert index.resolve("/Sites") is None
+    assert index.resolve("/Sites/Sub") is None
+
+def test_complete():
+    index = build_index()
+    assert index.complete("/") == ["/Company Home/README.txt", "/Company Home/Sites/"]
+    assert index.complete("/Company Home/S") == ["/Company Home/Sites/"]
+
+def test_ttl_expiry():
+    now = [0.0]
+    index = PathIndex(ttl=10, clock=lambda: now[0])
+    index.add(ROOT_ID, "a", "A", True)
+    now[0] = 11
+    assert index.resolve("/A") is None
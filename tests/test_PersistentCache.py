@@ -0,0 +1,109 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.NodeCache import NodeCache
+from Clase.PathIndex import PathIndex
+from Clase.PersistentCache import PersistentCache
+
+class FakeClock:
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+def page(parent_id, *ids):
+    return {"entries": [{"entry": {"id": i, "name": i, "parentId": parent_id}} for i in ids]}
+
+def test_entries_survive_restart_and_load_lazily_once(tmp_path):
+    wall = FakeClock(1000.0)
+    db = str(tmp_path / "cache.db")
+    store = PersistentCache(db, clock=wall)
+    NodeCache(ttl=30, store=store).set_node("n1", {"id": "n1", "name": "doc", "parentId": "f1"})
+    store.close()
+
+    wall.now = 1010.0
+    store = PersistentCache(db, clock=wall)
+    assert store.db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    cache = NodeCache(ttl=30, store=store)
+    assert cache.get_node("n1")["name"] == "doc"
+    assert store.stats()["loads"] == 1
+    # A doua citire vine din memorie, nu de pe disc
+    cache.nodes.clear()
+    assert cache.get_node("n1") is None
+    assert cache.stats()["warm_loads"] == 1
+
+def test_expired_entries_are_served_and_revalidated(tmp_path):
+    wall = FakeClock(1000.0)
+    db = str(tmp_path / "cache.db")
+    store = PersistentCache(db, clock=wall)
+    NodeCache(ttl=30, store=store).set_listing("f1", 0, 100, page("f1", "a", "b"))
+    PathIndex(ttl=300, store=store).add("-root-", "f1", "Proiecte")
+    store.close()
+
+    wall.now = 2000.0
+    requested = []
+    store = PersistentCache(db, clock=wall)
+    cache = NodeCache(ttl=30, store=store, revalidate=lambda kind, key: requested.append((kind, key)))
+    paths = PathIndex(ttl=300, store=store, revalidate=lambda kind, key: requested.append((kind, key)))
+
+    assert [e["entry"]["id"] for e in cache.get_listing("f1", 0, 100)["entries"]] == ["a", "b"]
+    assert paths.resolve("/Company Home/proiecte") == "f1"
+    assert requested == [("listing", ("f1", 0, 100)), ("path", "f1")]
+    assert cache.stats()["stale_loads"] == 1
+
+def test_invalidation_reaches_entries_only_on_disk(tmp_path):
+    db = str(tmp_path / "cache.db")
+    store = PersistentCache(db)
+    cache = NodeCache(ttl=30, store=store)
+    cache.set_listing("f1", 0, 100, page("f1", "a", "b"))
+    cache.set_node("f1", {"id": "f1", "parentId": "-root-"})
+    cache.set_node("a", {"id": "a", "parentId": "f1"})
+    paths = PathIndex(store=store)
+    paths.add("-root-", "f1", "Proiecte")
+    paths.add("f1", "a", "a")
+    store.close()
+
+    # Proces nou: nimic în memorie, invalidarea trebuie să găsească părintele pe disc
+    store = PersistentCache(db)
+    NodeCache(ttl=30, store=store).invalidate_node("a")
+    PathIndex(store=store).remove("f1")
+    assert store.stats()["nodes"] == 0
+    assert store.stats()["listings"] == 0
+    assert store.stats()["paths"] == 0
+
+def test_entries_older_than_max_age_are_pruned(tmp_path):
+    wall = FakeClock(0.0)
+    db = str(tmp_path / "cache.db")
+    store = PersistentCache(db, max_age=100, clock=wall)
+    store.put_node("old", {"id": "old"})
+    store.close()
+
+    wall.now = 101.0
+    store = PersistentCache(db, max_age=100, clock=wall)
+    assert store.pruned == 1
+    assert store.load_node("old") is None
+
+def test_listing_children_are_indexed_and_commits_batched(tmp_path):
+    db = str(tmp_path / "cache.db")
+    store = PersistentCache(db, commit_every=3, commit_interval=3600, max_consulted=2)
+    store.put_listing("f1", 0, 100, page("f1", "a", "b"))
+    store.put_listing("f2", 0, 100, page("f2", "b"))
+    assert sorted(store.listing_parents("b")) == ["f1", "f2"]
+    assert store.db.execute("EXPLAIN QUERY PLAN SELECT parent_id FROM listing_children WHERE child_id = ?",
+                            ("b",)).fetchone()[-1].startswith("SEARCH")
+    assert store.stats()["commits"] == 0 and store.stats()["pending_writes"] == 2
+
+    store.delete_listings(["f1"])
+    assert store.listing_parents("b") == ["f2"]
+    assert store.stats()["commits"] == 1 and store.stats()["pending_writes"] == 0
+
+    # Cheile consultate sunt limitate (LRU)
+    store.put_node("n1", {"id": "n1"})
+    store.put_node("n2", {"id": "n2"})
+    store.put_node("n3", {"id": "n3"})
+    assert len(store._consulted) == 2
+    store.close()
+
+    # Scrierile în așteptare s-au confirmat la închidere
+    assert PersistentCache(db).stats()["nodes"] == 3
@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.Projection import Projection, LISTING, NODE_INFO, NAMES, MODIFIED
+
+def test_params_list_included_fields():
+    assert NAMES.params() == {"fields": "id,name,isFolder,parentId"}
+    params = NODE_INFO.params()
+    assert params["include"] == "path,properties"
+    assert params["fields"].endswith(",path,properties")
+    assert "include" not in LISTING.params()
+
+def test_apply_drops_unused_keys_and_properties():
+    entry = {
+        "id": "n1", "name": "Doc", "isFolder": False, "parentId": "p", "modifiedAt": "t",
+        "aspectNames": ["cm:auditable"], "allowableOperations": ["delete"],
+        "properties": {"cm:title": "Titlu", "cm:versionLabel": "1.0", "exif:model": "X"},
+        "path": {"name": "/Company Home"},
+    }
+    assert MODIFIED.apply(entry) == {"id": "n1", "modifiedAt": "t"}
+
+    info = NODE_INFO.apply(entry)
+    assert info["properties"] == {"cm:title": "Titlu"}
+    assert "aspectNames" not in info and "allowableOperations" not in info
+    assert info["path"] == {"name": "/Company Home"}
+
+    # Fără restricție de proprietăți, dicționarul rămâne întreg
+    everything = Projection("all", ("id",), include=("properties",))
+    assert everything.apply(entry)["properties"] == entry["properties"]
+
+def test_apply_page_keeps_pagination():
+    page = {
+        "pagination": {"count": 1, "hasMoreItems": False},
+        "entries": [{"entry": {"id": "a", "name": "A", "isFolder": True, "path": {"name": "/x"}}}],
+    }
+    projected = LISTING.apply_page(page)
+    assert projected["pagination"] == page["pagination"]
+    assert projected["entries"] == [{"entry": {"id": "a", "name": "A", "isFolder": True}}]
@@ -0,0 +1,62 @@
+import pytest
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.RateLimiter import (BULK, READ, WRITE, RateLimiter, background, background_job,
+                               parse_retry_after, request_priority)
+
+def test_parse_retry_after_seconds_date_and_cap():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:05 GMT", now=lambda: 1445412480.0) == 5.0
+    assert parse_retry_after("3600") == 60.0
+    assert parse_retry_after("mâine") is None
+    assert parse_retry_after(None) is None
+
+@pytest.mark.asyncio
+async def test_request_priority_follows_background_context():
+    assert request_priority("read") == READ
+    assert request_priority("write") == WRITE
+
+    @background_job
+    async def crawl():
+        # Task-urile pornite din job moștenesc prioritatea
+        return await asyncio.create_task(asyncio.sleep(0, request_priority("read")))
+
+    assert await crawl() == BULK
+    with background():
+        assert request_priority("write") == BULK
+    assert request_priority("read") == READ
+
+@pytest.mark.asyncio
+async def test_queued_requests_are_served_by_priority():
+    limiter = RateLimiter(rate=100, burst=1)
+    await limiter.acquire(READ)  # golește bucket-ul
+    order = []
+
+    async def request(priority, name):
+        await limiter.acquire(priority)
+        order.append(name)
+
+    tasks = [asyncio.create_task(request(BULK, "bulk")),
+             asyncio.create_task(request(WRITE, "write"))]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request(READ, "read")))
+    await asyncio.gather(*tasks)
+
+    assert order == ["read", "write", "bulk"]
+    stats = limiter.stats()
+    assert stats["granted"] == {"read": 2, "write": 1, "bulk": 1}
+    assert stats["queued"]["bulk"] == 1 and stats["wait_seconds"]["bulk"] > 0
+
+@pytest.mark.asyncio
+async def test_pause_blocks_even_without_rate_limit():
+    limiter = RateLimiter(rate=0)
+    assert limiter.try_acquire() is True
+    limiter.pause(0.05)
+    assert limiter.try_acquire() is False
+
+    started = asyncio.get_running_loop().time()
+    await limiter.acquire(READ)
+    assert asyncio.get_running_loop().time() - started >= 0.04
+    assert limiter.stats()["throttled"] == 1
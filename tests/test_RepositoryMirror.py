@@ -0,0 +1,132 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.ChangeFeed import LocalChangeFeed
+from Clase.RepositoryMirror import RepositoryMirror, MirrorSnapshot, entry_to_record, R_NAME
+
+class FakeRepository:
+    """Depozit Alfresco simulat: noduri cu modifiedAt și liste de copii"""
+
+    def __init__(self):
+        self.nodes = {
+            "root": {"id": "root", "name": "Company Home", "isFolder": True, "modifiedAt": "t0"},
+            "a": {"id": "a", "name": "A", "isFolder": True, "parentId": "root", "modifiedAt": "t0"},
+            "b": {"id": "b", "name": "B", "isFolder": True, "parentId": "root", "modifiedAt": "t0"},
+            "f1": {"id": "f1", "name": "f1.txt", "isFolder": False, "parentId": "a", "modifiedAt": "t0",
+                   "content": {"sizeInBytes": 10, "mimeType": "text/plain"},
+                   "properties": {"cm:title": "Titlu"}},
+        }
+        self.children = {"root": ["a", "b"], "a": ["f1"], "b": []}
+        self.listed = []
+        self.fetched = []
+
+    async def _fetch_node(self, node_id, params, cache=True):
+        node_id = "root" if node_id == "-root-" else node_id
+        self.fetched.append(node_id)
+        return dict(self.nodes[node_id])
+
+    async def iter_children_pages(self, node_id, cache=True, projection=None):
+        self.listed.append(node_id)
+        yield {"entries": [{"entry": dict(self.nodes[c])} for c in self.children[node_id]]}
+
+@pytest.mark.asyncio
+async def test_initial_sync_serves_pages_and_entries():
+    repo = FakeRepository()
+    mirror = RepositoryMirror(repo)
+    await mirror.sync()
+
+    page = mirror.page("-root-", 0, 1)
+    assert [e["entry"]["name"] for e in page["entries"]] == ["A"]
+    assert page["pagination"]["hasMoreItems"] is True
+    entry = mirror.entry("f1")
+    assert entry["properties"]["cm:title"] == "Titlu"
+    assert entry["path"]["name"] == "/Company Home/A"
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_relists_only_changed_folders():
+    repo = FakeRepository()
+    mirror = RepositoryMirror(repo)
+    await mirror.sync()
+    repo.listed.clear()
+
+    repo.nodes["f2"] = {"id": "f2", "name": "f2.txt", "isFolder": False, "parentId": "b", "modifiedAt": "t1"}
+    repo.children["b"].append("f2")
+    repo.nodes["b"]["modifiedAt"] = "t1"
+    await mirror.sync()
+
+    assert repo.listed == ["b"]
+    assert mirror.children_ids("b") == ["f2"]
+
+    # Fără schimbări nu se mai re-listează nimic
+    repo.listed.clear()
+    await mirror.sync()
+    assert repo.listed == []
+
+@pytest.mark.asyncio
+async def test_change_feed_refresh_relists_only_parents_of_changed_nodes():
+    repo = FakeRepository()
+    feed = LocalChangeFeed()
+    mirror = RepositoryMirror(repo, feed=feed)
+    await mirror.sync()
+    repo.listed.clear()
+    repo.fetched.clear()
+
+    repo.nodes["f2"] = {"id": "f2", "name": "f2.txt", "isFolder": False, "parentId": "b", "modifiedAt": "t1"}
+    repo.children["b"].append("f2")
+    feed.record("f2", parent_id="b", name="f2.txt")
+    await mirror.sync()
+    # Fără nicio cerere modifiedAt per folder: doar părintele nodului schimbat
+    assert repo.fetched == [] and repo.listed == ["b"]
+    assert mirror.children_ids("b") == ["f2"]
+
+    # Ștergerea fără părinte în flux: părintele se ia din oglindă
+    del repo.nodes["a"], repo.children["a"]
+    repo.children["root"].remove("a")
+    feed.record("a", deleted=True)
+    repo.listed.clear()
+    await mirror.sync()
+    assert repo.listed == ["root"]
+    assert mirror.node("f1") is None
+    assert mirror.stats()["delta_syncs"] == 2
+
+@pytest.mark.asyncio
+async def test_stale_or_dirty_mirror_is_not_served():
+    now = [0.0]
+    repo = FakeRepository()
+    mirror = RepositoryMirror(repo, staleness=10, clock=lambda: now[0])
+    await mirror.sync()
+    mirror.mark_dirty("a")
+    assert mirror.page("a", 0, 10) is None
+    assert mirror.page("b", 0, 10) is not None
+    now[0] = 11
+    assert mirror.page("b", 0, 10) is None
+
+@pytest.mark.asyncio
+async def test_snapshot_roundtrip(tmp_path):
+    path = str(tmp_path / "mirror.bin")
+    repo = FakeRepository()
+    mirror = RepositoryMirror(repo, snapshot_path=path)
+    await mirror.sync()
+    assert os.path.exists(path)
+    assert mirror.stats()["overlay_nodes"] == 0
+
+    # Datele se citesc acum din snapshot-ul mapat în memorie
+    assert mirror.entry("f1")["content"]["sizeInBytes"] == 10
+    assert mirror.children_ids("-root-") == ["a", "b"]
+
+    reloaded = RepositoryMirror(FakeRepository(), snapshot_path=path)
+    reloaded._open_snapshot()
+    assert reloaded.root_id == "root"
+    assert reloaded.node("f1")[R_NAME] == "f1.txt"
+    await mirror.stop()
+    reloaded._snapshot.close()
+
+def test_snapshot_find_missing(tmp_path):
+    path = str(tmp_path / "s.bin")
+    root = entry_to_record({"id": "r", "name": "Company Home", "isFolder": True})
+    assert MirrorSnapshot.write(path, root, lambda folder_id: []) == 1
+    snapshot = MirrorSnapshot(path)
+    assert snapshot.find("r") == 0
+    assert snapshot.find("x") is None
+    snapshot.close()
@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.Resilience import CircuitBreaker, CircuitOpenError, HedgePolicy, LatencyTracker, RetryPolicy, endpoint_key
+
+def test_endpoint_key_groups_node_ids():
+    assert endpoint_key("GET", "/api/nodes/abc-123/children") == "GET /api/nodes/{id}/children"
+    assert endpoint_key("PUT", "/api/nodes/xyz") == "PUT /api/nodes/{id}"
+
+def test_retry_delay_uses_capped_full_jitter():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.3, rng=lambda low, high: high)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.1, 0.2, 0.3, 0.3]
+    assert 0.0 <= RetryPolicy(base_delay=0.1).delay(0) <= 0.1
+
+def test_circuit_breaker_opens_probes_and_recovers():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, recovery_time=10, clock=lambda: now[0])
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    now[0] = 11
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # O singură cerere de probă la un moment dat
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 22
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["times_opened"] == 2
+    assert breaker.stats()["rejected"] == 2
+
+def test_latency_tracker_derives_timeout_from_p99():
+    tracker = LatencyTracker(min_samples=10, multiplier=3.0, floor=0.5)
+    assert tracker.timeout("GET x", ceiling=8.0) == 8.0
+
+    for index in range(99):
+        tracker.observe("GET x", 0.1)
+    tracker.observe("GET x", 2.0)
+    assert tracker.percentile("GET x", 50) == 0.1
+    assert tracker.percentile("GET x", 99) == 0.1
+    assert tracker.percentile("GET x", 100) == 2.0
+    assert tracker.timeout("GET x", ceiling=8.0) == 0.5
+
+    for index in range(10):
+        tracker.observe("GET y", 4.0)
+    assert tracker.timeout("GET y", ceiling=8.0) == 8.0
+
+def test_hedge_policy_waits_for_samples_and_respects_budget():
+    latency = LatencyTracker(min_samples=3)
+    policy = HedgePolicy(budget=0.25, min_delay=0.01)
+    assert policy.delay(latency, "GET /x") is None
+    for seconds in (0.001, 0.2, 0.3):
+        latency.observe("GET /x", seconds)
+    assert policy.delay(latency, "GET /x") == 0.3
+
+    policy.requests = 4
+    assert policy.allow() is True
+    assert policy.allow() is False
+    assert policy.stats()["hedges"] == 1 and policy.stats()["denied"] == 1
@@ -0,0 +1,51 @@
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import Clase.SearchIndex as search_module
+from Clase.SearchIndex import SearchIndex
+
+def populate(index):
+    index.add_entries("-root-", [
+        {"entry": {"id": "f1", "name": "Rapoarte", "isFolder": True}},
+        {"entry": {"id": "d1", "name": "buget_2024.xlsx", "isFolder": False, "parentId": "f1",
+                   "properties": {"cm:title": "Raport financiar", "cm:description": "Execuția bugetară anuală"}}},
+        {"entry": {"id": "d2", "name": "contract.pdf", "isFolder": False, "parentId": "f1",
+                   "properties": {"cm:description": "Anexa la raportul de audit"}}},
+    ])
+
+@pytest.fixture(params=[True, False], ids=["fts5", "like"])
+def index(request, monkeypatch):
+    if request.param and not search_module.fts5_available():
+        pytest.skip("SQLite fără FTS5")
+    monkeypatch.setattr(search_module, "fts5_available", lambda: request.param)
+    index = SearchIndex()
+    populate(index)
+    yield index
+    index.close()
+
+def test_ranks_name_matches_first_and_filters_by_type(index):
+    results = index.search("rapo")
+    assert [result["id"] for result in results][0] == "f1"
+    assert {result["id"] for result in results} == {"f1", "d1", "d2"}
+    assert [result["id"] for result in index.search("rapo", node_type="file")][0] == "d1"
+
+def test_all_terms_required_with_any_term_fallback(index):
+    assert [result["id"] for result in index.search("buget 2024")] == ["d1"]
+    assert {result["id"] for result in index.search("contract inexistent")} == {"d2"}
+    assert index.search("   ") == []
+
+def test_listing_without_properties_keeps_title_and_delete_removes_subtree(index):
+    index.add_entries("f1", [{"entry": {"id": "d1", "name": "buget_2024.xlsx", "isFolder": False}}])
+    assert index.search("financiar")[0]["title"] == "Raport financiar"
+
+    index.remove("f1", subtree=True)
+    assert index.search("rapo") == []
+    assert index.stats()["nodes"] == 0
+
+def test_fts_ignores_diacritics():
+    if not search_module.fts5_available():
+        pytest.skip("SQLite fără FTS5")
+    index = SearchIndex()
+    populate(index)
+    assert [result["id"] for result in index.search("executia bugetara")] == ["d1"]
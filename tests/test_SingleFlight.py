@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from Clase.SingleFlight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started = []
+
+    async def call():
+        started.append(1)
+        await asyncio.sleep(0.01)
+        return {"list": {}}
+
+    results = await asyncio.gather(*(flight.do("root", call) for _ in range(5)), flight.do("other", call))
+    assert len(started) == 2
+    assert all(result is results[0] for result in results[:5])
+    assert flight.stats() == {"calls": 2, "coalesced": 4, "coalesced_rate": 0.6667, "in_flight": 0}
+
+    # După terminare cheia nu mai este reținută: un apel nou pleacă din nou
+    await flight.do("root", call)
+    assert len(started) == 3
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_cancelling_one_waiter_keeps_others():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("Alfresco indisponibil")
+
+    first = asyncio.create_task(flight.do("k", failing))
+    second = asyncio.create_task(flight.do("k", failing))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    with pytest.raises(RuntimeError):
+        await second
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert flight.in_flight() == 0